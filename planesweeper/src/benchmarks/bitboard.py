@@ -0,0 +1,83 @@
+import random
+import time
+import timeit
+from entities.board_cells import BoardCells, EMPTY
+from entities.bitboard_cells import BitboardCells
+from benchmarks.boards import get_level_boards
+
+
+def _create(cells_type: type, width: int, height: int,
+            plane_indexes: list[int]) -> BoardCells:
+    cells = cells_type(width, height)
+    cells.place_planes(plane_indexes)
+
+    return cells
+
+def _find_largest_area(width: int, height: int, plane_indexes: list[int]) -> int:
+    # open every empty area once and pick the piece revealing the most pieces
+    cells = _create(BoardCells, width, height, plane_indexes)
+    largest = (0, 0)
+
+    for index in range(len(cells)):
+        if cells.types[index] == EMPTY and not cells.is_open(index):
+            largest = max(largest, (len(cells.reveal(index)), index))
+
+    return largest[1]
+
+def _measure(cells_type: type, width: int, height: int,
+             plane_indexes: list[int], start: int) -> tuple[float, float, float]:
+    repeats = max(1, 20_000 // (width * height))
+
+    create_time = min(timeit.Timer(
+        lambda: _create(cells_type, width, height, plane_indexes)).repeat(3, repeats)) / repeats
+
+    reveal_times = []
+
+    for _ in range(3):
+        boards = [_create(cells_type, width, height, plane_indexes) for _ in range(repeats)]
+
+        started = time.perf_counter()
+
+        for cells in boards:
+            cells.reveal(start)
+
+        reveal_times.append((time.perf_counter() - started) / repeats)
+
+    win_time = min(timeit.Timer(boards[0].is_cleared).repeat(3, 10_000)) / 10_000
+
+    return (create_time, min(reveal_times), win_time)
+
+def run_benchmark() -> list[tuple[str, tuple[float, float, float], tuple[float, float, float]]]:
+    """Measures plane placement, reveal of the largest empty area and win check
+        for each level and a 200x200 board at 1 % plane density with byte array and
+        bitboard cell storages.
+
+    Returns:
+        list[tuple[str, tuple[float, float, float], tuple[float, float, float]]]: Board
+            name and creation, reveal and win check times in seconds for byte array and
+            bitboard storages.
+    """
+    boards = get_level_boards()
+    boards.append(("custom (200x200)", 200, 200, 400))
+
+    results = []
+
+    for name, width, height, planes in boards:
+        plane_indexes = random.sample(range(width * height), planes)
+        start = _find_largest_area(width, height, plane_indexes)
+
+        results.append((name,
+                        _measure(BoardCells, width, height, plane_indexes, start),
+                        _measure(BitboardCells, width, height, plane_indexes, start)))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<20}{'operation':<11}{'byte arrays (us)':>18}{'bitboard (us)':>16}"
+          f"{'speed-up':>10}")
+
+    for board_name, byte_times, bitboard_times in run_benchmark():
+        for operation, byte_time, bitboard_time in zip(("create", "reveal", "win check"),
+                                                       byte_times, bitboard_times):
+            print(f"{board_name:<20}{operation:<11}{byte_time * 1e6:>18.1f}"
+                  f"{bitboard_time * 1e6:>16.1f}{byte_time / bitboard_time:>9.1f}x")
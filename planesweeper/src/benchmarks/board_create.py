@@ -0,0 +1,55 @@
+import random
+import timeit
+from benchmarks.boards import get_level_boards, LEVEL6_DENSITY
+from entities.board_cells import BoardCells, is_numpy_available
+
+
+def _create_cells(width: int, height: int, planes: int) -> tuple[BoardCells, list[int]]:
+    cells = BoardCells(width, height)
+    plane_indexes = random.sample(range(0, width * height), planes)
+
+    return (cells, plane_indexes)
+
+def _measure(cells: BoardCells, plane_indexes: list[int], batched: bool) -> float:
+    repeats = max(1, 100_000 // len(cells))
+
+    timer = timeit.Timer(lambda: cells.place_planes(plane_indexes, batched))
+
+    return min(timer.repeat(3, repeats)) / repeats
+
+def run_benchmark() -> list[tuple[str, float, float]]:
+    """Measures neighbour count calculation of board creation for each level and
+        for a 1000x1000 custom board, both cell by cell and batched.
+
+    Returns:
+        list[tuple[str, float, float]]: Board name, per cell time and batched time
+            in seconds (batched time is None if NumPy is not installed).
+    """
+    boards = get_level_boards()
+
+    # custom board with level 6 plane density
+    boards.append(("custom (1000x1000)", 1000, 1000, int(1000 * 1000 * LEVEL6_DENSITY)))
+
+    results = []
+
+    for name, width, height, planes in boards:
+        cells, plane_indexes = _create_cells(width, height, planes)
+
+        per_cell = _measure(cells, plane_indexes, False)
+        batched = _measure(cells, plane_indexes, True)\
+            if is_numpy_available() else None
+
+        results.append((name, per_cell, batched))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<22}{'per cell (ms)':>16}{'batched (ms)':>16}{'speed-up':>10}")
+
+    for board_name, per_cell_time, batched_time in run_benchmark():
+        if batched_time is None:
+            print(f"{board_name:<22}{per_cell_time * 1000:>16.3f}{'n/a':>16}{'n/a':>10}")
+            continue
+
+        print(f"{board_name:<22}{per_cell_time * 1000:>16.3f}{batched_time * 1000:>16.3f}"
+              f"{per_cell_time / batched_time:>9.1f}x")
@@ -0,0 +1,171 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration
+from benchmarks.boards import LEVEL6_DENSITY
+
+
+RESULTS_VERSION = 1
+# operation slower than the baseline by more than this share is reported as regression
+DEFAULT_THRESHOLD = 0.25
+# each operation is repeated until it has taken about this long, best of REPEATS is kept
+MEASURE_SECONDS = 0.05
+REPEATS = 5
+CUSTOM_SIZES = [(256, 256), (1000, 1000)]
+
+
+def _create_game(level: int, width: int, height: int) -> Gameboard:
+    if level == GameboardConfiguration.CUSTOM_LEVEL:
+        return Gameboard(level, size=Size(width, height),
+                         planes=int(width * height * LEVEL6_DENSITY))
+
+    return Gameboard(level)
+
+def _get_boards() -> list[tuple[str, int, int, int]]:
+    boards = []
+
+    for level in GameboardConfiguration.LEVELS:
+        size = GameboardConfiguration(level).size
+        boards.append((f"level {level} ({size.width}x{size.height})",
+                       level, size.width, size.height))
+
+    for width, height in CUSTOM_SIZES:
+        boards.append((f"custom ({width}x{height})",
+                       GameboardConfiguration.CUSTOM_LEVEL, width, height))
+
+    return boards
+
+def _best_time(operation, setup=None) -> float:
+    # without setup, calls are batched to make short operations measurable, with setup
+    # every call gets its own fresh state
+    if setup is not None:
+        return min(timeit.repeat(operation, setup, number=1, repeat=REPEATS))
+
+    timer = timeit.Timer(operation)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * MEASURE_SECONDS / max(elapsed, 1e-9)))
+
+    return min(timer.repeat(REPEATS, number)) / number
+
+def _measure_open_empty_area(game: Gameboard) -> float:
+    # planes packed on the first rows, so opening the last piece reveals the rest
+    cells = game.get_cells()
+    last = Position(cells.width - 1, cells.height - 1)
+
+    def setup():
+        game.create()
+        game.get_cells().place_planes(list(range(game.get_total_planes())))
+
+    return _best_time(lambda: game.open_piece(last), setup)
+
+def _measure_board(level: int, width: int, height: int) -> dict[str, float]:
+    game = _create_game(level, width, height)
+    results = {"create": _best_time(game.create)}
+
+    results["open_piece (empty area)"] = _measure_open_empty_area(game)
+
+    game.create(deferred=True)
+    game.open_piece(Position(0, 0))
+    cells = game.get_cells()
+    closed = next(index for index in range(len(cells)) if not cells.opened[index])
+    closed = Position(closed % width, closed // width)
+
+    # mark and unmark in turns, board staying the same
+    results["mark_piece"] = _best_time(lambda: game.mark_piece(closed))
+    results["get_radar_contacts"] = _best_time(game.get_radar_contacts)
+
+    results["get_rendering_items"] = _best_time(game.get_rendering_items)
+    # piece views are created on the first call after the board is created
+    results["get_rendering_items (new board)"] = _best_time(game.get_rendering_items,
+                                                            game.create)
+
+    size = game.get_dimensions()
+    rnd = random.Random(0)
+    event_positions = [Position(rnd.randrange(-10, size.width + 10),
+                                rnd.randrange(-10, size.height + 10)) for _ in range(1000)]
+
+    results["translate_event_position (per event)"] = _best_time(
+        lambda: [game.translate_event_position_to_piece_position(position)
+                 for position in event_positions]) / len(event_positions)
+
+    return results
+
+def run_benchmark() -> dict[str, dict[str, float]]:
+    """Measures gameboard operations on the hot paths of play and rendering for each
+        level and for large custom boards having level 6 plane density.
+
+    Returns:
+        dict[str, dict[str, float]]: Best time in seconds by board name and operation
+    """
+    return {name: _measure_board(level, width, height)
+            for name, level, width, height in _get_boards()}
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, str, float, bool]]:
+    """Compare measured times with times saved earlier.
+
+    Args:
+        results (dict[str, dict[str, float]]): Times by board name and operation.
+        baseline (dict[str, dict[str, float]]): Earlier times in the same format.
+        threshold (float, optional): Share by which an operation may be slower before
+            it is a regression. Defaults to DEFAULT_THRESHOLD.
+
+    Returns:
+        list[tuple[str, str, float, bool]]: For each operation found in both, board name,
+            operation, ratio of measured time to baseline time and is it a regression
+    """
+    comparison = []
+
+    for name, operations in results.items():
+        for operation, seconds in operations.items():
+            baseline_seconds = baseline.get(name, {}).get(operation)
+
+            if baseline_seconds:
+                ratio = seconds / baseline_seconds
+                comparison.append((name, operation, ratio, ratio > 1 + threshold))
+
+    return comparison
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure gameboard operations.")
+    parser.add_argument("--output", default="board_operations.json",
+                        help="JSON file to write the results to")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON file written earlier to compare the results with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    options = _parse_arguments()
+    measured = run_benchmark()
+
+    with open(options.output, "w", encoding="utf-8") as output_file:
+        json.dump({"version": RESULTS_VERSION, "python": platform.python_version(),
+                   "results": measured}, output_file, indent=2)
+
+    if options.baseline is None:
+        print(f"{'board':<22}{'operation':<38}{'time (us)':>12}")
+
+        for board_name, times in measured.items():
+            for operation_name, best in times.items():
+                print(f"{board_name:<22}{operation_name:<38}{best * 1e6:>12.2f}")
+
+        sys.exit(0)
+
+    with open(options.baseline, encoding="utf-8") as baseline_file:
+        saved = json.load(baseline_file)["results"]
+
+    compared = compare(measured, saved, options.threshold)
+    print(f"{'board':<22}{'operation':<38}{'vs baseline':>12}")
+
+    for board_name, operation_name, time_ratio, regressed in compared:
+        print(f"{board_name:<22}{operation_name:<38}{time_ratio:>11.2f}x"
+              f"{'  REGRESSION' if regressed else ''}")
+
+    sys.exit(1 if any(regressed for _, _, _, regressed in compared) else 0)
@@ -0,0 +1,95 @@
+import random
+import timeit
+import tracemalloc
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration
+from entities.board_piece import BoardPiece
+from benchmarks.boards import LEVEL6_DENSITY
+
+
+REPEATS = 5
+
+
+def _create_played_game(level: int, size: Size = None) -> Gameboard:
+    # board with opened, marked and closed pieces of every type
+    if level == GameboardConfiguration.CUSTOM_LEVEL:
+        game = Gameboard(level, size=size, planes=int(size.width * size.height * LEVEL6_DENSITY))
+    else:
+        game = Gameboard(level)
+
+    game.create(deferred=True, safe_area=True, seed=2022)
+    cells = game.get_cells()
+    game.open_piece(Position(cells.width // 2, cells.height // 2))
+
+    rnd = random.Random(0)
+
+    for index in rnd.sample(range(len(cells)), len(cells) // 10):
+        if cells.types[index] == 1:
+            game.mark_piece(Position(index % cells.width, index // cells.width))
+        else:
+            game.open_piece(Position(index % cells.width, index // cells.width))
+
+    return game
+
+def _measure_memory(game: Gameboard) -> float:
+    game.create()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pieces = game.get_rendering_items()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    return used / len(pieces)
+
+def _measure_frame(pieces: list) -> tuple[float, float]:
+    def get_assets():
+        for piece in pieces:
+            piece.get_asset()
+
+    def read_pieces():
+        # what the renderer reads of every object in a frame
+        for piece in pieces:
+            piece.get_background_size()
+            piece.get_asset()
+            piece.get_text()
+            piece.get_line()
+            piece.get_position()
+
+    number = max(1, 100_000 // len(pieces))
+    assets = min(timeit.repeat(get_assets, number=number, repeat=REPEATS)) / number
+    frame = min(timeit.repeat(read_pieces, number=number, repeat=REPEATS)) / number
+
+    return (assets / len(pieces), frame / len(pieces))
+
+def run_benchmark() -> list[tuple[str, float, float, float]]:
+    """Measures memory used by gameboard's piece objects and the time taken to read the
+        asset and the rest of what the renderer reads of each piece in every frame.
+
+    Returns:
+        list[tuple[str, float, float, float]]: Board name, bytes per piece and time per
+            piece in seconds for asset lookup and for the renderer's reads
+    """
+    results = []
+
+    for level, size in [(4, None), (6, None),
+                        (GameboardConfiguration.CUSTOM_LEVEL, Size(256, 256))]:
+        game = _create_played_game(level, size)
+        pieces = [item for item in game.get_rendering_items()
+                  if isinstance(item, BoardPiece)]
+        asset_time, frame_time = _measure_frame(pieces)
+        cells = game.get_cells()
+
+        results.append((f"{'custom' if size else f'level {level}'} "
+                        f"({cells.width}x{cells.height})",
+                        _measure_memory(game), asset_time, frame_time))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<22}{'bytes/piece':>12}{'get_asset (ns)':>16}{'frame reads (ns)':>18}")
+
+    for board_name, piece_bytes, asset_seconds, frame_seconds in run_benchmark():
+        print(f"{board_name:<22}{piece_bytes:>12.0f}{asset_seconds * 1e9:>16.0f}"
+              f"{frame_seconds * 1e9:>18.0f}")
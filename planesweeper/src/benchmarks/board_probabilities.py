@@ -0,0 +1,101 @@
+import random
+import time
+from primitives.position import Position
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.board_cells import PLANE
+from entities.board_solver import BoardSolver
+from entities.board_probabilities import PlaneProbabilities
+
+
+GAMES_PER_LEVEL = 5
+STAGES = ("opening", "midgame", "endgame")
+
+
+def _get_stage(game: Gameboard) -> str:
+    # stage by share of pieces without a plane opened
+    safe_pieces = game.get_pieces_on_board() - game.get_total_planes()
+
+    return STAGES[min(2, 3 * game.get_cells().counts.opened // safe_pieces)]
+
+def _measure_guess(game: Gameboard, probabilities: PlaneProbabilities, rnd: random.Random,
+                   times: dict[str, list[float]], exact: dict[str, int]):
+    stage = _get_stage(game)
+
+    started = time.perf_counter()
+    PlaneProbabilities(game).get_probabilities()
+    times[f"{stage} full"].append(time.perf_counter() - started)
+
+    probabilities.get_probabilities()
+    exact[stage] += probabilities.is_exact()
+
+    # guess without losing the game
+    cells = game.get_cells()
+    closed_safe = [index for index in range(len(cells))
+                   if not cells.opened[index] and cells.types[index] != PLANE]
+    index = rnd.choice(closed_safe)
+    game.open_piece(Position(index % cells.width, index // cells.width))
+
+    started = time.perf_counter()
+    probabilities.get_probabilities()
+    times[f"{stage} update"].append(time.perf_counter() - started)
+
+def _play_game(level: int, rnd: random.Random, times: dict[str, list[float]],
+               exact: dict[str, int]):
+    # game is played by the solver, and whenever it has to guess, probabilities are
+    # calculated for the position from scratch and again after the guess
+    game = Gameboard(level)
+    game.create(deferred=True, safe_area=True, seed=rnd.getrandbits(64))
+    size = GameboardConfiguration(level).size
+    game.open_piece(Position(size.width // 2, size.height // 2))
+
+    solver = BoardSolver(game)
+    probabilities = PlaneProbabilities(game)
+
+    while game.get_current_board_state() == BoardState.RUNNING:
+        deduction = solver.step()
+
+        for index in deduction.planes:
+            game.mark_piece(solver.get_position(index))
+
+        for index in deduction.safe:
+            game.open_piece(solver.get_position(index))
+
+        if deduction.is_empty():
+            _measure_guess(game, probabilities, rnd, times, exact)
+
+def run_benchmark() -> list[tuple[str, dict[str, tuple[int, float, float]], dict[str, int]]]:
+    """Measures plane probability calculation on positions where a solver playing random
+        games of each level has to guess. Each position is calculated from scratch, and
+        again incrementally after the guess has opened one more piece.
+
+    Returns:
+        list[tuple[str, dict[str, tuple[int, float, float]], dict[str, int]]]: Level name,
+            for each game stage and calculation number of positions, mean and maximum time
+            in seconds, and for each game stage number of exact calculations.
+    """
+    rnd = random.Random(2022)
+    results = []
+
+    for level in GameboardConfiguration.LEVELS:
+        times = {f"{stage} {kind}": [] for stage in STAGES for kind in ("full", "update")}
+        exact = {stage: 0 for stage in STAGES}
+
+        for _ in range(GAMES_PER_LEVEL):
+            _play_game(level, rnd, times, exact)
+
+        summary = {name: (len(step_times), sum(step_times) / max(1, len(step_times)),
+                          max(step_times, default=0))
+                   for name, step_times in times.items()}
+        results.append((f"level {level}", summary, exact))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'level':<10}{'calculation':<18}{'positions':>10}{'mean (ms)':>11}{'max (ms)':>10}"
+          f"{'exact':>7}")
+
+    for level_name, calculations, exact_counts in run_benchmark():
+        for name, (positions, mean_time, max_time) in calculations.items():
+            exact_count = exact_counts[name.split()[0]] if name.endswith("full") else ""
+            print(f"{level_name:<10}{name:<18}{positions:>10}{mean_time * 1e3:>11.2f}"
+                  f"{max_time * 1e3:>10.2f}{exact_count:>7}")
@@ -0,0 +1,80 @@
+import time
+import tracemalloc
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration
+from benchmarks.boards import get_level_boards, LEVEL6_DENSITY
+
+
+def _create_board(width: int, height: int, planes: int) -> Gameboard:
+    # predefined levels are created as such, everything else as custom board
+    for level, ((level_width, level_height), level_planes) in\
+            GameboardConfiguration.LEVELS.items():
+        if (level_width, level_height, level_planes) == (width, height, planes):
+            return Gameboard(level)
+
+    return Gameboard(GameboardConfiguration.CUSTOM_LEVEL,
+                     size=Size(width, height), planes=planes)
+
+def _measure(width: int, height: int, planes: int) -> tuple[float, float, float, int]:
+    start = time.perf_counter()
+    board = _create_board(width, height, planes)
+    board.create(deferred=True, safe_area=True)
+    created = time.perf_counter()
+
+    board.open_piece(Position(width // 2, height // 2))
+    opened = time.perf_counter()
+
+    board.mark_piece(Position(0, 0))
+    board.get_radar_contacts()
+    board.get_current_board_state()
+    checked = time.perf_counter()
+
+    return (created - start, opened - created, checked - opened, board.get_cells().counts.opened)
+
+def _measure_memory(width: int, height: int, planes: int) -> int:
+    # measured separately as tracing slows down the timed operations
+    tracemalloc.start()
+
+    board = _create_board(width, height, planes)
+    board.create()
+    board.mark_piece(Position(0, 0))
+
+    memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return memory
+
+def run_benchmark() -> list[tuple[str, float, float, float, int, int]]:
+    """Measures board creation, first open (including deferred plane placement and
+        reveal of the opened area) and mark with win check for each level and for custom
+        boards up to 2000x2000 at 1 % and level 6 plane densities. Peak memory use is
+        measured for creating a board with planes placed and marking one piece.
+
+    Returns:
+        list[tuple[str, float, float, float, int, int]]: Board name, creation, first
+            open and mark times in seconds, number of cells opened by the first open and
+            peak memory use in bytes.
+    """
+    boards = get_level_boards()
+
+    for side in (200, 500, 1000, 2000):
+        for name, density in (("1 %", 0.01), ("level 6", LEVEL6_DENSITY)):
+            boards.append((f"{side}x{side} {name}", side, side, int(side * side * density)))
+
+    results = []
+
+    for name, width, height, planes in boards:
+        results.append((name, *_measure(width, height, planes),
+                        _measure_memory(width, height, planes)))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<24}{'create (ms)':>13}{'open (ms)':>13}{'mark (ms)':>11}"
+          f"{'opened':>10}{'peak memory (kB)':>18}")
+
+    for board_name, create_time, open_time, mark_time, opened_cells, peak_memory\
+            in run_benchmark():
+        print(f"{board_name:<24}{create_time * 1000:>13.2f}{open_time * 1000:>13.2f}"
+              f"{mark_time * 1000:>11.3f}{opened_cells:>10}{peak_memory / 1024:>18.0f}")
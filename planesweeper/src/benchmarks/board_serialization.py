@@ -0,0 +1,62 @@
+import pickle
+import timeit
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration
+from benchmarks.boards import get_level_boards, LEVEL6_DENSITY
+
+
+def _create_played_board(level: int, width: int, height: int, planes: int) -> Gameboard:
+    if level == GameboardConfiguration.CUSTOM_LEVEL:
+        game = Gameboard(level, size=Size(width, height), planes=planes)
+    else:
+        game = Gameboard(level)
+
+    game.create(deferred=True, safe_area=True)
+    game.open_piece(Position(width // 2, height // 2))
+    game.mark_piece(Position(0, 0))
+
+    return game
+
+def _measure(function, repeats: int) -> float:
+    return min(timeit.Timer(function).repeat(3, repeats)) / repeats
+
+def run_benchmark() -> list[tuple[str, int, int, float, float, float, float]]:
+    """Measures encoded size and encoding and decoding times of a played board in the
+        binary board format and with pickle, for each level and a 500x500 custom board.
+
+    Returns:
+        list[tuple[str, int, int, float, float, float, float]]: Board name, binary and
+            pickled sizes in bytes, binary encoding and decoding times and pickle dump
+            and load times in seconds.
+    """
+    boards = [(level + 1, *board) for level, board in enumerate(get_level_boards())]
+    boards.append((GameboardConfiguration.CUSTOM_LEVEL, "custom (500x500)", 500, 500,
+                   int(500 * 500 * LEVEL6_DENSITY)))
+
+    results = []
+
+    for level, name, width, height, planes in boards:
+        game = _create_played_board(level, width, height, planes)
+        repeats = max(1, 50_000 // (width * height))
+
+        encoded = game.serialize()
+        pickled = pickle.dumps(game, pickle.HIGHEST_PROTOCOL)
+
+        results.append((name, len(encoded), len(pickled),
+                        _measure(game.serialize, repeats),
+                        _measure(lambda data=encoded: Gameboard.deserialize(data), repeats),
+                        _measure(lambda board=game: pickle.dumps(board, pickle.HIGHEST_PROTOCOL),
+                                 repeats),
+                        _measure(lambda data=pickled: pickle.loads(data), repeats)))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<20}{'size (B)':>10}{'pickle (B)':>12}{'encode (us)':>13}"
+          f"{'decode (us)':>13}{'dump (us)':>11}{'load (us)':>11}")
+
+    for board_name, size, pickle_size, encode_time, decode_time, dump_time, load_time\
+            in run_benchmark():
+        print(f"{board_name:<20}{size:>10}{pickle_size:>12}{encode_time * 1e6:>13.1f}"
+              f"{decode_time * 1e6:>13.1f}{dump_time * 1e6:>11.1f}{load_time * 1e6:>11.1f}")
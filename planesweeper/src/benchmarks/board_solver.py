@@ -0,0 +1,119 @@
+import random
+import time
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.board_cells import PLANE
+from entities.board_solver import BoardSolver, SolverRule
+from benchmarks.boards import get_level_boards, LEVEL6_DENSITY
+
+
+POSITIONS_PER_LEVEL = 500
+CUSTOM_POSITIONS = 50
+
+
+def _open_random_safe_piece(game: Gameboard, solver: BoardSolver, rnd: random.Random):
+    # positions are played forward by opening pieces known to be safe from the board
+    cells = game.get_cells()
+
+    while True:
+        index = rnd.randrange(len(cells))
+
+        if not cells.opened[index] and cells.types[index] != PLANE:
+            game.open_piece(solver.get_position(index))
+            return
+
+def _create_position(level: int, width: int, height: int, planes: int,
+                     rnd: random.Random) -> Gameboard:
+    if level == GameboardConfiguration.CUSTOM_LEVEL:
+        game = Gameboard(level, size=Size(width, height), planes=planes)
+    else:
+        game = Gameboard(level)
+
+    # a board opening up completely is created again, position must be left mid-game
+    while True:
+        game.create(deferred=True, seed=rnd.getrandbits(64))
+        solver = BoardSolver(game)
+
+        for _ in range(rnd.randrange(1, max(2, planes // 4))):
+            _open_random_safe_piece(game, solver, rnd)
+
+            if game.get_current_board_state() != BoardState.RUNNING:
+                break
+
+        # one more piece is opened when measuring
+        if game.get_current_board_state() == BoardState.RUNNING and\
+                game.get_cells().counts.closed_safe > 1:
+            return game
+
+def _measure_position(game: Gameboard, rnd: random.Random, times: dict[str, list[float]],
+                      found: dict[str, int]):
+    solver = BoardSolver(game)
+
+    started = time.perf_counter()
+    solver.step(SolverRule.SINGLE)
+    times["initial read"].append(time.perf_counter() - started)
+
+    # open one more piece, so that the next steps only have a small change to read
+    safe = solver.get_safe_cells()
+
+    if safe:
+        game.open_piece(solver.get_position(rnd.choice(safe)))
+    else:
+        _open_random_safe_piece(game, solver, rnd)
+
+    for name, rule in (("single", SolverRule.SINGLE), ("pair", SolverRule.PAIR),
+                       ("enumeration", SolverRule.ENUMERATION)):
+        started = time.perf_counter()
+        deduction = solver.step(rule)
+        times[name].append(time.perf_counter() - started)
+
+        if deduction.rule == rule:
+            found[name] += 1
+
+def run_benchmark() -> list[tuple[str, int, dict[str, tuple[float, float, int]]]]:
+    """Measures solver steps on random mid-game positions of each level and a 200x200
+        custom board at level 6 density. For each position the solver first reads the
+        whole board and applies single rules, then one more piece is opened and the
+        following steps are measured trying single, pair and enumeration rules in turn.
+
+    Returns:
+        list[tuple[str, int, dict[str, tuple[float, float, int]]]]: Board name, number
+            of positions and for each measured step mean and 95th percentile time in
+            seconds and number of positions where the rule deduced something.
+    """
+    rnd = random.Random(2022)
+    boards = [(level + 1, *board, POSITIONS_PER_LEVEL)
+              for level, board in enumerate(get_level_boards())]
+    boards.append((GameboardConfiguration.CUSTOM_LEVEL, "custom (200x200)", 200, 200,
+                   int(200 * 200 * LEVEL6_DENSITY), CUSTOM_POSITIONS))
+
+    results = []
+
+    for level, name, width, height, planes, positions in boards:
+        times = {step: [] for step in ("initial read", "single", "pair", "enumeration")}
+        found = {step: 0 for step in times}
+
+        for _ in range(positions):
+            game = _create_position(level, width, height, planes, rnd)
+            _measure_position(game, rnd, times, found)
+
+        summary = {}
+
+        for step, step_times in times.items():
+            step_times.sort()
+            summary[step] = (sum(step_times) / len(step_times),
+                             step_times[int(len(step_times) * 0.95)], found[step])
+
+        results.append((name, positions, summary))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<20}{'positions':>10}  {'step':<14}{'mean (ms)':>10}{'p95 (ms)':>10}"
+          f"{'deduced':>9}")
+
+    for board_name, position_count, steps in run_benchmark():
+        for step_name, (mean_time, p95_time, deduced) in steps.items():
+            print(f"{board_name:<20}{position_count:>10}  {step_name:<14}{mean_time * 1e3:>10.2f}"
+                  f"{p95_time * 1e3:>10.2f}"
+                  f"{'' if step_name == 'initial read' else deduced:>9}")
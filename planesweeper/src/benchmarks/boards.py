@@ -0,0 +1,24 @@
+from entities.board import GameboardConfiguration
+
+
+# planes per piece on the hardest predefined level, used for large custom boards
+LEVEL6_DENSITY = GameboardConfiguration.LEVELS[6][1] /\
+    (GameboardConfiguration.LEVELS[6][0][0] * GameboardConfiguration.LEVELS[6][0][1])
+
+
+def get_level_boards() -> list[tuple[str, int, int, int]]:
+    """Get boards of all predefined levels for benchmarking.
+
+    Returns:
+        list[tuple[str, int, int, int]]: Board name, width, height and number of planes
+    """
+    boards = []
+
+    for level in GameboardConfiguration.LEVELS:
+        configuration = GameboardConfiguration(level)
+        size = configuration.size
+
+        boards.append((f"level {level} ({size.width}x{size.height})",
+                       size.width, size.height, configuration.planes))
+
+    return boards
@@ -0,0 +1,70 @@
+import statistics
+import time
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration
+from benchmarks.boards import LEVEL6_DENSITY
+
+
+# first open of the largest custom board must stay below this
+OPEN_BOUND_SECONDS = 1.0
+REPEATS = 3
+
+BOARDS = [
+    ("2000x2000 10k planes", 10_000),
+    ("2000x2000 1 %", 40_000),
+    ("2000x2000 5 %", 200_000),
+    ("2000x2000 level 6", int(2000 * 2000 * LEVEL6_DENSITY)),
+]
+
+
+def _create_board(planes: int) -> Gameboard:
+    return Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(2000, 2000),
+                     planes=planes)
+
+def _measure(planes: int, seed: int) -> tuple[float, float, int]:
+    board = _create_board(planes)
+    board.create(deferred=True, safe_area=True, seed=seed)
+
+    start = time.perf_counter()
+    board.open_piece(Position(1000, 1000))
+    opened = time.perf_counter()
+
+    # 3BV of a board not played yet, so that its empty areas are labelled for it
+    counted_board = _create_board(planes)
+    counted_board.create(seed=seed)
+
+    start_count = time.perf_counter()
+    counted_board.get_cells().get_3bv()
+    counted = time.perf_counter()
+
+    return (opened - start, counted - start_count, board.get_cells().counts.opened)
+
+def run_benchmark() -> list[tuple[str, float, float, int]]:
+    """Measures first open (including deferred plane placement, labelling of empty
+        areas and reveal of the opened area) and 3BV calculation of an unplayed board
+        on 2000x2000 custom boards, the largest allowed, at increasing plane densities.
+        Median of a few boards is taken for each density.
+
+    Returns:
+        list[tuple[str, float, float, int]]: Board name, first open and 3BV times in
+            seconds and number of cells opened by the first open.
+    """
+    results = []
+
+    for name, planes in BOARDS:
+        measured = sorted(_measure(planes, seed) for seed in range(REPEATS))
+        median = measured[len(measured) // 2]
+
+        results.append((name, median[0],
+                        statistics.median(times[1] for times in measured), median[2]))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"{'board':<24}{'first open (ms)':>17}{'3BV (ms)':>10}{'opened':>10}"
+          f"{f'< {OPEN_BOUND_SECONDS:.0f} s':>8}")
+
+    for board_name, open_time, bv_time, opened_cells in run_benchmark():
+        print(f"{board_name:<24}{open_time * 1000:>17.1f}{bv_time * 1000:>10.2f}"
+              f"{opened_cells:>10}{'ok' if open_time < OPEN_BOUND_SECONDS else 'over':>8}")
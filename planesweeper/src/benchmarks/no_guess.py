@@ -0,0 +1,65 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from primitives.position import Position
+from entities.board import Gameboard, GameboardConfiguration
+from entities.board_solver import is_solvable_without_guessing
+
+
+MEASURE_SECONDS = 3.0
+
+
+def _check_boards(level: int, seconds: float) -> tuple[int, int]:
+    # candidate boards as NoGuessService checks them, first open in the middle
+    configuration = GameboardConfiguration(level)
+    position = Position(configuration.size.width // 2, configuration.size.height // 2)
+    deadline = time.perf_counter() + seconds
+    boards = 0
+    solvable = 0
+
+    while time.perf_counter() < deadline:
+        game = Gameboard(level)
+        game.create(deferred=True, safe_area=True, seed=random.getrandbits(64))
+        game.open_piece(position)
+
+        boards += 1
+        solvable += is_solvable_without_guessing(game)
+
+    return (boards, solvable)
+
+def run_benchmark() -> list[tuple[str, float, float, float]]:
+    """Measures how many candidate boards of each level are generated and checked for
+        being solvable without guessing per second, on one core and with one worker
+        process per core.
+
+    Returns:
+        list[tuple[str, float, float, float]]: Level name, boards per second on one core,
+            boards per second per core with all cores and share of solvable boards.
+    """
+    cores = os.cpu_count() or 1
+    results = []
+
+    with ProcessPoolExecutor(cores) as executor:
+        for level in GameboardConfiguration.LEVELS:
+            boards, solvable = _check_boards(level, MEASURE_SECONDS)
+
+            pooled = list(executor.map(_check_boards, [level] * cores,
+                                       [MEASURE_SECONDS] * cores))
+            pooled_boards = sum(count for count, _ in pooled)
+
+            results.append((f"level {level}", boards / MEASURE_SECONDS,
+                            pooled_boards / MEASURE_SECONDS / cores,
+                            (solvable + sum(found for _, found in pooled)) /
+                            (boards + pooled_boards)))
+
+    return results
+
+if __name__ == "__main__":
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'level':<10}{'boards/s (1 core)':>19}{'boards/s per core (all)':>25}"
+          f"{'solvable':>10}")
+
+    for level_name, single_rate, pooled_rate, solvable_share in run_benchmark():
+        print(f"{level_name:<10}{single_rate:>19.0f}{pooled_rate:>25.0f}"
+              f"{solvable_share * 100:>9.2f}%")
@@ -0,0 +1,142 @@
+import os
+import timeit
+import pygame
+from primitives.position import Position
+from primitives.color import Color
+from primitives.text_object import TextObject
+from entities.board import Gameboard
+from entities.board_piece import BoardPiece
+from entities.ui.board_layer import BoardLayer
+from entities.ui.world_background import WorldBackground
+from pg.pygame_renderer import PygameRenderer
+from pg.sprite_atlas import SpriteAtlas
+
+
+REPEATS = 5
+
+
+def _get_tile_assets() -> list:
+    return [asset for piece_size in BoardPiece.PIXEL_SIZES
+            for asset in BoardPiece.get_asset_table(piece_size) if asset is not None]
+
+def _measure_startup() -> tuple[float, float]:
+    assets = _get_tile_assets()
+
+    def load_tiles():
+        for asset in assets:
+            pygame.image.load(asset.path)
+
+    def build_atlases():
+        for piece_size in BoardPiece.PIXEL_SIZES:
+            SpriteAtlas(BoardPiece.get_asset_table(piece_size))
+
+    return (min(timeit.repeat(load_tiles, number=1, repeat=REPEATS)),
+            min(timeit.repeat(build_atlases, number=1, repeat=REPEATS)))
+
+def _create_played_game() -> Gameboard:
+    game = Gameboard(6)
+    game.create(deferred=True, safe_area=True, seed=2022)
+    game.open_piece(Position(29, 14))
+
+    for x_pos in range(0, 58, 3):
+        game.mark_piece(Position(x_pos, 0))
+
+    return game
+
+def _measure_blits(screen: pygame.Surface, game: Gameboard) -> tuple[float, float]:
+    # every piece of the board from loaded images as before, and from the atlases
+    tiles = [(piece.get_asset(), (piece.get_position().x, piece.get_position().y))
+             for piece in game.get_rendering_items() if isinstance(piece, BoardPiece)]
+    tiles = [(asset, position) for asset, position in tiles if asset is not None]
+
+    images = {asset.key: pygame.image.load(asset.path) for asset, _ in tiles}
+    loaded = [(images[asset.key], position) for asset, position in tiles]
+
+    sprites = {}
+
+    for piece_size in BoardPiece.PIXEL_SIZES:
+        sprites.update(SpriteAtlas(BoardPiece.get_asset_table(piece_size)).get_sprites())
+
+    from_atlas = [(sprites[asset.key], position) for asset, position in tiles]
+
+    def blit_loaded():
+        for image, position in loaded:
+            screen.blit(image, position)
+
+    def blit_atlas():
+        for (surface, area), position in from_atlas:
+            screen.blit(surface, position, area)
+
+    number = 20
+
+    return (min(timeit.repeat(blit_loaded, number=number, repeat=REPEATS)) / number / len(tiles),
+            min(timeit.repeat(blit_atlas, number=number, repeat=REPEATS)) / number / len(tiles))
+
+def _measure_redraw(renderer: PygameRenderer, game: Gameboard) -> float:
+    background = WorldBackground(renderer)
+    background.position_board_on_world(game)
+    layer = BoardLayer(game)
+
+    def redraw():
+        # new board, so that the whole layer is drawn again too
+        game.create(deferred=True, seed=2022)
+        renderer.compose([background, layer.get_grid_layer(), layer])
+
+    redraw()
+
+    return min(timeit.repeat(redraw, number=10, repeat=REPEATS)) / 10
+
+def _measure_texts(renderer: PygameRenderer) -> tuple[float, float]:
+    # texts like the status bar's, as new text objects every frame
+    texts = [("Level 6", 14), ("Planes: 359", 14), ("Time: 01:23", 14),
+             ("New game", 16), ("Highscores", 16), ("Click a cell to start", 24)]
+    font = pygame.font.Font(pygame.font.get_default_font(), 14)
+
+    def render_texts():
+        for text, _ in texts:
+            font.render(text, True, pygame.Color(255, 255, 255, 255))
+
+    def get_texts():
+        for text, size in texts:
+            renderer.measure_text_dimensions(TextObject(text, Position(0, 0), size,
+                                                        Color(255, 255, 255)))
+
+    number = 1000
+
+    return (min(timeit.repeat(render_texts, number=number, repeat=REPEATS)) / number,
+            min(timeit.repeat(get_texts, number=number, repeat=REPEATS)) / number)
+
+def run_benchmark() -> list[tuple[str, float]]:
+    """Measures loading the board's tile images at startup and drawing them, loaded
+        as they are and packed into sprite atlases converted to the display's pixel
+        format, renderer's full redraw of a level 6 board, and texts of a frame rendered
+        every frame and from renderer's cache.
+
+    Returns:
+        list[tuple[str, float]]: Name and time in seconds of each measurement
+    """
+    # headless by default, set SDL_VIDEODRIVER to measure against a real display
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    renderer = PygameRenderer()
+    game = _create_played_game()
+
+    load_time, atlas_time = _measure_startup()
+    loaded_blit, atlas_blit = _measure_blits(pygame.display.get_surface(), game)
+    rendered_texts, cached_texts = _measure_texts(renderer)
+
+    return [("startup: load tiles", load_time),
+            ("startup: build atlases", atlas_time),
+            ("blit per tile: loaded image", loaded_blit),
+            ("blit per tile: atlas", atlas_blit),
+            ("level 6 frame: loaded images", loaded_blit * len(game.get_cells())),
+            ("level 6 frame: atlas", atlas_blit * len(game.get_cells())),
+            ("level 6 full redraw: new board", _measure_redraw(renderer, game)),
+            ("frame texts: rendered", rendered_texts),
+            ("frame texts: from cache", cached_texts)]
+
+if __name__ == "__main__":
+    print(f"{'measurement':<34}{'time (us)':>12}")
+
+    for measurement, seconds in run_benchmark():
+        print(f"{measurement:<34}{seconds * 1e6:>12.2f}")
@@ -0,0 +1,480 @@
+import functools
+from entities.board_piece import BoardPieceType
+from entities.board_cells import BoardCells, CellCounts, EMPTY, PLANE, NUMBER
+
+
+# neighbour counts go up to 8 and are kept as four bit planes
+COUNT_BITS = 4
+
+
+class CellValues:
+    """Read-only sequence of per-cell values calculated on request, standing in for
+        the byte arrays of BoardCells so that code reading cells by index works with
+        bitboard storage as well.
+    """
+    def __init__(self, length: int, getter):
+        """Initialize sequence.
+
+        Args:
+            length (int): Number of cells.
+            getter: Function taking cell index and returning cell's value.
+        """
+        self._length = length
+        self._getter = getter
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index: int) -> int:
+        return self._getter(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self._getter(index)
+
+    def count(self, value: int) -> int:
+        """Count occurrences of a value.
+
+        Args:
+            value (int): Value to count.
+
+        Returns:
+            int: Number of cells having the value
+        """
+        return sum(1 for cell_value in self if cell_value == value)
+
+class BitboardGeometry:
+    """Masks and neighbour operations for bitboards of specific size. Geometries are
+        built once per board size and shared between all boards of that size, keeping
+        the geometries of CACHED_GEOMETRIES most recently used sizes.
+
+    Attributes:
+        width (int): Board width in cells.
+        height (int): Board height in cells.
+        full_mask (int): Bits of all cells.
+        first_column_mask (int): Bits of cells in the leftmost column.
+        last_column_mask (int): Bits of cells in the rightmost column.
+    """
+    # predefined levels and a few custom sizes
+    CACHED_GEOMETRIES = 8
+
+    def __init__(self, width: int, height: int):
+        """Build geometry. Use BitboardGeometry.get() instead to get cached geometry.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.full_mask: int = (1 << (width * height)) - 1
+        self.first_column_mask: int = sum(1 << (y_pos * width) for y_pos in range(height))
+        self.last_column_mask: int = self.first_column_mask << (width - 1)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHED_GEOMETRIES)
+    def get(width: int, height: int) -> "BitboardGeometry":
+        """Get geometry for board size, building it if it is not cached.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+
+        Returns:
+            BitboardGeometry: Shared geometry for the size.
+        """
+        return BitboardGeometry(width, height)
+
+    def shift(self, mask: int, x_offset: int, y_offset: int) -> int:
+        """Shift mask so that bit of a cell is set if its neighbour at the offset is set.
+
+        Args:
+            mask (int): Cell mask.
+            x_offset (int): Horizontal offset of the neighbour (-1, 0 or 1).
+            y_offset (int): Vertical offset of the neighbour (-1, 0 or 1).
+
+        Returns:
+            int: Shifted mask.
+        """
+        # column masks stop bits from wrapping over to the previous or next row and
+        # full mask drops bits shifted past the last cell before shifting rows
+        if x_offset == 1:
+            mask = (mask >> 1) & ~self.last_column_mask
+        elif x_offset == -1:
+            mask = (mask << 1) & ~self.first_column_mask & self.full_mask
+
+        if y_offset == 1:
+            mask >>= self.width
+        elif y_offset == -1:
+            mask <<= self.width
+
+        return mask & self.full_mask
+
+    def dilate(self, mask: int) -> int:
+        """Grow mask by one cell in every direction.
+
+        Args:
+            mask (int): Cell mask.
+
+        Returns:
+            int: Cells of the mask together with all of their neighbours.
+        """
+        horizontal = mask | self.shift(mask, 1, 0) | self.shift(mask, -1, 0)
+
+        return horizontal | self.shift(horizontal, 0, 1) | self.shift(horizontal, 0, -1)
+
+class BitboardMasks:
+    """State of a bitboard's cells, bit i of each mask standing for cell i.
+
+    Attributes:
+        geometry (BitboardGeometry): Geometry of the board's size.
+        planes (int): Cells containing plane.
+        empty (int): Cells without planes around them, planes excluded.
+        counts (list[int]): Bit planes of surrounding plane counts, lowest bit first.
+        opened (int): Opened cells.
+        marked (int): Marked cells.
+    """
+    def __init__(self, geometry: BitboardGeometry):
+        """Initialize masks of a board without planes, all cells closed and unmarked.
+
+        Args:
+            geometry (BitboardGeometry): Geometry of the board's size.
+        """
+        self.geometry = geometry
+        self.planes = 0
+        self.empty = geometry.full_mask
+        self.counts = [0] * COUNT_BITS
+        self.opened = 0
+        self.marked = 0
+
+class BitboardCells(BoardCells):
+    """Cell storage keeping planes, opened cells and marked cells as bit masks in
+        arbitrary-precision ints, bit i standing for cell i (y * width + x).
+        Surrounding plane counts are calculated for all cells at once with shifted
+        masks and kept as bit planes, flood fill grows the revealed area one ring of
+        cells per a handful of mask operations and win check is a single comparison.
+
+        Bitboards suit boards up to some tens of thousands of cells; as every mask
+        operation goes through the whole mask, very large boards should use
+        chunked storage instead.
+    """
+    def __init__(self, width: int, height: int):
+        """Initialize empty (all cells closed, unmarked and without planes) storage.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        super().__init__(width, height)
+
+        total = width * height
+
+        self._masks = BitboardMasks(BitboardGeometry.get(width, height))
+
+        self.types = CellValues(total, self._get_type_value)
+        self.numbers = CellValues(total, self._get_number_value)
+        self.opened = CellValues(total, lambda index: (self._masks.opened >> index) & 1)
+        self.marked = CellValues(total, lambda index: (self._masks.marked >> index) & 1)
+
+    def _create_array(self, length: int):
+        # cell values are read from the masks, see __init__
+        return None
+
+    def as_array(self, data):
+        """Bitboard storage can't be accessed as NumPy arrays.
+
+        Returns:
+            None: Always
+        """
+        return None
+
+    def _calculate_counts(self):
+        # add eight shifted plane masks together as bit-sliced binary numbers
+        masks = self._masks
+        counts = [0] * COUNT_BITS
+
+        for y_offset in (-1, 0, 1):
+            for x_offset in (-1, 0, 1):
+                if x_offset == 0 and y_offset == 0:
+                    continue
+
+                carry = masks.geometry.shift(masks.planes, x_offset, y_offset)
+                bit = 0
+
+                while carry:
+                    counts[bit], carry = counts[bit] ^ carry, counts[bit] & carry
+                    bit += 1
+
+        non_plane = masks.geometry.full_mask & ~masks.planes
+        masks.counts = [count & non_plane for count in counts]
+        masks.empty = non_plane & ~(counts[0] | counts[1] | counts[2] | counts[3])
+
+    def place_planes(self, plane_indexes: list[int], batched: bool = None):
+        """Place planes into given cells and calculate surrounding plane counts of all
+            other cells. Any previous plane placement is overwritten, marks are kept.
+            Must not be called after cells have been opened.
+
+        Args:
+            plane_indexes (list[int]): Indexes of cells containing plane
+            batched (bool, optional): Not used, mask operations always handle the
+                whole board at once. Defaults to None.
+        """
+        bits = bytearray((len(self) + 7) // 8)
+
+        for index in plane_indexes:
+            bits[index >> 3] |= 1 << (index & 7)
+
+        self._masks.planes = int.from_bytes(bits, "little")
+        self._calculate_counts()
+
+        self.counts.closed_safe = len(self) - len(plane_indexes)
+
+    def _get_type_value(self, index: int) -> int:
+        if (self._masks.planes >> index) & 1:
+            return PLANE
+
+        if (self._masks.empty >> index) & 1:
+            return EMPTY
+
+        return NUMBER
+
+    def _get_number_value(self, index: int) -> int:
+        return sum(((count >> index) & 1) << bit
+                   for bit, count in enumerate(self._masks.counts))
+
+    def get_type(self, index: int) -> BoardPieceType:
+        """Get cell's type.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            BoardPieceType: Type (plane, number, empty)
+        """
+        return BoardPieceType(self._get_type_value(index))
+
+    def get_number(self, index: int) -> int:
+        """Get number of planes surrounding the cell.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            int: Number of surrounding planes for number cells, None otherwise
+        """
+        if self._get_type_value(index) != NUMBER:
+            return None
+
+        return self._get_number_value(index)
+
+    def is_open(self, index: int) -> bool:
+        """Has cell been opened?
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            bool: True if cell has been opened, False otherwise
+        """
+        return (self._masks.opened >> index) & 1 == 1
+
+    def is_marked(self, index: int) -> bool:
+        """Has cell been marked as radar contact?
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            bool: True if cell has been marked, False otherwise
+        """
+        return (self._masks.marked >> index) & 1 == 1
+
+    def open(self, index: int) -> bool:
+        """Open the cell, can only be done for cells that are closed and unmarked.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            bool: False if opened cell was plane,
+                True otherwise or if cell was already open or marked
+        """
+        bit = 1 << index
+
+        if (self._masks.opened | self._masks.marked) & bit:
+            return True
+
+        self._masks.opened |= bit
+        self.counts.opened += 1
+
+        if self._masks.planes & bit:
+            return False
+
+        self.counts.closed_safe -= 1
+
+        return True
+
+    def close_many(self, indexes: list[int]):
+        """Close opened cells again, reversing open() and reveal().
+
+        Args:
+            indexes (list[int]): Indexes of the cells to close. Closed cells are skipped.
+        """
+        closed = 0
+
+        for index in indexes:
+            closed |= 1 << index
+
+        closed &= self._masks.opened
+        count = closed.bit_count()
+
+        self._masks.opened &= ~closed
+        self.counts.opened -= count
+        self.counts.closed_safe += count - (closed & self._masks.planes).bit_count()
+
+    def mark(self, index: int):
+        """Mark the cell, can only be done for cells that are closed and unmarked.
+
+        Args:
+            index (int): Cell index
+        """
+        bit = 1 << index
+
+        if (self._masks.opened | self._masks.marked) & bit:
+            return
+
+        self._masks.marked |= bit
+        self.counts.marked += 1
+
+    def unmark(self, index: int):
+        """Unmark the cell.
+
+        Args:
+            index (int): Cell index
+        """
+        bit = 1 << index
+
+        if self._masks.opened & bit or not self._masks.marked & bit:
+            return
+
+        self._masks.marked &= ~bit
+        self.counts.marked -= 1
+
+    def _reveal_mask(self, seeds: int) -> int:
+        masks = self._masks
+        closed = ~masks.opened & ~masks.marked
+        seeds &= closed & ~masks.planes
+        area = seeds & masks.empty
+
+        if area:
+            # grow the area one ring of neighbours at a time through closed, unmarked
+            # empty cells until it no longer changes
+            passable = masks.empty & closed
+
+            while True:
+                grown = masks.geometry.dilate(area) & passable
+
+                if grown == area:
+                    break
+
+                area = grown
+
+            # empty cell has no planes around it, so every neighbour is safe
+            seeds |= masks.geometry.dilate(area) & closed
+
+        count = seeds.bit_count()
+
+        masks.opened |= seeds
+        self.counts.opened += count
+        self.counts.closed_safe -= count
+
+        return seeds
+
+    @staticmethod
+    def _get_mask_indexes(mask: int) -> list[int]:
+        bits = bin(mask)[:1:-1]
+
+        return [position for position, value in enumerate(bits) if value == "1"]
+
+    def reveal(self, index: int) -> list[int]:
+        """Open a cell and, if the cell is empty, all empty cells connected to it and
+            their neighbours. Marked cells are never opened and planes are not opened
+            by this method.
+
+        Args:
+            index (int): Index of the cell to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells, starting with the cell itself
+                and followed by the rest in ascending order. Empty if nothing was opened.
+        """
+        bit = 1 << index
+
+        if (self._masks.opened | self._masks.marked | self._masks.planes) & bit:
+            return []
+
+        if not self._masks.empty & bit:
+            self.open(index)
+            return [index]
+
+        return [index] + self._get_mask_indexes(self._reveal_mask(bit) & ~bit)
+
+    def reveal_many(self, indexes: list[int]) -> list[int]:
+        """Open several cells and the empty areas around them in one pass, growing the
+            areas of all empty cells together.
+
+        Args:
+            indexes (list[int]): Indexes of the cells to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells in ascending order.
+                Empty if nothing was opened.
+        """
+        seeds = 0
+
+        for index in indexes:
+            seeds |= 1 << index
+
+        return self._get_mask_indexes(self._reveal_mask(seeds))
+
+    def is_cleared(self) -> bool:
+        """Check if every cell has been either opened or marked.
+
+        Returns:
+            bool: True if no cell is left closed and unmarked, False otherwise
+        """
+        return (self._masks.opened | self._masks.marked) == self._masks.geometry.full_mask
+
+    def pack_flags(self) -> tuple[bytes, bytes, bytes]:
+        """Get plane, open and mark flags of all cells packed eight cells per byte,
+            the first cell in the lowest bit of the first byte.
+
+        Returns:
+            tuple[bytes, bytes, bytes]: Packed plane, open and mark flags
+        """
+        length = (len(self) + 7) // 8
+
+        return tuple(mask.to_bytes(length, "little")
+                     for mask in (self._masks.planes, self._masks.opened, self._masks.marked))
+
+    def unpack_flags(self, planes, opened, marked):
+        """Replace state of all cells with packed flags, as returned by pack_flags().
+            Counts of surrounding planes and counters are calculated from the flags.
+
+        Args:
+            planes: Buffer (bytes, bytearray or memoryview) of packed plane flags.
+            opened: Buffer of packed open flags.
+            marked: Buffer of packed mark flags.
+        """
+        self._masks.planes = int.from_bytes(planes, "little")
+        self._masks.opened = int.from_bytes(opened, "little")
+        self._masks.marked = int.from_bytes(marked, "little")
+        self._calculate_counts()
+
+        self.counts = CellCounts(*self._scan_counters())
+
+    def _scan_counters(self) -> tuple[int, int, int]:
+        closed_safe = self._masks.geometry.full_mask & ~self._masks.planes & ~self._masks.opened
+
+        return (self._masks.opened.bit_count(), self._masks.marked.bit_count(),
+                closed_safe.bit_count())
@@ -1,13 +1,16 @@
 from enum import Enum
-from collections import deque
-import random
 import time
 from primitives.interfaces import RenderedObject
 from primitives.position import Position
 from primitives.size import Size
-from primitives.color import Color
-from entities.board_piece import BoardPiece, BoardPieceType
-from entities.ui.board_grid_line import BoardGridLine
+from entities.board_piece import BoardPiece
+from entities.board_cells import BoardCells, PLANE, NUMBER
+from entities.chunked_board_cells import ChunkedBoardCells
+from entities.bitboard_cells import BitboardCells
+from entities.board_changes import ChangePublisher
+from entities.board_layout import BoardLayout
+from entities.plane_placement import PlanePlacement
+from entities import board_format
 
 
 class BoardPieceSize(Enum):
@@ -15,24 +18,103 @@ class BoardPieceSize(Enum):
     MEDIUM = 1
     LARGE = 2
 
-class VisitedStackItem:
-    def __init__(self, position: Position, neighbours: list[Position],
-                 item_processed: bool = False,
-                 is_empty: bool = False):
-        self.position: Position = position
-        self.neighbours: list[Position] = neighbours
-        self.index: int = 0
-        self.item_processed: bool = item_processed
-        self.is_empty: bool = is_empty
-
 class BoardState:
     RUNNING = 0
     WON = 1
     LOST = 2
 
+class GameStatus:
+    """Play state (BoardState) of a gameboard and time played. Clock starts with the
+        first move and stops when the game is won or lost.
+    """
+    def __init__(self):
+        self._state = BoardState.RUNNING
+        self._start_time: float = None
+        self._stop_time: float = None
+
+    def get_state(self) -> int:
+        """Get current play state.
+
+        Returns:
+            int: BoardState of the game
+        """
+        return self._state
+
+    def is_over(self) -> bool:
+        """Check if the game has been won or lost.
+
+        Returns:
+            bool: True if the game has ended, False if it is running
+        """
+        return self._state in (BoardState.WON, BoardState.LOST)
+
+    def is_started(self) -> bool:
+        """Check if the clock has been started.
+
+        Returns:
+            bool: True if the first move has been made, False otherwise
+        """
+        return self._start_time is not None
+
+    def start(self):
+        """Start the clock, unless already started."""
+        if self._start_time is None:
+            self._start_time = time.time()
+
+    def change(self, state: int):
+        """Change play state, stopping the clock when the game ends.
+
+        Args:
+            state (int): New BoardState.
+        """
+        self._state = state
+
+        if state != BoardState.RUNNING and self._stop_time is None:
+            self._stop_time = time.time()
+
+    def resume(self):
+        """Continue an ended game, clock running again from where it was started."""
+        self._state = BoardState.RUNNING
+        self._stop_time = None
+
+    def restore(self, state: int, elapsed: float = None):
+        """Continue play of a decoded board.
+
+        Args:
+            state (int): BoardState of the game.
+            elapsed (float, optional): Time played in seconds. Defaults to None, clock
+                not started.
+        """
+        self._state = state
+
+        if elapsed is not None:
+            self._start_time = time.time() - elapsed
+
+            if state != BoardState.RUNNING:
+                self._stop_time = self._start_time + elapsed
+
+    def get_elapsed_time(self) -> float:
+        """Get time played since the start of the clock.
+
+        Returns:
+            float: Play time in seconds.
+        """
+        if self._start_time is None:
+            return 0.0
+
+        if self._stop_time is None:
+            return time.time() - self._start_time
+
+        return self._stop_time-self._start_time
+
 class GameboardConfiguration:
     """Internal gameboard configuration object for keeping track of game's properties.
+        Besides the predefined levels, configuration can describe a custom board of any
+        size up to MAX_CUSTOM_SIZE with any number of planes.
     """
+    CUSTOM_LEVEL = 0
+    MAX_CUSTOM_SIZE = Size(2000, 2000)
+
     LEVELS = {
         1: [(5, 5), 3],
         2: [(9, 9), 19],
@@ -42,8 +124,39 @@ class GameboardConfiguration:
         6: [(58, 29), 599]
     }
 
-    def __init__(self, level: int):
+    # levels where boards solvable without guessing are common enough to be searched
+    # for (benchmarks.no_guess): about 84%, 18% and 5% of random boards on levels 1-3,
+    # but on levels 4-6, where 29-36% of the pieces have planes, none in thousands
+    NO_GUESS_LEVELS = (1, 2, 3)
+
+    def __init__(self, level: int, size: Size = None, planes: int = None):
+        """Initialize configuration.
+
+        Args:
+            level (int): Predefined level or CUSTOM_LEVEL for custom board.
+            size (Size, optional): Custom board's size in pieces. Defaults to None.
+            planes (int, optional): Custom board's number of planes. Defaults to None.
+
+        Raises:
+            ValueError: Level is not predefined or custom board's size or number of planes
+                is not valid (board must have room for at least one piece without plane).
+        """
         self._level: int = level
+
+        if level == GameboardConfiguration.CUSTOM_LEVEL:
+            if size is None or planes is None or\
+                    not 1 <= size.width <= GameboardConfiguration.MAX_CUSTOM_SIZE.width or\
+                    not 1 <= size.height <= GameboardConfiguration.MAX_CUSTOM_SIZE.height or\
+                    not 0 <= planes < size.width * size.height:
+                raise ValueError()
+
+            self._size: Size = Size(size.width, size.height)
+            self._planes: int = planes
+            return
+
+        if level not in GameboardConfiguration.LEVELS:
+            raise ValueError()
+
         self._size: Size = Size(GameboardConfiguration.LEVELS[level][0][0],
                           GameboardConfiguration.LEVELS[level][0][1])
         self._planes: int = GameboardConfiguration.LEVELS[level][1]
@@ -64,90 +177,108 @@ class GameboardConfiguration:
     def planes(self) -> int:
         return self._planes
 
+    @property
+    def is_custom(self) -> bool:
+        return self._level == GameboardConfiguration.CUSTOM_LEVEL
+
+    @property
+    def allows_no_guess(self) -> bool:
+        return self._level in GameboardConfiguration.NO_GUESS_LEVELS
+
 class Gameboard:
     """Main gameboard object implementing logic for single level of gameplay.
+        Laying out of the pieces on the UI, placement of the planes, play state and
+        following of the changes are handled by collaborators of the board.
     """
-    def __init__(self, level: int):
-        if level < 1 or level > 6:
-            raise ValueError()
+    # boards larger than this use chunked cell storage
+    CHUNKED_STORAGE_THRESHOLD = 256 * 256
+
+    # width and height of pieces of each size in pixels
+    PIECE_PIXELS = {
+        BoardPieceSize.LARGE: 25,
+        BoardPieceSize.MEDIUM: 20,
+        BoardPieceSize.SMALL: 15
+    }
 
-        self._configuration = GameboardConfiguration(level)
-        self._state = BoardState.RUNNING
-        self._start_time: float = None
-        self._stop_time: float = None
-        self._offset: Position = Position(0,0)
-        self._pieces: list[BoardPiece] = [None] *\
-            (self._configuration.size.width * self._configuration.size.height)
-        self._grid_lines: list[BoardGridLine] = None
+    def __init__(self, level: int, debug: bool = False,
+                 size: Size = None, planes: int = None, bitboard: bool = False):
+        """Initialize gameboard for a level.
 
-        self._piece_size = BoardPieceSize.MEDIUM
+        Args:
+            level (int): Level (1-6) defining board size and number of planes, or
+                GameboardConfiguration.CUSTOM_LEVEL for custom board.
+            debug (bool, optional): Verify board's cell counters against a full scan
+                of the board after every open and mark operation. Defaults to False.
+            size (Size, optional): Custom board's size in pieces. Defaults to None.
+            planes (int, optional): Custom board's number of planes. Defaults to None.
+            bitboard (bool, optional): Keep board's cells as bit masks instead of byte
+                arrays. Defaults to False.
+
+        Raises:
+            ValueError: Level is not valid or custom board's size or planes are not given
+                or not valid.
+        """
+        self._debug = debug
 
-        if level <= 3:
-            self._piece_size = BoardPieceSize.LARGE
+        self._configuration = GameboardConfiguration(level, size, planes)
+        self._status = GameStatus()
+        self._cells = self._create_cells(bitboard)
+        self._layout = BoardLayout(self._configuration.size,
+                                   Gameboard.PIECE_PIXELS[self._get_initial_piece_size()])
+        self._layout.set_cells(self._cells)
+        self._placement = PlanePlacement(self._configuration.planes)
+        self._changes = ChangePublisher()
 
-        if level >= 5:
-            self._piece_size = BoardPieceSize.SMALL
+    def _get_initial_piece_size(self) -> BoardPieceSize:
+        level = self._configuration.level
 
-    def _get_index_from_position(self, position: Position) -> int:
-        return position.y * self._configuration.size.width + position.x
+        if level >= 5 or self._configuration.is_custom:
+            return BoardPieceSize.SMALL
 
-    def _get_position_from_index(self, index) -> Position:
-        y_pos = index // self._configuration.size.width
-        x_pos = index - (y_pos * self._configuration.size.width)
-
-        return Position(x_pos, y_pos)
-
-    def _get_neighbouring_positions(self, position: Position,
-                                    exclude: set[Position] = None) -> list[Position]:
-        positions = []
+        if level <= 3:
+            return BoardPieceSize.LARGE
 
-        for x_pos,y_pos in [(position.x, position.y-1),
-                            (position.x+1, position.y-1),
-                            (position.x+1, position.y),
-                            (position.x+1, position.y+1),
-                            (position.x, position.y+1),
-                            (position.x-1, position.y+1),
-                            (position.x-1, position.y),
-                            (position.x-1, position.y-1)
-                            ]:
-            if x_pos < 0 or x_pos > self._configuration.size.width-1 or \
-                y_pos < 0 or y_pos > self._configuration.size.height-1:
-                continue
+        return BoardPieceSize.MEDIUM
 
-            new_pos = Position(x_pos, y_pos)
+    def _create_cells(self, bitboard: bool) -> BoardCells:
+        size = self._configuration.size
 
-            if exclude is not None and new_pos in exclude:
-                continue
+        if bitboard:
+            return BitboardCells(size.width, size.height)
 
-            positions.append(new_pos)
+        if size.width * size.height > Gameboard.CHUNKED_STORAGE_THRESHOLD:
+            return ChunkedBoardCells(size.width, size.height)
 
-        return positions
+        return BoardCells(size.width, size.height)
 
-    def _get_surrounding_planes(self, position: Position) -> int:
-        planes = 0
+    def _get_index_from_position(self, position: Position) -> int:
+        return position.y * self._configuration.size.width + position.x
 
-        for position_to_check in self._get_neighbouring_positions(position):
-            index = self._get_index_from_position(position_to_check)
+    def _get_position_from_index(self, index) -> Position:
+        y_pos = index // self._configuration.size.width
+        x_pos = index - (y_pos * self._configuration.size.width)
 
-            if self._pieces[index] is not None and \
-                self._pieces[index].get_type() == BoardPieceType.PLANE:
-                planes += 1
+        return Position(x_pos, y_pos)
 
-        return planes
+    @property
+    def _pieces(self) -> list[BoardPiece]:
+        return self._layout.get_pieces()
 
-    def _get_piece_in_pixels(self):
-        if self._piece_size == BoardPieceSize.LARGE:
-            return 25
+    @property
+    def _offset(self) -> Position:
+        return self._layout.get_position()
 
-        if self._piece_size == BoardPieceSize.MEDIUM:
-            return 20
+    def _get_piece_in_pixels(self) -> int:
+        return self._layout.get_piece_in_pixels()
 
-        return 15
+    def get_layout(self) -> BoardLayout:
+        """Get layout of the board's pieces on the container UI element, for example
+            for drawing the board in layers.
 
-    def _calculate_drawing_position(self, position: Position):
-        pixels = self._get_piece_in_pixels()
-        return Position(self._offset.x + position.x * pixels,
-                self._offset.y + position.y * pixels)
+        Returns:
+            BoardLayout: Board's layout
+        """
+        return self._layout
 
     def change_position(self, draw_at: Position):
         """Changes this board's relative position on the container UI element.
@@ -155,14 +286,7 @@ class Gameboard:
         Args:
             draw_at (Position): New top-left position from which to draw board and its elements
         """
-        self._offset = draw_at
-
-        for index, piece in enumerate(self._pieces):
-            position = self._get_position_from_index(index)
-            piece.change_position(
-                self._calculate_drawing_position(position))
-
-        self._grid_lines = None
+        self._layout.change_position(draw_at)
 
     def translate_event_position_to_piece_position(self,
             event_position: Position) -> Position:
@@ -176,97 +300,131 @@ class Gameboard:
             Position: X,Y coordinate representing game piece on board or None if
                 event position is outside the board's pieces
         """
-        event_x = event_position.x - self._offset.x
-        event_y = event_position.y - self._offset.y
-
-        if event_x < 0 or event_y < 0:
-            return None  # out of bounds
-
-        piece_pixels = self._get_piece_in_pixels()
+        return self._layout.translate_event_position_to_piece_position(event_position)
 
-        if event_x > piece_pixels * self._configuration.size.width or\
-            event_y > piece_pixels * self._configuration.size.height:
-            return None  # out of bounds
-
-        x_pos = event_x // piece_pixels
-        y_pos = event_y // piece_pixels
-
-        if x_pos >= self._configuration.size.width or y_pos >= self._configuration.size.height:
-            return None  # out of bounds
-
-        return Position(x_pos, y_pos)
-
-    def create(self):
+    def create(self, deferred: bool = False, safe_area: bool = False, seed: int = None,
+               start: Position = None):
         """Creates or re-creates new game board content according to initialization data 
             passed in constructor.
 
             This method MUST be called before board can be played.
-        """
-
-        # Create plane pieces
-        plane_indexes = []
-        self._pieces: list[BoardPiece] = [None] *\
-            (self._configuration.size.width * self._configuration.size.height)
-        piece_in_pixels = self._get_piece_in_pixels()
-
-        total_pieces = len(self._pieces)
 
-        plane_indexes = random.sample(range(0, total_pieces), self._configuration.planes)
+        Args:
+            deferred (bool, optional): Place planes only when the first piece is opened
+                instead of immediately, so that the opened piece is never a plane.
+                Defaults to False.
+            safe_area (bool, optional): With deferred placement, also keep pieces
+                surrounding the first opened piece free of planes, so that first open
+                always reveals an empty area. Defaults to False.
+            seed (int, optional): Seed for placing the planes; the same seed and the same
+                first opened piece always give the same board. Defaults to None which
+                picks a random seed.
+            start (Position, optional): Coordinates of a piece to open before the game
+                starts: the clock is not started and the opening is not recorded as
+                a move. Used to hand out boards whose start is already known to be
+                solvable without guessing. Defaults to None.
+        """
+        # new storage of the same kind as chosen at initialization
+        self._cells = type(self._cells)(self._configuration.size.width,
+                                        self._configuration.size.height)
+        self._layout.set_cells(self._cells)
+        self._placement.reset(deferred, safe_area, seed)
 
-        for index in plane_indexes:
-            position = self._get_position_from_index(index)
-            self._pieces[index] = BoardPiece(
-                piece_in_pixels, BoardPieceType.PLANE, None,
-                self._calculate_drawing_position(position))
+        if not deferred:
+            self._placement.place(self._cells)
 
-        # Create other pieces
-        for i in range(0, total_pieces):
-            if self._pieces[i] is not None:
-                continue
+        if start is not None:
+            self._open_piece(self._get_index_from_position(start))
 
-            position = self._get_position_from_index(i)
+    def get_level(self) -> int:
+        """Get current play level
 
-            planes = self._get_surrounding_planes(position)
+        Returns:
+            int: Current level
+        """
+        return self._configuration.level
 
-            if planes == 0:
-                self._pieces[i] = BoardPiece(
-                    piece_in_pixels, BoardPieceType.EMPTY, None,
-                    self._calculate_drawing_position(position))
-                continue
+    def get_cells(self) -> BoardCells:
+        """Get board's cell storage for read-only analysis of the board, for example by
+            the solver. Cells must only be changed through the gameboard's operations,
+            and anything modelling the player's view must only read the types and
+            numbers of opened cells.
 
-            self._pieces[i] = BoardPiece(
-                piece_in_pixels, BoardPieceType.NUMBER, planes,
-                self._calculate_drawing_position(position))
+        Returns:
+            BoardCells: Cell storage
+        """
+        return self._cells
 
-    def _recalculate_grid(self):
-        self._grid_lines = []
+    def serialize(self) -> bytes:
+        """Encode board's current state in compact binary format (see board_format).
 
-        pixels = self._get_piece_in_pixels()
+        Returns:
+            bytes: Encoded board
+        """
+        flags = 0
+
+        for flag, is_set in ((board_format.FLAG_PLANES_PLACED, self._placement.is_placed()),
+                             (board_format.FLAG_SAFE_AREA, self._placement.has_safe_area()),
+                             (board_format.FLAG_FIRST_OPENED,
+                              self._placement.is_first_opened()),
+                             (board_format.FLAG_CLOCK_STARTED, self._status.is_started()),
+                             (board_format.FLAG_BITBOARD,
+                              isinstance(self._cells, BitboardCells))):
+            if is_set:
+                flags |= flag
+
+        header = board_format.BoardHeader(self._configuration.level, self._configuration.size,
+                                          self._configuration.planes,
+                                          self._placement.get_seed())
+        header.state = self._status.get_state()
+        header.flags = flags
+        header.elapsed = self.get_elapsed_play_time()
+
+        return board_format.pack_board(header, *self._cells.pack_flags())
+
+    def _restore(self, header: board_format.BoardHeader, planes, opened, marked):
+        if self._configuration.size != header.size or\
+                self._configuration.planes != header.planes:
+            raise ValueError("Board size or planes do not match level")
+
+        # board is new, so its empty storage is filled in directly instead of being
+        # created again
+        self._placement.restore(header.flags & board_format.FLAG_PLANES_PLACED != 0,
+                                header.flags & board_format.FLAG_SAFE_AREA != 0,
+                                header.seed,
+                                header.flags & board_format.FLAG_FIRST_OPENED != 0)
+        self._cells.unpack_flags(planes, opened, marked)
+        self._status.restore(header.state,
+                             header.elapsed if header.flags & board_format.FLAG_CLOCK_STARTED
+                             else None)
+
+    @classmethod
+    def deserialize(cls, data) -> "Gameboard":
+        """Decode board encoded with serialize(). Flags are unpacked from the data
+            straight into the board's cell storage, and types and numbers of the cells
+            are calculated from the plane flags in one batched pass.
 
-        width = pixels * self._configuration.size.width
-        height = pixels * self._configuration.size.height
+        Args:
+            data: Encoded board as bytes, bytearray or memoryview.
 
-        color = Color(200, 200, 200)
+        Raises:
+            ValueError: Data is not a valid encoded board.
 
-        for y_pos in range(0, height+1, pixels):
-            self._grid_lines.append(BoardGridLine(
-                Position(self._offset.x, self._offset.y + y_pos),
-                Position(self._offset.x + width, self._offset.y + y_pos),
-                color))
+        Returns:
+            Gameboard: Board in the state it was in when encoded, play time continuing
+                from the encoded elapsed time
+        """
+        header, planes, opened, marked = board_format.unpack_board(data)
 
-        for x_pos in range(0, width+1, pixels):
-            self._grid_lines.append(BoardGridLine(
-                Position(self._offset.x + x_pos, self._offset.y),
-                Position(self._offset.x + x_pos, self._offset.y + height),
-                color))
+        custom = header.level == GameboardConfiguration.CUSTOM_LEVEL
 
-    def get_level(self) -> int:
-        """Get current play level
+        game = cls(header.level,
+                   size=header.size if custom else None,
+                   planes=header.planes if custom else None,
+                   bitboard=header.flags & board_format.FLAG_BITBOARD != 0)
+        game._restore(header, planes, opened, marked)
 
-        Returns:
-            int: Current level
-        """
-        return self._configuration.level
+        return game
 
     def get_rendering_items(self) -> list[RenderedObject]:
         """Gets all UI items consisting of the game board's current state
@@ -275,18 +433,19 @@ class Gameboard:
         Returns:
             list[RenderedObject]: UI items
         """
-        items: list(RenderedObject) = []
+        return self._layout.get_rendering_items()
 
-        if self._grid_lines is None:
-            self._recalculate_grid()
+    def get_probability_tints(self, probabilities: dict[int, float]) -> list[RenderedObject]:
+        """Gets UI items tinting closed pieces by their probability of having a plane.
 
-        for line in self._grid_lines:
-            items.append(line)
-
-        for piece in self._pieces:
-            items.append(piece)
+        Args:
+            probabilities (dict[int, float]): Probability by piece index, as given
+                by PlaneProbabilities.
 
-        return items
+        Returns:
+            list[RenderedObject]: UI items to draw over the pieces
+        """
+        return self._layout.get_probability_tints(probabilities)
 
     def get_total_planes(self) -> int:
         """Get total number of planes in the current game.
@@ -302,12 +461,7 @@ class Gameboard:
         Returns:
             int: Number of radar contacts
         """
-        marked = 0
-
-        for piece in self._pieces:
-            marked += 1 if piece.is_marked() else 0
-
-        return marked
+        return self._cells.counts.marked
 
     def get_pieces_on_board(self) -> int:
         """Get total number of pieces on the gameboard (X x Y).
@@ -324,8 +478,7 @@ class Gameboard:
         Returns:
             Size: Current size in pixels
         """
-        return Size(self._configuration.size.width * self._get_piece_in_pixels(),
-                self._configuration.size.height * self._get_piece_in_pixels())
+        return self._layout.get_dimensions()
 
     def get_piece_dimensions(self) -> Size:
         """Get gameboard's pieces current size.
@@ -333,113 +486,84 @@ class Gameboard:
         Returns:
             Size: Individual piece's size in pixels
         """
-        pixels = self._get_piece_in_pixels()
-
-        return Size(pixels, pixels)
-
-    def _open_adjacent_piece(self, item: VisitedStackItem):
-        item.item_processed = True
-
-        index = self._get_index_from_position(item.position)
-
-        piece = self._pieces[index]
-
-        if not piece.is_open() and not piece.is_marked():
-            piece_type = piece.get_type()
-
-            if piece_type in (BoardPieceType.EMPTY, BoardPieceType.NUMBER):
-                piece.open()
-
-            if piece_type == BoardPieceType.EMPTY:
-                item.is_empty = True
+        return self._layout.get_piece_dimensions()
 
-    def _open_adjacent_pieces(self, position: Position):
-        visited = set()
-        item = VisitedStackItem(position, self._get_neighbouring_positions(position),
-                                item_processed = True, is_empty = True)
-        visit_stack = deque()
-        visit_stack.append(item)
-
-        while len(visit_stack) > 0:
-            item = visit_stack.pop()
-
-            visited.add(item.position)
-
-            if not item.item_processed:
-                self._open_adjacent_piece(item)
+    def _check_for_win(self):
+        if not self._cells.is_cleared():
+            return
 
-            item.index += 1
+        self._status.change(BoardState.WON)
 
-            if item.index <= len(item.neighbours):
-                visit_stack.append(item)
+    def _open_piece(self, index: int) -> list[int]:
+        cells = self._cells
 
-                if not item.is_empty:
-                    continue
+        if cells.opened[index] or cells.marked[index]:
+            return []  # no-op
 
-                next_position = item.neighbours[item.index-1]
-                item = VisitedStackItem(next_position,
-                                        self._get_neighbouring_positions(next_position, visited))
-                visit_stack.append(item)
+        if not self._placement.is_placed():
+            self._placement.place_around(cells, index)
+        elif cells.types[index] == PLANE:
+            if self._placement.is_first_opened():
+                # Game over
+                cells.open(index)
+                self._status.change(BoardState.LOST)
+                return [index]
 
-    def _is_first_open(self) -> bool:
-        count = 0
+            # ...but to make game fair, if this is the very first opened piece,
+            # place planes again so that they don't hit the opened piece
+            self._placement.place(cells, {index})
 
-        for piece in self._pieces:
-            if piece.is_open():
-                count += 1
+        self._placement.set_first_opened()
 
-            if count > 1:
-                return False
+        # if empty piece, automatically open all adjacent empty and number pieces
+        opened = self._cells.reveal(index)
 
-        return count == 1
+        self._check_for_win()
 
-    def _check_for_win(self):
-        for piece in self._pieces:
-            if not piece.is_open() and not piece.is_marked():
-                return
+        return opened
 
-        self._state = BoardState.WON
-        self._stop_clock()
+    def _chord_piece(self, index: int) -> list[int]:
+        cells = self._cells
 
-    def _open_piece(self, piece: BoardPiece, position: Position):
-        if piece.is_open() or piece.is_marked():
-            return  # no-op
+        if not cells.opened[index] or cells.types[index] != NUMBER:
+            return []  # no-op
 
-        result = piece.open()
+        neighbours = cells.neighbours.neighbours(index)
 
-        if not result:
-            # Game over
+        if sum(1 for neighbour in neighbours if cells.marked[neighbour]) != cells.numbers[index]:
+            return []  # no-op
 
-            # ...but to make game fair, if this was very first first piece,
-            # keep generating new pieces until we don't hit plane first
-            is_first = self._is_first_open()
+        closed = [neighbour for neighbour in neighbours
+                  if not cells.opened[neighbour] and not cells.marked[neighbour]]
+        planes = [neighbour for neighbour in closed if cells.types[neighbour] == PLANE]
 
-            if not is_first:
-                self._state = BoardState.LOST
-                self._stop_clock()
-                return
+        if planes:
+            # Game over, a mark around the number was wrong
+            for plane in planes:
+                cells.open(plane)
 
-            while not result:
-                self.create()
-                piece = self._pieces[self._get_index_from_position(position)]
-                result = piece.open()
+            self._status.change(BoardState.LOST)
+            return planes
 
-        # if empty piece, automatically open all adjacent empty and number pieces
-        if piece.get_type() == BoardPieceType.EMPTY:
-            self._open_adjacent_pieces(position)
+        # all neighbours and the empty areas around them are opened in one pass
+        opened = cells.reveal_many(closed)
 
         self._check_for_win()
 
-    def _start_clock(self):
-        if self._start_time is None:
-            self._start_time = time.time()
+        return opened
 
-    def _stop_clock(self):
-        if self._stop_time is None:
-            self._stop_time = time.time()
+    def _publish(self, *changed: list[int]):
+        self._changes.publish(self._cells, self._status.get_state(), *changed)
+
+    def _record(self, opened: list[int] = None, marked: list[int] = None,
+                unmarked: list[int] = None):
+        self._publish(opened, marked, unmarked)
 
     def open_piece(self, position: Position):
-        """Perform open operation on piece at specific coordinates.
+        """Perform open operation on piece at specific coordinates. Opening an opened
+            number piece chords it: if as many surrounding pieces are marked as the
+            number tells, all other surrounding pieces are opened at once. A wrong
+            mark loses the game.
 
         Args:
             position (Position): Coordinates of the piece.
@@ -447,16 +571,20 @@ class Gameboard:
                 pixel coordinates i.e. 0,0 refers to piece at the top-left corner 
                 of the board and 9,9 refers to bottom-right piece, assuming 9x9 board.
         """
-        if self._state in (BoardState.WON, BoardState.LOST):
+        if self._status.is_over():
             return
 
-        self._start_clock()
+        self._status.start()
 
         index = self._get_index_from_position(position)
 
-        piece = self._pieces[index]
+        if self._cells.is_open(index):
+            self._record(opened=self._chord_piece(index))
+        else:
+            self._record(opened=self._open_piece(index))
 
-        self._open_piece(piece, position)
+        if self._debug:
+            self._cells.verify_counters()
 
     def mark_piece(self, position: Position):
         """Perform mark operation on piece at specific coordinates.
@@ -467,30 +595,46 @@ class Gameboard:
                 pixel coordinates i.e. 0,0 refers to piece at the top-left corner 
                 of the board and 9,9 refers to bottom-right piece, assuming 9x9 board.
         """
-        if self._state in (BoardState.WON, BoardState.LOST):
+        if self._status.is_over():
             return
 
-        self._start_clock()
+        self._status.start()
 
         index = self._get_index_from_position(position)
+        cells = self._cells
 
-        piece = self._pieces[index]
-
-        if piece.is_open():
+        if cells.is_open(index):
             return  # no-op
 
-        if piece.is_marked():
+        if cells.is_marked(index):
             # unmark
-            piece.unmark()
+            cells.unmark(index)
+            self._record(unmarked=[index])
+
+            if self._debug:
+                cells.verify_counters()
             return
 
         # check if radar contacts are full
         if self.get_radar_contacts() >= self._configuration.planes:
             return
 
-        piece.mark()
+        cells.mark(index)
 
         self._check_for_win()
+        self._record(marked=[index])
+
+        if self._debug:
+            cells.verify_counters()
+
+    def get_changes(self) -> ChangePublisher:
+        """Get publisher of changes made to the board's cells, for following them.
+            Publisher stays the same when the board is created again.
+
+        Returns:
+            ChangePublisher: Board's change publisher
+        """
+        return self._changes
 
     def get_current_board_state(self) -> BoardState:
         """Get current play state of the gameboard.
@@ -498,7 +642,7 @@ class Gameboard:
         Returns:
             BoardState: State of the play (game running, game is won, game is lost)
         """
-        return self._state
+        return self._status.get_state()
 
     def get_elapsed_play_time(self) -> float:
         """Get currently elapsed play time since start of first move (open or mark).
@@ -506,10 +650,4 @@ class Gameboard:
         Returns:
             float: Play time in seconds.
         """
-        if self._start_time is None:
-            return 0.0
-
-        if self._stop_time is None:
-            return time.time() - self._start_time
-
-        return self._stop_time-self._start_time
+        return self._status.get_elapsed_time()
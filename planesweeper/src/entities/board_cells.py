@@ -0,0 +1,603 @@
+import random
+from primitives.position import Position
+from entities.board_piece import BoardPiece, BoardPieceType, PieceState
+from entities.neighbour_table import NeighbourTable
+from entities.reveal_engine import RevealEngine
+from entities.empty_regions import EmptyRegions
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+EMPTY = BoardPieceType.EMPTY.value
+PLANE = BoardPieceType.PLANE.value
+NUMBER = BoardPieceType.NUMBER.value
+
+# below this many cells NumPy's call overhead outweighs batched calculation
+BATCHED_MIN_CELLS = 128
+
+
+def sample_indexes(total: int, count: int, excluded: set[int] = None,
+                   seed: int = None) -> list[int]:
+    """Pick random cell indexes without repeats, uniformly over all allowed cells.
+
+    Args:
+        total (int): Number of cells to pick from (indexes 0 to total-1).
+        count (int): Number of indexes to pick.
+        excluded (set[int], optional): Indexes which must not be picked.
+            Defaults to None.
+        seed (int, optional): Seed for the random generator, the same seed always
+            picks the same indexes for the same arguments. Defaults to None.
+
+    Returns:
+        list[int]: Picked indexes.
+    """
+    if excluded is None:
+        excluded = set()
+
+    # sampling excluded cells' worth extra and dropping the excluded ones keeps the
+    # result uniformly random over the allowed cells without listing them all
+    sample_size = min(total, count + len(excluded))
+
+    if numpy is not None:
+        candidates = numpy.random.default_rng(seed).choice(total, sample_size,
+                                                           replace=False)
+        if len(excluded) > 0:
+            candidates = candidates[~numpy.isin(candidates, list(excluded))]
+
+        return candidates[:count].tolist()
+
+    candidates = random.Random(seed).sample(range(0, total), sample_size)
+
+    return [index for index in candidates if index not in excluded][:count]
+
+def is_numpy_available() -> bool:
+    """Check if NumPy is installed for batched array operations.
+
+    Returns:
+        bool: True if NumPy can be used, False otherwise
+    """
+    return numpy is not None
+
+class CellCounts:
+    """Numbers of opened, marked and closed non-plane cells of a cell storage, kept up
+        to date as cells change so that they never need a scan of the board.
+
+    Attributes:
+        opened (int): Opened cells.
+        marked (int): Marked cells.
+        closed_safe (int): Closed cells which are not planes.
+    """
+    def __init__(self, opened: int = 0, marked: int = 0, closed_safe: int = 0):
+        self.opened: int = opened
+        self.marked: int = marked
+        self.closed_safe: int = closed_safe
+
+    def as_tuple(self) -> tuple[int, int, int]:
+        """Get the counts together.
+
+        Returns:
+            tuple[int, int, int]: Opened, marked and closed non-plane cells
+        """
+        return (self.opened, self.marked, self.closed_safe)
+
+class BoardCells:
+    """Compact storage for gameboard's per-cell state.
+        Instead of one piece object per cell, cell type, number of surrounding planes,
+        open flag and mark flag are kept in flat byte arrays indexed as y * width + x.
+        If NumPy is installed, the arrays can also be accessed as zero-copy NumPy arrays
+        for batched operations.
+
+    Attributes:
+        neighbours (NeighbourTable): Neighbour indexes of each cell, also telling
+            board's width and height.
+        types (bytearray): BoardPieceType value of each cell.
+        numbers (bytearray): Number of surrounding planes of each cell.
+        opened (bytearray): 1 for opened cells, 0 otherwise.
+        marked (bytearray): 1 for marked cells, 0 otherwise.
+        counts (CellCounts): Numbers of opened, marked and closed non-plane cells,
+            kept up to date by open(), mark() and unmark(), so cells must only be
+            changed through them. Counts must not be modified.
+    """
+    def __init__(self, width: int, height: int):
+        """Initialize empty (all cells closed, unmarked and without planes) storage.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        self.neighbours = self._create_neighbours(width, height)
+
+        total = width * height
+
+        self.types = self._create_array(total)
+        self.numbers = self._create_array(total)
+        self.opened = self._create_array(total)
+        self.marked = self._create_array(total)
+
+        self.counts = CellCounts(closed_safe=total)
+        # empty areas labelled when planes are placed, None for storages opening
+        # empty areas by searching
+        self._regions: EmptyRegions = None
+
+    def __len__(self):
+        return self.width * self.height
+
+    @property
+    def width(self) -> int:
+        return self.neighbours.width
+
+    @property
+    def height(self) -> int:
+        return self.neighbours.height
+
+    @staticmethod
+    def _create_neighbours(width: int, height: int):
+        return NeighbourTable.get(width, height)
+
+    def _create_array(self, length: int):
+        return bytearray(length)
+
+    def as_array(self, data: bytearray):
+        """Get one of the storage's byte arrays as a zero-copy two-dimensional
+            (height x width) NumPy array. Changes to the returned array are
+            reflected in the storage and vice versa.
+
+        Args:
+            data (bytearray): Storage array (types, numbers, opened or marked)
+
+        Returns:
+            numpy.ndarray: Array view or None if NumPy is not installed
+        """
+        if numpy is None:
+            return None
+
+        return numpy.frombuffer(data, dtype=numpy.uint8).reshape(self.height, self.width)
+
+    def _calculate_numbers_per_cell(self, plane_indexes: list[int]):
+        types = self.types
+        numbers = self.numbers
+
+        types[:] = bytes(len(types))
+
+        for index in plane_indexes:
+            types[index] = PLANE
+
+        for index, piece_type in enumerate(types):
+            if piece_type == PLANE:
+                numbers[index] = 0
+                continue
+
+            planes = 0
+
+            for neighbour in self.neighbours.neighbours(index):
+                if types[neighbour] == PLANE:
+                    planes += 1
+
+            types[index] = EMPTY if planes == 0 else NUMBER
+            numbers[index] = planes
+
+    def _calculate_numbers_batched(self, planes):
+        # planes on a grid with an extra row and column of zeros on every side, so that
+        # board edges need no bounds checks
+        padded = numpy.zeros((self.height + 2, self.width + 2), dtype=numpy.uint8)
+        padded[1:-1, 1:-1] = planes
+        is_plane = planes.view(numpy.bool_)
+
+        # sum of 3x3 neighbourhood for every cell at once, summing rows of three first
+        # and then three of those rows; plane's own cell is only counted for planes
+        rows = padded[:, :-2] + padded[:, 1:-1]
+        rows += padded[:, 2:]
+        counts = rows[:-2] + rows[1:-1]
+        counts += rows[2:]
+        counts[is_plane] = 0
+
+        # EMPTY is zero, so only numbers and planes need to be set
+        types = self.as_array(self.types)
+        numpy.multiply(counts > 0, NUMBER, out=types, casting="unsafe")
+        types[is_plane] = PLANE
+
+        self.as_array(self.numbers)[:] = counts
+
+    def _get_plane_array(self, plane_indexes: list[int]):
+        planes = numpy.zeros(len(self), dtype=numpy.uint8)
+        planes[numpy.asarray(plane_indexes, dtype=numpy.intp)] = 1
+
+        return planes.reshape(self.height, self.width)
+
+    def place_planes(self, plane_indexes: list[int], batched: bool = None):
+        """Place planes into given cells and calculate type and number of surrounding
+            planes for all other cells. Any previous plane placement is overwritten,
+            marks are kept. Must not be called after cells have been opened.
+
+        Args:
+            plane_indexes (list[int]): Indexes of cells containing plane
+            batched (bool, optional): Calculate numbers for all cells in one batched
+                NumPy operation (True) or cell by cell (False).
+                Defaults to None which uses batched calculation if NumPy is installed
+                and the board is large enough for it to be faster.
+        """
+        if batched is None:
+            batched = numpy is not None and len(self) >= BATCHED_MIN_CELLS
+
+        if batched:
+            self._calculate_numbers_batched(self._get_plane_array(plane_indexes))
+        else:
+            self._calculate_numbers_per_cell(plane_indexes)
+
+        self.counts.closed_safe = len(self) - len(plane_indexes)
+        self._regions = EmptyRegions(self.types, self.width, self.height)
+
+    def get_type(self, index: int) -> BoardPieceType:
+        """Get cell's type.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            BoardPieceType: Type (plane, number, empty)
+        """
+        return BoardPieceType(self.types[index])
+
+    def get_number(self, index: int) -> int:
+        """Get number of planes surrounding the cell.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            int: Number of surrounding planes for number cells, None otherwise
+        """
+        if self.types[index] != NUMBER:
+            return None
+
+        return self.numbers[index]
+
+    def is_open(self, index: int) -> bool:
+        """Has cell been opened?
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            bool: True if cell has been opened, False otherwise
+        """
+        return self.opened[index] == 1
+
+    def is_marked(self, index: int) -> bool:
+        """Has cell been marked as radar contact?
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            bool: True if cell has been marked, False otherwise
+        """
+        return self.marked[index] == 1
+
+    def get_state(self, index: int) -> int:
+        """Get cell's visual state.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            int: PieceState of the cell
+        """
+        if self.marked[index]:
+            return PieceState.MARKED
+
+        if not self.opened[index]:
+            return PieceState.CLOSED
+
+        cell_type = self.types[index]
+
+        if cell_type == NUMBER:
+            return PieceState.of_number(self.numbers[index])
+
+        return PieceState.PLANE if cell_type == PLANE else PieceState.EMPTY
+
+    def open(self, index: int) -> bool:
+        """Open the cell, can only be done for cells that are closed and unmarked.
+
+        Args:
+            index (int): Cell index
+
+        Returns:
+            bool: False if opened cell was plane,
+                True otherwise or if cell was already open or marked
+        """
+        if self.opened[index] or self.marked[index]:
+            return True
+
+        self.opened[index] = 1
+        self.counts.opened += 1
+
+        if self.types[index] == PLANE:
+            return False
+
+        self.counts.closed_safe -= 1
+
+        return True
+
+    def close_many(self, indexes: list[int]):
+        """Close opened cells again, reversing open() and reveal().
+
+        Args:
+            indexes (list[int]): Indexes of the cells to close. Closed cells are skipped.
+        """
+        opened = self.opened
+        types = self.types
+        counts = self.counts
+
+        for index in indexes:
+            if not opened[index]:
+                continue
+
+            opened[index] = 0
+            counts.opened -= 1
+
+            if types[index] != PLANE:
+                counts.closed_safe += 1
+
+    def mark(self, index: int):
+        """Mark the cell, can only be done for cells that are closed and unmarked.
+
+        Args:
+            index (int): Cell index
+        """
+        if self.opened[index] or self.marked[index]:
+            return
+
+        self.marked[index] = 1
+        self.counts.marked += 1
+
+    def unmark(self, index: int):
+        """Unmark the cell.
+
+        Args:
+            index (int): Cell index
+        """
+        if self.opened[index] or not self.marked[index]:
+            return
+
+        self.marked[index] = 0
+        self.counts.marked -= 1
+
+    def reveal(self, index: int) -> list[int]:
+        """Open a cell and, if the cell is empty, all empty cells connected to it and
+            their neighbours.
+
+        Args:
+            index (int): Index of the cell to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells, starting with the cell itself.
+                Empty if nothing was opened.
+        """
+        return self.reveal_many([index])
+
+    def reveal_many(self, indexes: list[int]) -> list[int]:
+        """Open several cells and the empty areas around them in one pass.
+
+        Args:
+            indexes (list[int]): Indexes of the cells to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells. Empty if nothing was opened.
+        """
+        if self._regions is None:
+            return RevealEngine(self).reveal_many(indexes)
+
+        revealed = []
+
+        for index in indexes:
+            revealed.extend(self._reveal_region(index))
+
+        return revealed
+
+    def _reveal_region(self, index: int) -> list[int]:
+        # opens the labelled region of an empty cell without searching it
+        if self.opened[index] or self.marked[index] or self.types[index] == PLANE:
+            return []
+
+        label = self._regions.labels[index]
+
+        if not label:
+            self.open(index)
+            return [index]
+
+        opened = self.opened
+        marked = self.marked
+        types = self.types
+        closed = []
+
+        for cell in self._regions.get_cells(label):
+            if not opened[cell] and not marked[cell]:
+                closed.append(cell)
+            elif types[cell] == EMPTY:
+                # open or marked empty cell may split the region, so its cells are
+                # searched as usual
+                return RevealEngine(self).reveal(index)
+
+        for cell in closed:
+            opened[cell] = 1
+
+        self.counts.opened += len(closed)
+        self.counts.closed_safe -= len(closed)
+        closed.remove(index)
+
+        return [index] + closed
+
+    def get_3bv(self) -> int:
+        """Get board's 3BV (Bechtel's Board Benchmark Value): least number of clicks
+            needed to open all cells without planes.
+
+        Returns:
+            int: 3BV of the board
+        """
+        if self._regions is not None:
+            return self._regions.get_3bv()
+
+        return EmptyRegions(bytes(self.types), self.width, self.height).get_3bv()
+
+    def is_cleared(self) -> bool:
+        """Check if every cell has been either opened or marked.
+
+        Returns:
+            bool: True if no cell is left closed and unmarked, False otherwise
+        """
+        # cell can't be both opened and marked, so all cells are handled when
+        # opened and marked cells together cover the whole board
+        return self.counts.opened + self.counts.marked >= len(self)
+
+    @staticmethod
+    def _pack_bits(values) -> bytes:
+        packed = bytearray((len(values) + 7) // 8)
+
+        for index, value in enumerate(values):
+            if value:
+                packed[index >> 3] |= 1 << (index & 7)
+
+        return bytes(packed)
+
+    @staticmethod
+    def _get_unpacked_indexes(packed, length: int) -> list[int]:
+        if numpy is not None:
+            bits = numpy.unpackbits(numpy.frombuffer(packed, dtype=numpy.uint8),
+                                    count=length, bitorder="little")
+            return numpy.flatnonzero(bits).tolist()
+
+        return [index for index in range(length) if packed[index >> 3] & (1 << (index & 7))]
+
+    def pack_flags(self) -> tuple[bytes, bytes, bytes]:
+        """Get plane, open and mark flags of all cells packed eight cells per byte,
+            the first cell in the lowest bit of the first byte.
+
+        Returns:
+            tuple[bytes, bytes, bytes]: Packed plane, open and mark flags
+        """
+        types = self.as_array(self.types)
+
+        if types is not None:
+            return tuple(numpy.packbits(flags, bitorder="little").tobytes()
+                         for flags in (types.ravel() == PLANE,
+                                       self.as_array(self.opened).ravel(),
+                                       self.as_array(self.marked).ravel()))
+
+        return (self._pack_bits([piece_type == PLANE for piece_type in self.types]),
+                self._pack_bits(self.opened), self._pack_bits(self.marked))
+
+    def unpack_flags(self, planes, opened, marked):
+        """Replace state of all cells with packed flags, as returned by pack_flags().
+            Types and numbers are calculated from the planes and counters from the flags.
+
+        Args:
+            planes: Buffer (bytes, bytearray or memoryview) of packed plane flags.
+            opened: Buffer of packed open flags.
+            marked: Buffer of packed mark flags.
+        """
+        length = len(self)
+
+        if numpy is not None:
+            # planes are unpacked straight into a mask instead of a list of indexes
+            self._calculate_numbers_batched(numpy.unpackbits(
+                numpy.frombuffer(planes, dtype=numpy.uint8), count=length,
+                bitorder="little").reshape(self.height, self.width))
+            self._regions = EmptyRegions(self.types, self.width, self.height)
+        else:
+            self.place_planes(self._get_unpacked_indexes(planes, length))
+
+        for flags, packed in ((self.opened, opened), (self.marked, marked)):
+            array = self.as_array(flags)
+
+            if array is not None:
+                array.ravel()[:] = numpy.unpackbits(numpy.frombuffer(packed, dtype=numpy.uint8),
+                                                    count=length, bitorder="little")
+                continue
+
+            flags[:] = bytes(length)
+
+            for index in self._get_unpacked_indexes(packed, length):
+                flags[index] = 1
+
+        self._set_counters_from_flags(planes, opened, marked)
+
+    def _set_counters_from_flags(self, planes, opened, marked):
+        plane_mask = int.from_bytes(planes, "little")
+        open_mask = int.from_bytes(opened, "little")
+
+        # only planes can be opened without being safe (on losing the game)
+        self.counts = CellCounts(open_mask.bit_count(),
+                                 int.from_bytes(marked, "little").bit_count(),
+                                 len(self) - plane_mask.bit_count() -
+                                 (open_mask & ~plane_mask).bit_count())
+
+    def _scan_counters(self) -> tuple[int, int, int]:
+        closed_safe = sum(1 for piece_type, opened in zip(self.types, self.opened)
+                          if piece_type != PLANE and not opened)
+
+        return (self.opened.count(1), self.marked.count(1), closed_safe)
+
+    def verify_counters(self):
+        """Compares opened, marked and closed non-plane cell counters against a full
+            scan of the cells. Intended for debugging only, as the scan goes through
+            the whole board.
+
+        Raises:
+            RuntimeError: If any of the counters differs from the scanned value.
+        """
+        scanned = self._scan_counters()
+        counted = self.counts.as_tuple()
+
+        if scanned != counted:
+            raise RuntimeError(f"Cell counters (opened, marked, closed non-plane) {counted} "
+                               f"do not match scanned values {scanned}")
+
+class BoardPieceView(BoardPiece):
+    """Board piece which does not hold state of its own but reads and writes the
+        state of a single cell in gameboard's cell storage. Views are only needed
+        for rendering and are created by the gameboard on demand.
+    """
+    __slots__ = ("_cells", "_index")
+
+    def __init__(self, piece_size: int, cells: BoardCells, index: int,
+                 initial_position: Position):
+        """Initialize view.
+
+        Args:
+            piece_size (int): Piece size in pixels
+            cells (BoardCells): Cell storage holding the piece's state
+            index (int): Index of the piece's cell in the storage
+            initial_position (Position): Drawing position of the piece
+        """
+        # type and number are read from the cells when needed
+        super().__init__(piece_size, None, None, initial_position)
+        self._cells = cells
+        self._index = index
+
+    def get_state(self) -> int:
+        return self._cells.get_state(self._index)
+
+    def get_type(self) -> BoardPieceType:
+        return self._cells.get_type(self._index)
+
+    def get_number(self) -> int:
+        return self._cells.get_number(self._index)
+
+    def is_marked(self) -> bool:
+        return self._cells.is_marked(self._index)
+
+    def is_open(self) -> bool:
+        return self._cells.is_open(self._index)
+
+    def open(self) -> bool:
+        return self._cells.open(self._index)
+
+    def mark(self):
+        self._cells.mark(self._index)
+
+    def unmark(self):
+        self._cells.unmark(self._index)
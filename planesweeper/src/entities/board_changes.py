@@ -0,0 +1,83 @@
+from entities.board_cells import BoardCells
+
+
+class BoardChange:
+    """Cells changed by one gameboard operation and their new visual state, so that
+        anything following the board only needs to handle the change instead of
+        reading the whole board again.
+
+    Attributes:
+        indexes (list[int]): Indexes of the changed cells.
+        states (bytes): PieceState of each changed cell after the operation, in the
+            same order as the indexes.
+        board_state (int): BoardState of the board after the operation.
+    """
+    def __init__(self, indexes: list[int], states: bytes, board_state: int):
+        self.indexes: list[int] = indexes
+        self.states: bytes = states
+        self.board_state: int = board_state
+
+    @classmethod
+    def read(cls, cells: BoardCells, indexes: list[int], board_state: int) -> "BoardChange":
+        """Create change of cells as they are now.
+
+        Args:
+            cells (BoardCells): Board's cell storage.
+            indexes (list[int]): Indexes of the changed cells.
+            board_state (int): BoardState of the board.
+
+        Returns:
+            BoardChange: Change with the current state of the cells
+        """
+        return cls(indexes, bytes(cells.get_state(index) for index in indexes), board_state)
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __iter__(self):
+        return zip(self.indexes, self.states)
+
+class ChangePublisher:
+    """Subscribers following changes made to a gameboard's cells. After every open,
+        chord, mark, undo and redo changing any cells, each subscriber is called with
+        a BoardChange holding the changed cells. Creating the board again is not
+        reported, the whole board changes then.
+    """
+    def __init__(self):
+        self._subscribers: list = []
+
+    def subscribe(self, subscriber):
+        """Follow changes made to the board's cells.
+
+        Args:
+            subscriber: Callable taking a BoardChange.
+        """
+        self._subscribers.append(subscriber)
+
+    def unsubscribe(self, subscriber):
+        """Stop following changes made to the board.
+
+        Args:
+            subscriber: Callable given to subscribe().
+        """
+        self._subscribers.remove(subscriber)
+
+    def publish(self, cells: BoardCells, board_state: int, *changed: list[int]):
+        """Send cells changed by an operation to the subscribers.
+
+        Args:
+            cells (BoardCells): Board's cell storage.
+            board_state (int): BoardState of the board after the operation.
+            *changed (list[int]): Lists of indexes of the changed cells, None or
+                empty lists for kinds of changes the operation did not make.
+        """
+        # change is only read, and lists of changed cells joined, when someone
+        # follows the board
+        if not self._subscribers or not any(changed):
+            return
+
+        indexes = [index for part in changed if part for index in part]
+        change = BoardChange.read(cells, indexes, board_state)
+
+        for subscriber in tuple(self._subscribers):
+            subscriber(change)
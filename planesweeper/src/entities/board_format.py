@@ -0,0 +1,124 @@
+import struct
+from primitives.size import Size
+
+
+MAGIC = b"PSWB"
+VERSION = 1
+
+# magic, version, level, width, height, planes, seed, state, flags, elapsed play time
+HEADER = struct.Struct("<4sBBHHIQBBd")
+
+FLAG_PLANES_PLACED = 1
+FLAG_SAFE_AREA = 2
+FLAG_CLOCK_STARTED = 4
+FLAG_BITBOARD = 8
+# set by pack_board() when the header has a seed, as any value of the field is valid
+FLAG_SEEDED = 16
+FLAG_FIRST_OPENED = 32
+
+
+class BoardHeader:
+    """Header of a serialized gameboard.
+
+    Attributes:
+        level (int): Level, 0 for custom board.
+        size (Size): Board size in pieces.
+        planes (int): Number of planes.
+        seed (int): Seed used for placing the planes, None if board has no seed.
+        state (int): BoardState value, defaults to 0 (running).
+        flags (int): Combination of FLAG_* values, defaults to 0.
+        elapsed (float): Elapsed play time in seconds, defaults to 0.
+    """
+    def __init__(self, level: int, size: Size, planes: int, seed: int):
+        """Initialize header of a running board with no flags set.
+
+        Args:
+            level (int): Level, 0 for custom board.
+            size (Size): Board size in pieces.
+            planes (int): Number of planes.
+            seed (int): Seed used for placing the planes, None if board has no seed.
+        """
+        self.level: int = level
+        self.size: Size = size
+        self.planes: int = planes
+        self.seed: int = seed
+        self.state: int = 0
+        self.flags: int = 0
+        self.elapsed: float = 0.0
+
+def get_flags_length(size: Size) -> int:
+    """Get length of packed flags of a board.
+
+    Args:
+        size (Size): Board size in pieces.
+
+    Returns:
+        int: Bytes needed for one flag of every piece
+    """
+    return (size.width * size.height + 7) // 8
+
+def pack_board(header: BoardHeader, planes: bytes, opened: bytes, marked: bytes) -> bytes:
+    """Encode gameboard into binary format: header followed by packed plane, open and
+        mark flags of all pieces, eight pieces per byte.
+
+    Args:
+        header (BoardHeader): Board's header.
+        planes (bytes): Packed plane flags.
+        opened (bytes): Packed open flags.
+        marked (bytes): Packed mark flags.
+
+    Returns:
+        bytes: Encoded board
+    """
+    seeded = header.seed is not None
+
+    return b"".join((HEADER.pack(MAGIC, VERSION, header.level, header.size.width,
+                                 header.size.height, header.planes,
+                                 header.seed if seeded else 0, header.state,
+                                 header.flags | FLAG_SEEDED if seeded else header.flags,
+                                 header.elapsed),
+                     planes, opened, marked))
+
+def unpack_board(data) -> tuple[BoardHeader, memoryview, memoryview, memoryview]:
+    """Decode gameboard from binary format without copying the packed flags.
+
+    Args:
+        data: Encoded board as bytes, bytearray or memoryview.
+
+    Raises:
+        ValueError: Data is not an encoded board, is of unsupported version or
+            is truncated.
+
+    Returns:
+        tuple[BoardHeader, memoryview, memoryview, memoryview]: Header and views of
+            packed plane, open and mark flags within the data
+    """
+    view = memoryview(data)
+
+    if len(view) < HEADER.size:
+        raise ValueError("Data is too short for a board")
+
+    magic, version, level, width, height, planes, seed, state, flags, elapsed =\
+        HEADER.unpack_from(view)
+
+    if magic != MAGIC:
+        raise ValueError("Data is not a board")
+
+    if version != VERSION:
+        raise ValueError(f"Unsupported board format version {version}")
+
+    header = BoardHeader(level, Size(width, height), planes,
+                         seed if flags & FLAG_SEEDED else None)
+    header.state = state
+    header.flags = flags & ~FLAG_SEEDED
+    header.elapsed = elapsed
+
+    length = get_flags_length(header.size)
+
+    if len(view) != HEADER.size + 3 * length:
+        raise ValueError("Board data has incorrect length")
+
+    return (header,
+            view[HEADER.size:HEADER.size + length],
+            view[HEADER.size + length:HEADER.size + 2 * length],
+            view[HEADER.size + 2 * length:])
@@ -0,0 +1,184 @@
+from primitives.interfaces import RenderedObject
+from primitives.position import Position
+from primitives.size import Size
+from primitives.color import Color
+from entities.board_piece import BoardPiece
+from entities.board_cells import BoardCells, BoardPieceView
+from entities.ui.board_grid_line import BoardGridLine
+from entities.ui.probability_tint import ProbabilityTint
+
+
+class BoardLayout:
+    """Gameboard's pieces laid out on the container UI element: board's position, size
+        of the pieces in pixels and UI items drawn for the board. Piece objects are only
+        needed for rendering, so they are created on first use.
+    """
+    def __init__(self, size: Size, piece_in_pixels: int):
+        """Initialize layout at the top-left corner of the container.
+
+        Args:
+            size (Size): Board's size in pieces.
+            piece_in_pixels (int): Width and height of a piece in pixels.
+        """
+        self._size = size
+        self._piece_in_pixels = piece_in_pixels
+        self._offset: Position = Position(0,0)
+        self._cells: BoardCells = None
+        self._piece_views: list[BoardPiece] = None
+        self._grid_lines: list[BoardGridLine] = None
+
+    def set_cells(self, cells: BoardCells):
+        """Lay out pieces of new cell storage, when the board is created again.
+
+        Args:
+            cells (BoardCells): Board's cell storage.
+        """
+        self._cells = cells
+        self._piece_views = None
+
+    def get_pieces(self) -> list[BoardPiece]:
+        """Get piece objects of all cells, creating them on first use.
+
+        Returns:
+            list[BoardPiece]: Pieces in cell index order
+        """
+        if self._piece_views is None:
+            self._piece_views = [
+                BoardPieceView(self._piece_in_pixels, self._cells, index,
+                               self._calculate_drawing_position(index))
+                for index in range(len(self._cells))]
+
+        return self._piece_views
+
+    def get_piece_in_pixels(self) -> int:
+        """Get width and height of a piece.
+
+        Returns:
+            int: Size in pixels
+        """
+        return self._piece_in_pixels
+
+    def _calculate_drawing_position(self, index: int) -> Position:
+        y_pos, x_pos = divmod(index, self._size.width)
+
+        return Position(self._offset.x + x_pos * self._piece_in_pixels,
+                        self._offset.y + y_pos * self._piece_in_pixels)
+
+    def change_position(self, draw_at: Position):
+        """Changes this board's relative position on the container UI element.
+
+        Args:
+            draw_at (Position): New top-left position from which to draw board and its elements
+        """
+        self._offset = draw_at
+
+        if self._piece_views is not None:
+            for index, piece in enumerate(self._piece_views):
+                piece.change_position(self._calculate_drawing_position(index))
+
+        self._grid_lines = None
+
+    def get_position(self) -> Position:
+        """Gets this board's top-left position on the container UI element.
+
+        Returns:
+            Position: Position from which board and its elements are drawn
+        """
+        return self._offset
+
+    def translate_event_position_to_piece_position(self,
+            event_position: Position) -> Position:
+        """Converts event's (e.g. mouse click) pixel position into game board
+            piece's X,Y coordinate.
+
+        Args:
+            event_position (Position): Pixel position of the event
+
+        Returns:
+            Position: X,Y coordinate representing game piece on board or None if
+                event position is outside the board's pieces
+        """
+        event_x = event_position.x - self._offset.x
+        event_y = event_position.y - self._offset.y
+
+        if event_x < 0 or event_y < 0:
+            return None  # out of bounds
+
+        piece_pixels = self._piece_in_pixels
+
+        if event_x > piece_pixels * self._size.width or\
+            event_y > piece_pixels * self._size.height:
+            return None  # out of bounds
+
+        x_pos = event_x // piece_pixels
+        y_pos = event_y // piece_pixels
+
+        if x_pos >= self._size.width or y_pos >= self._size.height:
+            return None  # out of bounds
+
+        return Position(x_pos, y_pos)
+
+    def get_dimensions(self) -> Size:
+        """Get gameboard's current size.
+
+        Returns:
+            Size: Current size in pixels
+        """
+        return Size(self._size.width * self._piece_in_pixels,
+                    self._size.height * self._piece_in_pixels)
+
+    def get_piece_dimensions(self) -> Size:
+        """Get gameboard's pieces current size.
+
+        Returns:
+            Size: Individual piece's size in pixels
+        """
+        return Size(self._piece_in_pixels, self._piece_in_pixels)
+
+    def _recalculate_grid(self):
+        self._grid_lines = []
+
+        pixels = self._piece_in_pixels
+
+        width = pixels * self._size.width
+        height = pixels * self._size.height
+
+        color = Color(200, 200, 200)
+
+        for y_pos in range(0, height+1, pixels):
+            self._grid_lines.append(BoardGridLine(
+                Position(self._offset.x, self._offset.y + y_pos),
+                Position(self._offset.x + width, self._offset.y + y_pos),
+                color))
+
+        for x_pos in range(0, width+1, pixels):
+            self._grid_lines.append(BoardGridLine(
+                Position(self._offset.x + x_pos, self._offset.y),
+                Position(self._offset.x + x_pos, self._offset.y + height),
+                color))
+
+    def get_rendering_items(self) -> list[RenderedObject]:
+        """Gets all UI items of the board (pieces and underlying grid).
+
+        Returns:
+            list[RenderedObject]: UI items
+        """
+        if self._grid_lines is None:
+            self._recalculate_grid()
+
+        return self._grid_lines + self.get_pieces()
+
+    def get_probability_tints(self, probabilities: dict[int, float]) -> list[RenderedObject]:
+        """Gets UI items tinting closed pieces by their probability of having a plane.
+
+        Args:
+            probabilities (dict[int, float]): Probability by piece index.
+
+        Returns:
+            list[RenderedObject]: UI items to draw over the pieces
+        """
+        marked = self._cells.marked
+
+        return [ProbabilityTint(self._calculate_drawing_position(index),
+                                self._piece_in_pixels, probability)
+                for index, probability in probabilities.items() if not marked[index]]
@@ -11,6 +11,21 @@ class BoardPieceType(Enum):
     PLANE = 1
     NUMBER = 2
 
+class PieceState:
+    """Visual state of a piece as a small integer: closed, marked or opened piece of
+        each type, numbers having one state for each number from 1 to 8.
+    """
+    CLOSED = 0
+    MARKED = 1
+    PLANE = 2
+    EMPTY = 3
+    # number 1, followed by numbers 2-8
+    NUMBER = 4
+
+    @staticmethod
+    def of_number(number: int) -> int:
+        return PieceState.NUMBER + number - 1
+
 class BoardPiece(RenderedObject):
     """Represents an UI object for gameboard's single piece/square.
         Board piece can exist in unopened, marked or opened state and is
@@ -18,8 +33,17 @@ class BoardPiece(RenderedObject):
         - Plane
         - Number
         - Empty
+
+        Pieces are slotted and share their assets: each piece size has one table of
+        assets indexed by PieceState, built when the first piece of the size is created.
     """
-    cached_assets = {}
+    __slots__ = ("_type", "_size", "_open", "_marked", "_number", "_assets")
+
+    # piece sizes in pixels gameboards use
+    PIXEL_SIZES = (15, 20, 25)
+
+    # assets of each piece size indexed by PieceState, None for opened empty pieces
+    asset_tables: dict[int, tuple[Asset]] = {}
 
     def __init__(self, piece_size: int, piece_type: BoardPieceType, data,
                  initial_position: Position):
@@ -29,40 +53,59 @@ class BoardPiece(RenderedObject):
         self._size = piece_size
         self._open = False
         self._marked = False
+        self._number = data if self._type == BoardPieceType.NUMBER else None
+        self._assets = BoardPiece.get_asset_table(piece_size)
 
-        if self._type == BoardPieceType.NUMBER:
-            self._number = data
+    @staticmethod
+    def get_asset_table(piece_size: int) -> tuple[Asset]:
+        """Get assets of pieces of a size.
 
-    def get_asset(self) -> Asset:
-        """Get piece's asset image to render based on the current state and type of the 
-            piece (radar contact, plane, number, empty).
+        Args:
+            piece_size (int): Piece size in pixels.
 
         Returns:
-            Asset: Asset to render for piece
+            tuple[Asset]: Asset for each PieceState, None for opened empty pieces
         """
-        pixel_size = self._size
-        asset = None
+        table = BoardPiece.asset_tables.get(piece_size)
+
+        if table is None:
+            names = [f"unopened-{piece_size}.png", f"radar-{piece_size}.png",
+                     f"plane-{piece_size}.png", None]
+            names.extend(f"number_{number}-{piece_size}.png" for number in range(1, 9))
 
-        if self._marked:
-            asset = f"radar-{pixel_size}.png"
-        elif not self._open:
-            asset = f"unopened-{pixel_size}.png"
-        elif self._type == BoardPieceType.PLANE:
-            asset = f"plane-{pixel_size}.png"
-        elif self._type == BoardPieceType.NUMBER:
-            asset = f"number_{self._number}-{pixel_size}.png"
+            table = tuple(AssetService.get_asset(name) if name is not None else None
+                          for name in names)
+            BoardPiece.asset_tables[piece_size] = table
 
-        if asset is not None:
-            if asset in BoardPiece.cached_assets:
-                return BoardPiece.cached_assets[asset]
+        return table
 
-            resolved = AssetService.get_asset(asset)
+    def get_state(self) -> int:
+        """Get piece's visual state.
+
+        Returns:
+            int: PieceState of the piece
+        """
+        if self.is_marked():
+            return PieceState.MARKED
 
-            BoardPiece.cached_assets[asset] = resolved
+        if not self.is_open():
+            return PieceState.CLOSED
 
-            return resolved
+        piece_type = self.get_type()
 
-        return None
+        if piece_type == BoardPieceType.NUMBER:
+            return PieceState.of_number(self.get_number())
+
+        return PieceState.PLANE if piece_type == BoardPieceType.PLANE else PieceState.EMPTY
+
+    def get_asset(self) -> Asset:
+        """Get piece's asset image to render based on the current state and type of the 
+            piece (radar contact, plane, number, empty).
+
+        Returns:
+            Asset: Asset to render for piece
+        """
+        return self._assets[self.get_state()]
 
     def get_dimensions(self) -> Size:
         """Get piece's current size.
@@ -96,6 +139,14 @@ class BoardPiece(RenderedObject):
         """
         return self._type
 
+    def get_number(self) -> int:
+        """Get number of planes surrounding the piece.
+
+        Returns:
+            int: Number of surrounding planes for number pieces, None otherwise
+        """
+        return self._number
+
     def open(self) -> bool:
         """Open the piece, can only be done for pieces that are closed and unmarked.
 
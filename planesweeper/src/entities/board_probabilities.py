@@ -0,0 +1,187 @@
+import math
+from entities.board import Gameboard
+from entities.board_solver import BoardSolver, ComponentEnumerator, SolverRule, \
+    UNKNOWN, OPEN, SAFE
+
+
+def _binomial(count: int, chosen: int) -> int:
+    return math.comb(count, chosen) if chosen >= 0 else 0
+
+def _add_group(prefix: dict[int, int], distribution: dict[int, int],
+               remaining: int) -> dict[int, int]:
+    # placements of the groups so far and one more group by number of planes used
+    combined = {}
+
+    for used, count in prefix.items():
+        for planes, placements in distribution.items():
+            if used + planes <= remaining:
+                combined[used + planes] = combined.get(used + planes, 0) + count * placements
+
+    return combined
+
+def get_component_weights(distributions: list[dict[int, int]], interior: int,
+                          remaining: int) -> tuple[int, list[dict[int, int]], int]:
+    """Combine independent groups of frontier cells with the cells away from the frontier.
+        Each group's placements are weighted by the placements of the other groups and
+        the number of ways to put the rest of the board's planes on the interior cells.
+
+    Args:
+        distributions (list[dict[int, int]]): For each group, number of placements by
+            number of planes in the group.
+        interior (int): Number of unknown cells not next to any opened number.
+        remaining (int): Number of the board's planes not marked or deduced yet.
+
+    Returns:
+        tuple[int, list[dict[int, int]], int]: Number of placements on the whole board,
+            for each group weight of a placement by its number of planes, and number of
+            placements on the whole board having a plane in any one interior cell
+    """
+    # placements of the groups before each group by number of planes used
+    prefixes = [{0: 1}]
+
+    for distribution in distributions:
+        prefixes.append(_add_group(prefixes[-1], distribution, remaining))
+
+    # ways to complete the board after the groups so far have used a number of planes,
+    # built backwards from the interior cells
+    tail = {used: _binomial(interior, remaining - used) for used in prefixes[-1]}
+    weights = [None] * len(distributions)
+
+    for position in range(len(distributions) - 1, -1, -1):
+        distribution = distributions[position]
+        prefix = prefixes[position]
+
+        weights[position] = {planes: sum(count * tail.get(used + planes, 0)
+                                         for used, count in prefix.items())
+                             for planes in distribution}
+
+        tail = {used: sum(placements * tail.get(used + planes, 0)
+                          for planes, placements in distribution.items())
+                for used in prefix}
+
+    interior_occurrences = sum(count * _binomial(interior - 1, remaining - used - 1)
+                          for used, count in prefixes[-1].items()) if interior > 0 else 0
+
+    return (tail.get(0, 0), weights, interior_occurrences)
+
+class PlaneProbabilities:
+    """Exact probability of each closed piece having a plane, given the numbers and
+        the total number of planes a player sees. Every placement of the remaining planes
+        agreeing with the opened numbers is counted as equally likely.
+
+        Closed cells next to opened numbers are split into independent groups that
+        are enumerated separately, and cells away from the numbers are counted with
+        binomial coefficients only, so the cost depends on the frontier and not on the
+        size of the board. Group enumerations are kept between calls, so after a piece
+        is opened or marked only the groups it changed are enumerated again.
+    """
+    # a group of frontier cells is enumerated for at most this many search steps,
+    # after which its cells are counted as if they were away from the numbers
+    MAX_SEARCH_NODES = 50000
+
+    def __init__(self, game: Gameboard, trust_marks: bool = False):
+        """Initialize probabilities for a gameboard.
+
+        Args:
+            game (Gameboard): Board to follow through its later changes.
+            trust_marks (bool, optional): Treat marked pieces as planes. Defaults to False,
+                giving probabilities for marked pieces as well.
+        """
+        self._solver = BoardSolver(game, trust_marks)
+        # enumerated groups of the latest calculation by their cells and numbers
+        self._components: dict[tuple, tuple[ComponentEnumerator, dict[int, int]]] = {}
+        self._probabilities: dict[int, float] = None
+        self._exact = True
+
+    def _enumerate_components(self, remaining: int) -> list[tuple]:
+        components = {}
+        enumerated = []
+
+        for cells, constraints in self._solver.get_frontier_components():
+            # the board's remaining planes only limit placements of fewer cells
+            key = (min(remaining, len(cells)), frozenset(cells),
+                   frozenset((missing, tuple(members)) for missing, members in constraints))
+
+            if key in self._components:
+                component = self._components[key]
+            else:
+                enumerator = ComponentEnumerator(cells, constraints)
+                component = (enumerator, enumerator.count(
+                    remaining, PlaneProbabilities.MAX_SEARCH_NODES))
+
+            components[key] = component
+            enumerated.append(component)
+
+        # groups no longer on the board are forgotten
+        self._components = components
+
+        return enumerated
+
+    def _calculate(self) -> dict[int, float]:
+        solver = self._solver
+        # cheap deductions first, cells solved by them need no enumeration and groups
+        # split where they are solved
+        while not solver.step(SolverRule.PAIR).is_empty():
+            pass
+
+        remaining = solver.get_remaining_planes()
+        components = [(enumerator, counts) for enumerator, counts in
+                      self._enumerate_components(remaining) if counts is not None]
+        frontier = sum(len(enumerator.cells) for enumerator, _ in components)
+        interior = solver.get_unknown_count() - frontier
+
+        self._exact = len(components) == len(self._components)
+
+        total, weights, interior_occurrences = get_component_weights(
+            [counts for _, counts in components], interior, remaining)
+
+        if total == 0:
+            # no placement agrees with the numbers and trusted marks
+            return {}
+
+        frontier_probabilities = {}
+
+        for (enumerator, _), component_weights in zip(components, weights):
+            occurrences = enumerator.get_occurrences(component_weights)
+            frontier_probabilities.update(
+                (index, count / total) for index, count in zip(enumerator.cells, occurrences))
+
+        return self._get_closed_probabilities(frontier_probabilities,
+                                              interior_occurrences / total)
+
+    def _get_closed_probabilities(self, frontier_probabilities: dict[int, float],
+                                  interior_probability: float) -> dict[int, float]:
+        probabilities = {}
+
+        for index, state in enumerate(self._solver.get_states()):
+            if state == UNKNOWN:
+                probabilities[index] = frontier_probabilities.get(index, interior_probability)
+            elif state == SAFE:
+                probabilities[index] = 0.0
+            elif state != OPEN:
+                probabilities[index] = 1.0
+
+        return probabilities
+
+    def get_probabilities(self) -> dict[int, float]:
+        """Get probability of a plane for each closed piece. Changes made to the board
+            since the previous call are read first. Returned values must not be modified.
+
+        Returns:
+            dict[int, float]: Probability between 0 and 1 by piece index (y * width + x).
+                Empty if no placement of planes agrees with the board, which can only
+                happen when wrong marks are trusted.
+        """
+        if self._solver.update() or self._probabilities is None:
+            self._probabilities = self._calculate()
+
+        return self._probabilities
+
+    def is_exact(self) -> bool:
+        """Were all frontier groups enumerated in the latest calculation? Groups with too
+            many placements are counted as if their cells were away from the numbers.
+
+        Returns:
+            bool: True if the probabilities are exact, False otherwise
+        """
+        return self._exact
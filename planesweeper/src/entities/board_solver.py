@@ -0,0 +1,975 @@
+import math
+from collections import deque
+from primitives.position import Position
+from entities.board import Gameboard, BoardState
+from entities.board_cells import PLANE as PLANE_TYPE
+
+
+# solver's knowledge of a cell
+UNKNOWN = 0
+OPEN = 1
+SAFE = 2
+PLANE = 3
+MARKED = 4
+
+# packed flags are compared in blocks of this many bytes to find changed cells
+SYNC_BLOCK_BYTES = 64
+
+
+class SolverRule:
+    """Deduction rules in the order the solver tries them, cheapest first.
+    """
+    NONE = 0
+    SINGLE = 1
+    PAIR = 2
+    ENUMERATION = 3
+
+class Deduction:
+    """Cells proven safe or to contain a plane by one solver step.
+
+    Attributes:
+        rule (int): SolverRule used, SolverRule.NONE if nothing could be deduced.
+        safe (list[int]): Indexes of cells proven safe.
+        planes (list[int]): Indexes of cells proven to contain a plane.
+    """
+    def __init__(self, rule: int, safe: list[int], planes: list[int]):
+        self.rule: int = rule
+        self.safe: list[int] = safe
+        self.planes: list[int] = planes
+
+    def is_empty(self) -> bool:
+        """Was nothing deduced?
+
+        Returns:
+            bool: True if no cells were proven safe or to contain a plane
+        """
+        return len(self.safe) == 0 and len(self.planes) == 0
+
+def get_changed_indexes(old: bytes, new: bytes) -> list[int]:
+    """Compare two sets of flags packed eight cells per byte.
+
+    Args:
+        old (bytes): Previous packed flags.
+        new (bytes): Current packed flags of the same length.
+
+    Returns:
+        list[int]: Indexes of cells whose flag differs, in ascending order
+    """
+    changed = []
+
+    for start in range(0, len(new), SYNC_BLOCK_BYTES):
+        end = start + SYNC_BLOCK_BYTES
+
+        if old[start:end] == new[start:end]:
+            continue
+
+        diff = int.from_bytes(old[start:end], "little") ^ int.from_bytes(new[start:end], "little")
+
+        while diff:
+            lowest = diff & -diff
+            changed.append(start * 8 + lowest.bit_length() - 1)
+            diff ^= lowest
+
+    return changed
+
+class ComponentEnumerator:
+    """Exact counting of all plane placements of one independent group of frontier
+        cells, the closed cells next to opened numbers. Cells touching exactly the same
+        numbers are interchangeable, so instead of single cells the counting assigns
+        a number of planes to each such set of cells and counts the placements within
+        the set with a binomial coefficient.
+
+        Sets are gone through one at a time, and partial placements that leave the
+        same planes missing from the numbers shared with the sets still ahead, and have
+        the same number of planes so far, are counted together. Along a frontier only
+        a few numbers are shared at a time, so the work grows with the length of the
+        frontier even when the number of placements grows exponentially.
+    """
+    def __init__(self, cells: list[int], constraints: list[tuple[int, list[int]]]):
+        """Initialize enumeration.
+
+        Args:
+            cells (list[int]): Cell indexes of the group.
+            constraints (list[tuple[int, list[int]]]): Number of planes still missing
+                and the group's cells for each number touching the group.
+        """
+        cell_constraints = {index: [] for index in cells}
+
+        for constraint, (_, members) in enumerate(constraints):
+            for index in members:
+                cell_constraints[index].append(constraint)
+
+        sets = {}
+
+        for index in cells:
+            sets.setdefault(tuple(cell_constraints[index]), []).append(index)
+
+        set_constraints = list(sets.keys())
+        order = self._order_sets(set_constraints)
+
+        self.cells: list[int] = cells
+        self._sets = [sets[set_constraints[position]] for position in order]
+        self._steps = self._get_steps([set_constraints[position] for position in order],
+                                      constraints)
+        # partial placements before each set by missing planes and planes so far,
+        # and the steps taken from them
+        self._tables: list[dict[tuple, dict[int, int]]] = []
+        self._transitions: list[list[tuple[tuple, int, tuple]]] = []
+
+    @staticmethod
+    def _order_sets(set_constraints: list[tuple[int]]) -> list[int]:
+        # Sets are taken greedily, preferring sets touching numbers already started and
+        # then sets starting the fewest new numbers, so that few numbers are shared
+        # between the sets taken and the sets still ahead.
+        sets_left = {}
+
+        for touched in set_constraints:
+            for constraint in touched:
+                sets_left[constraint] = sets_left.get(constraint, 0) + 1
+
+        started = set()
+        remaining = set(range(len(set_constraints)))
+        order = []
+
+        def get_priority(position: int) -> tuple[int, int, int]:
+            touched = set_constraints[position]
+            continuing = sum(1 for constraint in touched if constraint in started)
+            finishing = sum(1 for constraint in touched if sets_left[constraint] == 1)
+
+            return (-continuing, len(touched) - continuing - finishing, position)
+
+        while remaining:
+            position = min(remaining, key=get_priority)
+            remaining.remove(position)
+            order.append(position)
+
+            for constraint in set_constraints[position]:
+                sets_left[constraint] -= 1
+
+                if sets_left[constraint] == 0:
+                    started.discard(constraint)
+                else:
+                    started.add(constraint)
+
+        return order
+
+    def _get_steps(self, set_constraints: list[tuple[int]],
+                   constraints: list[tuple[int, list[int]]]) -> list[tuple]:
+        # Missing planes of the numbers shared by sets before and after each set make
+        # up the state between them. For each set, numbers first touched by it are
+        # added to the state, the set's planes are taken from the numbers it touches,
+        # and numbers not touching any later set are left out of the next state.
+        last = {}
+        left = [len(members) for _, members in constraints]
+
+        for position, touched in enumerate(set_constraints):
+            for constraint in touched:
+                last[constraint] = position
+
+        steps = []
+        active = []
+
+        for position, touched in enumerate(set_constraints):
+            size = len(self._sets[position])
+            entering = [constraint for constraint in touched if constraint not in active]
+            numbers = active + entering
+
+            for constraint in touched:
+                left[constraint] -= size
+
+            in_set = [slot for slot, constraint in enumerate(numbers) if constraint in touched]
+            keep = [slot for slot, constraint in enumerate(numbers)
+                    if last[constraint] > position]
+
+            steps.append((size, [constraints[constraint][0] for constraint in entering],
+                          [(slot, left[numbers[slot]]) for slot in in_set], keep))
+
+            active = [numbers[slot] for slot in keep]
+
+        return steps
+
+    @staticmethod
+    def _get_next_states(state: tuple, step: tuple) -> list[tuple[int, tuple]]:
+        size, entering, in_set, keep = step
+        needs = list(state) + entering
+
+        # planes of the set can't be more than any of its numbers still needs, and must
+        # be enough for the numbers to get the rest of their planes from the sets after it
+        least = max(0, max(needs[slot] - left for slot, left in in_set))
+        most = min(size, min(needs[slot] for slot, _ in in_set))
+        next_states = []
+
+        for set_planes in range(least, most + 1):
+            for slot, _ in in_set:
+                needs[slot] -= set_planes
+
+            next_states.append((set_planes, tuple(needs[slot] for slot in keep)))
+
+            for slot, _ in in_set:
+                needs[slot] += set_planes
+
+        return next_states
+
+    @staticmethod
+    def _add_placements(following: dict[int, int], planes: dict[int, int], set_planes: int,
+                        placements: int, max_planes: int):
+        for used, count in planes.items():
+            if used + set_planes <= max_planes:
+                following[used + set_planes] =\
+                    following.get(used + set_planes, 0) + count * placements
+
+    def count(self, max_planes: int, max_nodes: int) -> dict[int, int]:
+        """Count all valid plane placements.
+
+        Args:
+            max_planes (int): Maximum number of planes in a placement.
+            max_nodes (int): Maximum number of search steps before giving up.
+
+        Returns:
+            dict[int, int]: Number of placements for each possible number of planes in
+                the group, None if search was given up
+        """
+        tables = [{(): {0: 1}}]
+        self._tables = tables
+        self._transitions = []
+        nodes = 0
+
+        for step in self._steps:
+            size = step[0]
+            table = {}
+            transitions = []
+
+            for state, planes in tables[-1].items():
+                for set_planes, next_state in self._get_next_states(state, step):
+                    self._add_placements(table.setdefault(next_state, {}), planes, set_planes,
+                                         math.comb(size, set_planes), max_planes)
+                    transitions.append((state, set_planes, next_state))
+
+            nodes += len(transitions)
+
+            if nodes > max_nodes:
+                return None
+
+            tables.append(table)
+            self._transitions.append(transitions)
+
+        return {planes: count for planes, count in tables[-1].get((), {}).items() if count}
+
+    @staticmethod
+    def _add_weights(weighted: dict[int, int], planes: dict[int, int],
+                     following: dict[int, int], set_planes: int, placements: int) -> int:
+        # weights of completing partial placements through the set, returning the
+        # weighted number of partial placements continued
+        continued = 0
+
+        for used, count in planes.items():
+            weight = following.get(used + set_planes, 0)
+
+            if weight:
+                weighted[used] = weighted.get(used, 0) + placements * weight
+                continued += count * weight
+
+        return continued
+
+    def _weigh_set(self, position: int,
+                   tail: dict[tuple, dict[int, int]]) -> tuple[dict[tuple, dict[int, int]], int]:
+        # weights of completing partial placements before a set from those after it,
+        # and weighted placements having a plane in any one cell of the set
+        size = len(self._sets[position])
+        table = self._tables[position]
+        placements = [math.comb(size, set_planes) for set_planes in range(size + 1)]
+        current = {}
+        occurrences = 0
+
+        for state, set_planes, next_state in self._transitions[position]:
+            following = tail.get(next_state)
+
+            if not following:
+                continue
+
+            # placements of the set having a plane in any one of its cells
+            occupied = placements[set_planes] * set_planes // size
+            occurrences += occupied * self._add_weights(current.setdefault(state, {}),
+                                                        table[state], following, set_planes,
+                                                        placements[set_planes])
+
+        return (current, occurrences)
+
+    def get_occurrences(self, weights: dict[int, int]) -> list[int]:
+        """Count placements having a plane in each cell, as of the latest count.
+
+        Args:
+            weights (dict[int, int]): Weight of a placement by its number of planes,
+                placements with other numbers of planes are left out.
+
+        Returns:
+            list[int]: Sum of weights of placements with a plane in each cell, in the
+                order the cells were given
+        """
+        # weight of completing a partial placement by planes so far, going backwards
+        tail = {state: {used: weights.get(used, 0) for used in planes}
+                for state, planes in self._tables[-1].items()}
+        set_occurrences = [0] * len(self._sets)
+
+        for position in range(len(self._transitions) - 1, -1, -1):
+            tail, set_occurrences[position] = self._weigh_set(position, tail)
+
+        positions = {index: position for position, index in enumerate(self.cells)}
+        results = [0] * len(self.cells)
+
+        for members, occurrences in zip(self._sets, set_occurrences):
+            for index in members:
+                results[positions[index]] = occurrences
+
+        return results
+
+    def enumerate(self, max_planes: int, max_nodes: int) -> dict[int, tuple[int, list[int]]]:
+        """Count all valid plane placements separately by their number of planes.
+
+        Args:
+            max_planes (int): Maximum number of planes in a placement.
+            max_nodes (int): Maximum number of search steps before giving up.
+
+        Returns:
+            dict[int, tuple[int, list[int]]]: For each possible number of planes in the
+                group, number of placements and, for each cell in the order given,
+                number of those placements having a plane in the cell.
+                None if search was given up.
+        """
+        counts = self.count(max_planes, max_nodes)
+
+        if counts is None:
+            return None
+
+        return {planes: (placements, self.get_occurrences({planes: 1}))
+                for planes, placements in counts.items()}
+
+class KnownCells:
+    """What the solver knows of each cell, with the numbers of unknown cells and cells
+        holding a plane kept up to date.
+
+    Attributes:
+        states (bytearray): UNKNOWN, OPEN, SAFE, PLANE or MARKED for each cell index.
+        unknown (int): Cells not opened, marked or deduced yet.
+        planes (int): Cells marked or deduced to contain a plane.
+    """
+    def __init__(self, length: int):
+        self.states = bytearray(length)
+        self.unknown: int = length
+        self.planes: int = 0
+
+    def set(self, index: int, state: int) -> bool:
+        """Change what is known of a cell.
+
+        Args:
+            index (int): Cell index.
+            state (int): UNKNOWN, OPEN, SAFE, PLANE or MARKED.
+
+        Returns:
+            bool: True if the state changed, False if it was already the same
+        """
+        previous = self.states[index]
+
+        if previous == state:
+            return False
+
+        if previous == UNKNOWN:
+            self.unknown -= 1
+        elif previous in (PLANE, MARKED):
+            self.planes -= 1
+
+        if state == UNKNOWN:
+            self.unknown += 1
+        elif state in (PLANE, MARKED):
+            self.planes += 1
+
+        self.states[index] = state
+
+        return True
+
+class SeenNumbers:
+    """Numbers of opened cells the solver has read, and which of them are still to be
+        checked by the single and pair rules.
+
+    Attributes:
+        values (dict[int, int]): Number of each opened number cell by cell index,
+            missing planes are calculated from these.
+        active (set[int]): Numbers still having unknown cells around them.
+        dirty (set[int]): Numbers to check with single rules.
+        pair_dirty (set[int]): Numbers to check with pair rules.
+    """
+    def __init__(self):
+        self.values: dict[int, int] = {}
+        self.active: set[int] = set()
+        self.dirty: set[int] = set()
+        self.pair_dirty: set[int] = set()
+
+    def add(self, index: int, number: int):
+        """Read number of an opened cell, to be checked by all rules.
+
+        Args:
+            index (int): Cell index.
+            number (int): Number of planes around the cell.
+        """
+        self.values[index] = number
+        self.active.add(index)
+        self.dirty.add(index)
+        self.pair_dirty.add(index)
+
+    def remove(self, index: int):
+        """Forget number of a cell closed again.
+
+        Args:
+            index (int): Cell index.
+        """
+        self.values.pop(index, None)
+        self.active.discard(index)
+        self.dirty.discard(index)
+        self.pair_dirty.discard(index)
+
+    def check_all(self):
+        """Check all numbers again with all rules."""
+        self.active.update(self.values)
+        self.dirty.update(self.values)
+        self.pair_dirty.update(self.values)
+
+class BoardSolver:
+    """Deduces safe cells and planes from what a player sees on a gameboard: opened
+        numbers and, optionally, marks. Rules are tried cheapest first:
+
+        - single: a number whose missing planes equal zero or the number of closed
+          cells around it, and the same for the board's remaining planes
+        - pair: two numbers sharing closed cells, where one's cells are covered by
+          the other's or the difference of missing planes fills the cells only one
+          of them touches
+        - enumeration: every plane placement of each independent group of frontier
+          cells (closed cells next to numbers), cells having the same content in all
+          placements are solved
+
+        Solver follows the board incrementally: only cells changed since the previous
+        step are read, and single rules only revisit numbers around changed cells,
+        so a step on a large board costs in proportion to the change.
+    """
+    # enumeration of a group of frontier cells is given up after this many search steps
+    MAX_SEARCH_NODES = 5000
+
+    def __init__(self, game: Gameboard, trust_marks: bool = True):
+        """Initialize solver for a gameboard.
+
+        Args:
+            game (Gameboard): Board to solve, followed through its later changes.
+            trust_marks (bool, optional): Treat marked cells as planes. Wrong marks
+                can then lead to wrong deductions. Defaults to True.
+        """
+        self._cells = game.get_cells()
+        self._total_planes = game.get_total_planes()
+        self._trust_marks = trust_marks
+
+        packed_length = (len(self._cells) + 7) // 8
+
+        self._known = KnownCells(len(self._cells))
+        self._opened_flags = bytes(packed_length)
+        self._marked_flags = bytes(packed_length)
+        self._numbers = SeenNumbers()
+        # frontier groups enumerated by the previous step
+        self._enumerated: set[tuple] = set()
+
+    def get_position(self, index: int) -> Position:
+        """Get coordinates of a cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            Position: Coordinates of the cell on the board
+        """
+        y_pos, x_pos = divmod(index, self._cells.width)
+
+        return Position(x_pos, y_pos)
+
+    def get_index(self, position: Position) -> int:
+        """Get index of a cell.
+
+        Args:
+            position (Position): Coordinates of the cell on the board.
+
+        Returns:
+            int: Cell index
+        """
+        return position.y * self._cells.width + position.x
+
+    def _set_state(self, index: int, state: int):
+        if not self._known.set(index, state):
+            return
+
+        numbers = self._numbers
+
+        for neighbour in self._cells.neighbours.neighbours(index):
+            if neighbour in numbers.values:
+                numbers.dirty.add(neighbour)
+                numbers.pair_dirty.add(neighbour)
+
+    def _open(self, index: int):
+        cells = self._cells
+
+        if cells.types[index] == PLANE_TYPE:
+            # game was lost, the plane is as good as marked
+            self._set_state(index, PLANE)
+            return
+
+        self._set_state(index, OPEN)
+
+        number = cells.numbers[index]
+
+        if number > 0:
+            self._numbers.add(index, number)
+
+    def _close(self, index: int):
+        # opening was undone, so the cell's number is no longer seen
+        self._numbers.remove(index)
+        self._set_state(index, UNKNOWN)
+
+    def _forget_deductions(self):
+        # deductions may rest on numbers closed again, so they are made again from the
+        # numbers still seen
+        opened = self._cells.opened
+
+        for index, state in enumerate(self._known.states):
+            if state == SAFE or state == PLANE and not opened[index]:
+                self._set_state(index, UNKNOWN)
+
+        self._numbers.check_all()
+        self._enumerated.clear()
+
+    def _update_opened(self, opened: bytes):
+        closed = False
+
+        for index in get_changed_indexes(self._opened_flags, opened):
+            if opened[index >> 3] & (1 << (index & 7)):
+                self._open(index)
+            else:
+                self._close(index)
+                closed = True
+
+        self._opened_flags = opened
+
+        if closed:
+            self._forget_deductions()
+
+    def update(self) -> bool:
+        """Read changes made to the board since the previous update. Steps do this
+            themselves. Pieces closed again by undoing moves are unknown again, and
+            everything deduced so far is deduced again from the numbers still open.
+
+        Returns:
+            bool: True if any piece was opened or closed, or marked or unmarked while
+                marks are trusted, False otherwise
+        """
+        _, opened, marked = self._cells.pack_flags()
+        changed = False
+
+        if opened != self._opened_flags:
+            changed = True
+            self._update_opened(opened)
+
+        if self._trust_marks and marked != self._marked_flags:
+            changed = True
+
+            for index in get_changed_indexes(self._marked_flags, marked):
+                state = self._known.states[index]
+
+                if state == UNKNOWN:
+                    self._set_state(index, MARKED)
+                elif state == MARKED:
+                    self._set_state(index, UNKNOWN)
+
+            self._marked_flags = marked
+
+        return changed
+
+    def _scan(self, index: int) -> tuple[list[int], int]:
+        # unknown cells and planes around a number
+        states = self._known.states
+        unknown = []
+        planes = 0
+
+        for neighbour in self._cells.neighbours.neighbours(index):
+            state = states[neighbour]
+
+            if state == UNKNOWN:
+                unknown.append(neighbour)
+            elif state in (PLANE, MARKED):
+                planes += 1
+
+        return (unknown, planes)
+
+    def _apply(self, rule: int, safe: set[int], planes: set[int]) -> Deduction:
+        # cells deduced both ways come from wrong marks, leave them unknown
+        conflicting = safe & planes
+        safe = sorted(safe - conflicting)
+        planes = sorted(planes - conflicting)
+
+        for index in safe:
+            self._set_state(index, SAFE)
+
+        for index in planes:
+            self._set_state(index, PLANE)
+
+        return Deduction(rule, safe, planes)
+
+    def _get_unknown_cells(self) -> list[int]:
+        return [index for index, state in enumerate(self._known.states) if state == UNKNOWN]
+
+    def _solve_single(self) -> Deduction:
+        safe = set()
+        planes = set()
+
+        # planes found here can complete further numbers, so repeat until nothing changes
+        while self._numbers.dirty:
+            found_safe = set()
+            found_planes = set()
+
+            for index in self._numbers.dirty:
+                unknown, known_planes = self._scan(index)
+
+                if not unknown:
+                    self._numbers.active.discard(index)
+                    continue
+
+                # unmarking can make a completed number active again
+                self._numbers.active.add(index)
+
+                missing = self._numbers.values[index] - known_planes
+
+                if missing == 0:
+                    found_safe.update(unknown)
+                elif missing == len(unknown):
+                    found_planes.update(unknown)
+
+            self._numbers.dirty.clear()
+            deduction = self._apply(SolverRule.SINGLE, found_safe, found_planes)
+            safe.update(deduction.safe)
+            planes.update(deduction.planes)
+
+        if safe or planes:
+            return Deduction(SolverRule.SINGLE, sorted(safe), sorted(planes))
+
+        return self._solve_remaining()
+
+    def _solve_remaining(self) -> Deduction:
+        # all planes found, or all unknown cells must be planes
+        remaining = self._total_planes - self._known.planes
+
+        if self._known.unknown == 0:
+            return Deduction(SolverRule.SINGLE, [], [])
+
+        if remaining == 0:
+            return self._apply(SolverRule.SINGLE, set(self._get_unknown_cells()), set())
+
+        if remaining == self._known.unknown:
+            return self._apply(SolverRule.SINGLE, set(), set(self._get_unknown_cells()))
+
+        return Deduction(SolverRule.SINGLE, [], [])
+
+    def _get_partners(self, index: int, unknown: list[int]) -> set[int]:
+        # numbers sharing unknown cells with a number
+        active = self._numbers.active
+        partners = set()
+
+        for cell in unknown:
+            for neighbour in self._cells.neighbours.neighbours(cell):
+                if neighbour in active:
+                    partners.add(neighbour)
+
+        partners.discard(index)
+
+        return partners
+
+    @staticmethod
+    def _compare_pair(cells: set[int], missing: int, other_cells: set[int], other_missing: int,
+                      safe: set[int], planes: set[int]):
+        # Cells only the first number touches must hold at least the difference of the
+        # numbers' missing planes, the rest fit in the shared cells.
+        only_cells = cells - other_cells
+
+        if not only_cells:
+            return
+
+        if missing - other_missing == len(only_cells):
+            planes.update(only_cells)
+            safe.update(other_cells - cells)
+        elif missing == other_missing and other_cells <= cells:
+            safe.update(only_cells)
+
+    def _solve_pair(self) -> Deduction:
+        safe = set()
+        planes = set()
+        scanned = {}
+
+        def get_constraint(index: int) -> tuple[set[int], int]:
+            if index not in scanned:
+                unknown, known_planes = self._scan(index)
+                scanned[index] = (set(unknown), self._numbers.values[index] - known_planes)
+
+            return scanned[index]
+
+        for first in self._numbers.pair_dirty & self._numbers.active:
+            first_cells, first_missing = get_constraint(first)
+
+            for second in self._get_partners(first, first_cells):
+                second_cells, second_missing = get_constraint(second)
+
+                # checked both ways round, as every partner of a changed number is
+                # compared with it whichever of the two changed
+                self._compare_pair(first_cells, first_missing, second_cells, second_missing,
+                                   safe, planes)
+                self._compare_pair(second_cells, second_missing, first_cells, first_missing,
+                                   safe, planes)
+
+        self._numbers.pair_dirty.clear()
+
+        return self._apply(SolverRule.PAIR, safe, planes)
+
+    def _get_constraints(self) -> tuple[dict[int, tuple[int, list[int]]], dict[int, list[int]]]:
+        # missing planes and unknown cells around each number, and numbers around
+        # each unknown cell
+        constraints = {}
+        cell_numbers: dict[int, list[int]] = {}
+
+        for index in self._numbers.active:
+            unknown, known_planes = self._scan(index)
+
+            if not unknown:
+                continue
+
+            constraints[index] = (self._numbers.values[index] - known_planes, unknown)
+
+            for cell in unknown:
+                cell_numbers.setdefault(cell, []).append(index)
+
+        return (constraints, cell_numbers)
+
+    @staticmethod
+    def _collect(constraints: dict[int, tuple[int, list[int]]], cell_numbers: dict[int, list[int]],
+                 start: int, depth: int = None) -> tuple[list[int], list[int]]:
+        # cells and numbers connected to a number through shared cells, breadth-first
+        # so that cells sharing numbers are enumerated close together
+        visited_numbers = {start: 0}
+        pending = deque([start])
+        numbers = []
+        cells = []
+        visited_cells = set()
+
+        while pending:
+            number = pending.popleft()
+            numbers.append(number)
+
+            new_cells = [cell for cell in constraints[number][1] if cell not in visited_cells]
+            visited_cells.update(new_cells)
+            cells.extend(new_cells)
+
+            number_depth = visited_numbers[number]
+
+            if depth is not None and number_depth >= depth:
+                continue
+
+            for other in sorted({other for cell in new_cells for other in cell_numbers[cell]
+                                 if other not in visited_numbers}):
+                visited_numbers[other] = number_depth + 1
+                pending.append(other)
+
+        return (cells, numbers)
+
+    def get_frontier_components(self) -> list[tuple[list[int], list[tuple[int, list[int]]]]]:
+        """Split unknown cells next to opened numbers into groups that do not share
+            any numbers, and whose contents can therefore be solved independently.
+
+        Returns:
+            list[tuple[list[int], list[tuple[int, list[int]]]]]: Cells of each group and
+                for each number touching the group, number of planes still missing and
+                unknown cells around it
+        """
+        constraints, cell_numbers = self._get_constraints()
+        components = []
+        visited = set()
+
+        for start in constraints:
+            if start in visited:
+                continue
+
+            cells, numbers = self._collect(constraints, cell_numbers, start)
+            visited.update(numbers)
+            components.append((cells, [constraints[number] for number in numbers]))
+
+        return components
+
+    @staticmethod
+    def _deduce(cells: list[int], results: tuple[int, list[int]],
+                safe: set[int], planes: set[int]):
+        # cells having the same content in all placements, no placements at all if
+        # wrong marks made the numbers unsolvable
+        solutions, occurrences = results
+
+        if solutions == 0:
+            return
+
+        for index, count in zip(cells, occurrences):
+            if count == 0:
+                safe.add(index)
+            elif count == solutions:
+                planes.add(index)
+
+    def _enumerate(self, cells: list[int], constraints: list[tuple[int, list[int]]],
+                   remaining: int, enumerated: set[tuple]) -> tuple[int, list[int]]:
+        # the board's remaining planes only limit placements of fewer cells
+        key = (min(remaining, len(cells)), frozenset(cells),
+               frozenset((missing, tuple(members)) for missing, members in constraints))
+        enumerated.add(key)
+
+        if key in self._enumerated:
+            # nothing was deduced from exactly the same cells and numbers last time
+            return (0, [])
+
+        enumerator = ComponentEnumerator(cells, constraints)
+        counts = enumerator.count(remaining, BoardSolver.MAX_SEARCH_NODES)
+
+        if counts is None:
+            return None
+
+        # every placement counts once, whatever its number of planes
+        return (sum(counts.values()), enumerator.get_occurrences(dict.fromkeys(counts, 1)))
+
+    def _solve_enumeration(self) -> Deduction:
+        safe = set()
+        planes = set()
+        remaining = self._total_planes - self._known.planes
+        constraints, cell_numbers = self._get_constraints()
+        enumerated = set()
+        visited = set()
+
+        for start in constraints:
+            if start in visited:
+                continue
+
+            cells, numbers = self._collect(constraints, cell_numbers, start)
+            visited.update(numbers)
+            results = self._enumerate(cells, [constraints[number] for number in numbers],
+                                      remaining, enumerated)
+
+            if results is not None:
+                self._deduce(cells, results, safe, planes)
+                continue
+
+            # Too many placements to enumerate the whole group, so each number is taken
+            # with the numbers sharing cells with it. Leaving numbers out only allows more
+            # placements, so whatever holds in all of them holds for the group as well.
+            for number in numbers:
+                cells, window = self._collect(constraints, cell_numbers, number, 1)
+                results = self._enumerate(cells, [constraints[other] for other in window],
+                                          remaining, enumerated)
+
+                if results is not None:
+                    self._deduce(cells, results, safe, planes)
+
+        # only groups and windows left unchanged can be skipped next time
+        self._enumerated = enumerated
+
+        return self._apply(SolverRule.ENUMERATION, safe, planes)
+
+    def step(self, max_rule: int = SolverRule.ENUMERATION) -> Deduction:
+        """Read changes made to the board since the previous step and deduce new safe
+            cells and planes using the cheapest rule that finds any.
+
+        Args:
+            max_rule (int, optional): Most expensive SolverRule to try.
+                Defaults to SolverRule.ENUMERATION.
+
+        Returns:
+            Deduction: Newly deduced cells, also remembered by the solver
+        """
+        self.update()
+
+        solvers = ((SolverRule.SINGLE, self._solve_single),
+                   (SolverRule.PAIR, self._solve_pair),
+                   (SolverRule.ENUMERATION, self._solve_enumeration))
+
+        for rule, solve in solvers:
+            if rule > max_rule:
+                break
+
+            deduction = solve()
+
+            if not deduction.is_empty():
+                return deduction
+
+        return Deduction(SolverRule.NONE, [], [])
+
+    def get_safe_cells(self) -> list[int]:
+        """Get cells deduced safe but not opened yet, as of the latest step.
+
+        Returns:
+            list[int]: Cell indexes
+        """
+        return [index for index, state in enumerate(self._known.states) if state == SAFE]
+
+    def get_plane_cells(self) -> list[int]:
+        """Get cells deduced to contain a plane, as of the latest step.
+
+        Returns:
+            list[int]: Cell indexes
+        """
+        return [index for index, state in enumerate(self._known.states) if state == PLANE]
+
+    def get_states(self) -> bytearray:
+        """Get what is known of each cell, as of the latest step or update. Returned
+            states must not be modified.
+
+        Returns:
+            bytearray: UNKNOWN, OPEN, SAFE, PLANE or MARKED for each cell index
+        """
+        return self._known.states
+
+    def get_unknown_count(self) -> int:
+        """Get number of cells not opened, marked or deduced yet.
+
+        Returns:
+            int: Number of cells
+        """
+        return self._known.unknown
+
+    def get_remaining_planes(self) -> int:
+        """Get number of the board's planes not marked or deduced yet.
+
+        Returns:
+            int: Number of planes
+        """
+        return self._total_planes - self._known.planes
+
+def is_solvable_without_guessing(game: Gameboard) -> bool:
+    """Play a board with opened pieces further using only the solver's deductions,
+        opening every piece proven safe and marking every plane found, until the board
+        is won or nothing more can be deduced.
+
+    Args:
+        game (Gameboard): Board with at least one opened piece. Board is played to the
+            end, so a copy should be given if the board is still needed.
+
+    Returns:
+        bool: True if the board was won without guessing, False otherwise
+    """
+    solver = BoardSolver(game, trust_marks=False)
+
+    while game.get_current_board_state() == BoardState.RUNNING:
+        deduction = solver.step()
+
+        if deduction.is_empty():
+            return False
+
+        for index in deduction.safe:
+            game.open_piece(solver.get_position(index))
+
+        # game is won only once all planes are marked as well
+        for index in deduction.planes:
+            game.mark_piece(solver.get_position(index))
+
+    return game.get_current_board_state() == BoardState.WON
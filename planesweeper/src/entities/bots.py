@@ -0,0 +1,140 @@
+import random
+from collections import deque
+from primitives.position import Position
+from entities.board import Gameboard
+from entities.board_solver import BoardSolver, UNKNOWN
+from entities.board_probabilities import PlaneProbabilities
+
+
+class BotMove:
+    OPEN = 0
+    MARK = 1
+
+class BotStrategy:
+    """Base interface class for bots playing a gameboard without UI. Bots are sent to
+        worker processes, so they must be picklable before start() is called.
+    """
+    def start(self, game: Gameboard, seed: int):
+        """Prepare for a new game. Method in this base class does not implement any
+            logic by design.
+
+        Args:
+            game (Gameboard): Created board, no pieces opened yet.
+            seed (int): Seed the board was created with, so that random choices can
+                be repeated for the same board.
+        """
+
+    def next_move(self, game: Gameboard) -> tuple[int, Position]:
+        """Choose the next move. Bots must only read what a player sees: the types and
+            numbers of opened pieces, marks and the number of planes.
+
+        Args:
+            game (Gameboard): Board being played, still running.
+
+        Returns:
+            tuple[int, Position]: BotMove and coordinates of the piece, None to give up
+                the game. Method in this base class always gives up.
+        """
+
+class RandomBot(BotStrategy):
+    """Opens closed pieces at random, marking the rest once only planes can be left.
+        Gives a lower bound for any strategy.
+    """
+    def __init__(self):
+        self._random: random.Random = None
+        self._closed: list[int] = None
+
+    def start(self, game: Gameboard, seed: int):
+        # same board always gets the same moves
+        self._random = random.Random(seed)
+        self._closed = list(range(game.get_pieces_on_board()))
+        self._random.shuffle(self._closed)
+
+    def next_move(self, game: Gameboard) -> tuple[int, Position]:
+        cells = game.get_cells()
+
+        while self._closed and cells.opened[self._closed[-1]]:
+            self._closed.pop()
+
+        if not self._closed:
+            return None
+
+        index = self._closed.pop()
+        position = Position(index % cells.width, index // cells.width)
+
+        # only planes are left once there are as many closed pieces as planes
+        if len(cells) - cells.counts.opened <= game.get_total_planes():
+            return (BotMove.MARK, position)
+
+        return (BotMove.OPEN, position)
+
+class SolverBot(BotStrategy):
+    """Plays like a careful player: first open in the middle of the board, then every
+        piece BoardSolver proves safe and marks every plane it finds. When nothing can
+        be deduced, guesses a random closed piece, or with probabilities the piece
+        least likely to have a plane.
+    """
+    def __init__(self, probabilities: bool = False):
+        """Initialize bot.
+
+        Args:
+            probabilities (bool, optional): Guess by PlaneProbabilities instead of
+                at random. Defaults to False.
+        """
+        self._use_probabilities = probabilities
+        self._random: random.Random = None
+        self._solver: BoardSolver = None
+        self._probabilities: PlaneProbabilities = None
+        self._moves: deque[tuple[int, int]] = deque()
+
+    def start(self, game: Gameboard, seed: int):
+        cells = game.get_cells()
+
+        self._random = random.Random(seed)
+        self._solver = BoardSolver(game)
+        self._probabilities = PlaneProbabilities(game, trust_marks=True)\
+            if self._use_probabilities else None
+        self._moves = deque([(BotMove.OPEN, cells.width * (cells.height // 2) +
+                              cells.width // 2)])
+
+    def _guess(self) -> int:
+        if self._probabilities is not None:
+            probabilities = self._probabilities.get_probabilities()
+
+            if probabilities:
+                return min(probabilities, key=probabilities.get)
+
+        unknown = [index for index, state in enumerate(self._solver.get_states())
+                   if state == UNKNOWN]
+
+        return self._random.choice(unknown) if unknown else None
+
+    def _get_move(self, game: Gameboard) -> tuple[int, int]:
+        cells = game.get_cells()
+
+        while self._moves:
+            move, index = self._moves.popleft()
+
+            # pieces opened by an earlier move's empty area need no move
+            if not cells.opened[index]:
+                return (move, index)
+
+        deduction = self._solver.step()
+
+        self._moves.extend((BotMove.MARK, index) for index in deduction.planes)
+        self._moves.extend((BotMove.OPEN, index) for index in deduction.safe)
+
+        if self._moves:
+            return self._get_move(game)
+
+        index = self._guess()
+
+        return (BotMove.OPEN, index) if index is not None else None
+
+    def next_move(self, game: Gameboard) -> tuple[int, Position]:
+        move = self._get_move(game)
+
+        if move is None:
+            return None
+
+        return (move[0], self._solver.get_position(move[1]))
@@ -0,0 +1,544 @@
+import bisect
+from entities.board_cells import BoardCells, EMPTY, PLANE, NUMBER
+from entities.neighbour_table import ComputedNeighbours
+from entities.reveal_engine import RevealEngine
+from entities.chunked_regions import ChunkedRegions, find_runs, label_runs, paint_runs, \
+    dilate
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+CHUNK_BITS = 12
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+
+class ChunkedBytes:
+    """Byte array whose storage is split into fixed-size chunks which are allocated
+        only when first needed. Reading from a chunk which has not been allocated returns
+        zero, unless chunk loader is given in which case the chunk is loaded on first read.
+    """
+    def __init__(self, length: int, loader = None):
+        """Initialize array with all values zero.
+
+        Args:
+            length (int): Array length.
+            loader (optional): Function taking chunk number and returning bytearray of
+                the chunk's initial content. Defaults to None (chunks start as zeros).
+        """
+        self._length = length
+        self._loader = loader
+        self._chunks: dict[int, bytearray] = {}
+
+    def __len__(self):
+        return self._length
+
+    def _get_chunk_length(self, chunk: int) -> int:
+        return min(CHUNK_SIZE, self._length - (chunk << CHUNK_BITS))
+
+    def _allocate(self, chunk: int) -> bytearray:
+        if self._loader is not None:
+            data = self._loader(chunk)
+        else:
+            data = bytearray(self._get_chunk_length(chunk))
+
+        self._chunks[chunk] = data
+
+        return data
+
+    def __getitem__(self, index: int) -> int:
+        data = self._chunks.get(index >> CHUNK_BITS)
+
+        if data is None:
+            if self._loader is None:
+                return 0
+
+            data = self._allocate(index >> CHUNK_BITS)
+
+        return data[index & CHUNK_MASK]
+
+    def __setitem__(self, index: int, value: int):
+        data = self._chunks.get(index >> CHUNK_BITS)
+
+        if data is None:
+            data = self._allocate(index >> CHUNK_BITS)
+
+        data[index & CHUNK_MASK] = value
+
+    def __iter__(self):
+        for chunk in range((self._length + CHUNK_MASK) >> CHUNK_BITS):
+            data = self._chunks.get(chunk)
+
+            if data is None:
+                if self._loader is None:
+                    yield from bytes(self._get_chunk_length(chunk))
+                    continue
+
+                data = self._allocate(chunk)
+
+            yield from data
+
+    def count(self, value: int) -> int:
+        """Count occurrences of a value. Chunks which have not been allocated or
+            loaded are not loaded by counting.
+
+        Args:
+            value (int): Value to count.
+
+        Returns:
+            int: Number of occurrences in allocated chunks, plus zeros of unallocated
+                chunks when counting zero values without chunk loader.
+        """
+        occurrences = sum(data.count(value) for data in self._chunks.values())
+
+        if value == 0 and self._loader is None:
+            occurrences += self._length - sum(len(data) for data in self._chunks.values())
+
+        return occurrences
+
+    def set_chunk(self, chunk: int, data: bytearray):
+        """Replace content of a chunk.
+
+        Args:
+            chunk (int): Chunk number.
+            data (bytearray): New content, must be of chunk's length.
+        """
+        self._chunks[chunk] = data
+
+    def clear(self):
+        """Release all chunks, returning array to its initial state.
+        """
+        self._chunks.clear()
+
+    def pack_bits(self) -> bytes:
+        """Get array of zeros and ones packed eight values per byte, the first value
+            in the lowest bit of the first byte. Chunks are not loaded by packing.
+
+        Returns:
+            bytes: Packed values
+        """
+        packed = bytearray((self._length + 7) // 8)
+
+        for chunk, data in self._chunks.items():
+            start = chunk << (CHUNK_BITS - 3)
+
+            if numpy is not None:
+                packed[start:start + (len(data) + 7) // 8] = numpy.packbits(
+                    numpy.frombuffer(data, dtype=numpy.uint8), bitorder="little").tobytes()
+                continue
+
+            for index, value in enumerate(data):
+                if value:
+                    packed[start + (index >> 3)] |= 1 << (index & 7)
+
+        return bytes(packed)
+
+    def unpack_bits(self, packed):
+        """Replace content with values packed by pack_bits(). Only chunks containing
+            ones are allocated.
+
+        Args:
+            packed: Buffer (bytes, bytearray or memoryview) of packed values.
+        """
+        self._chunks.clear()
+
+        for chunk in range((self._length + CHUNK_MASK) >> CHUNK_BITS):
+            length = self._get_chunk_length(chunk)
+            start = chunk << (CHUNK_BITS - 3)
+            chunk_bits = packed[start:start + (length + 7) // 8]
+
+            if int.from_bytes(chunk_bits, "little") == 0:
+                continue
+
+            if numpy is not None:
+                self._chunks[chunk] = bytearray(numpy.unpackbits(
+                    numpy.frombuffer(chunk_bits, dtype=numpy.uint8),
+                    count=length, bitorder="little").tobytes())
+                continue
+
+            self._chunks[chunk] = bytearray((byte >> (index & 7)) & 1
+                                            for index, byte in
+                                            ((index, chunk_bits[index >> 3])
+                                             for index in range(length)))
+
+    def _get_chunk_ranges(self, start: int, end: int):
+        # part of the range in each chunk as chunk number, first and end index
+        for chunk in range(start >> CHUNK_BITS, ((end - 1) >> CHUNK_BITS) + 1):
+            yield (chunk, max(start, chunk << CHUNK_BITS),
+                   min(end, (chunk + 1) << CHUNK_BITS))
+
+    def get_range(self, start: int, end: int):
+        """Get values of a range of indexes as a NumPy array. Chunks are not loaded
+            by reading, so this is meant for arrays without chunk loader.
+
+        Args:
+            start (int): First index of the range.
+            end (int): Index after the range.
+
+        Returns:
+            numpy.ndarray: Copy of the values, zeros for chunks not allocated
+        """
+        values = numpy.zeros(end - start, dtype=numpy.uint8)
+
+        for chunk, first, last in self._get_chunk_ranges(start, end):
+            data = self._chunks.get(chunk)
+
+            if data is not None:
+                offset = chunk << CHUNK_BITS
+                values[first - start:last - start] = numpy.frombuffer(
+                    data, dtype=numpy.uint8)[first - offset:last - offset]
+
+        return values
+
+    def set_ones(self, start: int, values):
+        """Set ones of a NumPy array into a range of indexes, leaving the other values
+            of the range as they are. Only chunks receiving ones are allocated.
+
+        Args:
+            start (int): First index of the range.
+            values (numpy.ndarray): Zeros and ones for the range.
+        """
+        for chunk, first, last in self._get_chunk_ranges(start, start + len(values)):
+            part = values[first - start:last - start]
+
+            if not part.any():
+                continue
+
+            data = self._chunks.get(chunk)
+
+            if data is None:
+                data = self._allocate(chunk)
+
+            offset = chunk << CHUNK_BITS
+            view = numpy.frombuffer(data, dtype=numpy.uint8)[first - offset:last - offset]
+            view |= part
+
+    def get_allocated_chunks(self) -> int:
+        """Get number of currently allocated chunks.
+
+        Returns:
+            int: Allocated chunks
+        """
+        return len(self._chunks)
+
+class ChunkedBoardCells(BoardCells):
+    """Cell storage for very large boards. Only plane positions are stored for the whole
+        board (as one bit per cell); cell types and surrounding plane counts are calculated
+        chunk by chunk when cells are first accessed, and open and mark flags are allocated
+        chunk by chunk when first set. Memory use thus follows the number of cells
+        actually played or rendered rather than board size.
+
+        With NumPy, empty areas are labelled for the whole board when one is first
+        opened, keeping only runs of empty cells, and an area is opened in one batched
+        operation instead of being searched cell by cell.
+    """
+    def __init__(self, width: int, height: int):
+        """Initialize empty (all cells closed, unmarked and without planes) storage.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        super().__init__(width, height)
+
+        total = width * height
+
+        self._planes = bytearray((total + 7) // 8)
+        self.types = ChunkedBytes(total, self._load_types)
+        self.numbers = ChunkedBytes(total, self._load_numbers)
+        # ChunkedRegions labelled when an empty area is first opened
+        self._regions = None
+
+    @staticmethod
+    def _create_neighbours(width: int, height: int):
+        return ComputedNeighbours(width, height)
+
+    def _create_array(self, length: int):
+        return ChunkedBytes(length)
+
+    def as_array(self, data):
+        """Chunked storage can't be accessed as a single NumPy array.
+
+        Returns:
+            None: Always
+        """
+        return None
+
+    def _is_plane(self, index: int) -> bool:
+        return self._planes[index >> 3] & (1 << (index & 7)) != 0
+
+    def _calculate_chunk_per_cell(self, start: int, end: int) -> tuple[bytearray, bytearray]:
+        types = bytearray(end - start)
+        numbers = bytearray(end - start)
+
+        for index in range(start, end):
+            if self._is_plane(index):
+                types[index - start] = PLANE
+                continue
+
+            planes = 0
+
+            for neighbour in self.neighbours.neighbours(index):
+                if self._is_plane(neighbour):
+                    planes += 1
+
+            types[index - start] = EMPTY if planes == 0 else NUMBER
+            numbers[index - start] = planes
+
+        return (types, numbers)
+
+    def _get_plane_rows(self, first_row: int, last_row: int):
+        # plane bits of whole rows as a two-dimensional array of zeros and ones
+        first_cell = first_row * self.width
+        last_cell = (last_row + 1) * self.width
+
+        bits = numpy.unpackbits(
+            numpy.frombuffer(self._planes, dtype=numpy.uint8,
+                             count=((last_cell + 7) >> 3) - (first_cell >> 3),
+                             offset=first_cell >> 3),
+            bitorder="little")
+        bit_offset = first_cell & 7
+
+        return bits[bit_offset:bit_offset + last_cell - first_cell]\
+            .reshape(last_row - first_row + 1, self.width)
+
+    def _calculate_chunk_batched(self, start: int, end: int) -> tuple[bytearray, bytearray]:
+        # rows covering the chunk plus one row above and below it
+        first_row = max(0, start // self.width - 1)
+        last_row = min(self.height - 1, (end - 1) // self.width + 1)
+        first_cell = first_row * self.width
+        planes = self._get_plane_rows(first_row, last_row)
+
+        padded = numpy.pad(planes, 1)
+        counts = numpy.zeros(planes.shape, dtype=numpy.uint8)
+
+        for y_offset in range(3):
+            for x_offset in range(3):
+                if x_offset == 1 and y_offset == 1:
+                    continue
+
+                counts += padded[y_offset:y_offset + planes.shape[0],
+                                 x_offset:x_offset + self.width]
+
+        planes = planes.ravel()[start - first_cell:end - first_cell]
+        counts = counts.ravel()[start - first_cell:end - first_cell]
+        counts[planes == 1] = 0
+
+        types = numpy.where(planes == 1, PLANE,
+                            numpy.where(counts > 0, NUMBER, EMPTY)).astype(numpy.uint8)
+
+        return (bytearray(types.tobytes()), bytearray(counts.tobytes()))
+
+    def _load_chunk(self, chunk: int):
+        start = chunk << CHUNK_BITS
+        end = min(start + CHUNK_SIZE, len(self.opened))
+
+        if numpy is not None:
+            types, numbers = self._calculate_chunk_batched(start, end)
+        else:
+            types, numbers = self._calculate_chunk_per_cell(start, end)
+
+        return (types, numbers)
+
+    def _load_types(self, chunk: int) -> bytearray:
+        # types and numbers of a chunk are calculated together, store both
+        types, numbers = self._load_chunk(chunk)
+        self.numbers.set_chunk(chunk, numbers)
+
+        return types
+
+    def _load_numbers(self, chunk: int) -> bytearray:
+        types, numbers = self._load_chunk(chunk)
+        self.types.set_chunk(chunk, types)
+
+        return numbers
+
+    def _get_empty_rows(self, first_row: int, last_row: int):
+        # empty cells of whole rows, having no plane on or around them, calculated
+        # from the planes without loading chunks
+        above = max(0, first_row - 1)
+        below = min(self.height - 1, last_row + 1)
+        planes = self._get_plane_rows(above, below).view(numpy.bool_)
+
+        return ~dilate(planes)[first_row - above:last_row - above + 1]
+
+    def _get_regions(self) -> ChunkedRegions:
+        if self._regions is None:
+            self._regions = ChunkedRegions(
+                self._get_plane_rows(0, self.height - 1).view(numpy.bool_))
+
+        return self._regions
+
+    def reveal_many(self, indexes: list[int]) -> list[int]:
+        """Open several cells and the empty areas around them in one pass. Without
+            NumPy, empty areas are searched cell by cell.
+
+        Args:
+            indexes (list[int]): Indexes of the cells to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells. Empty if nothing was opened.
+        """
+        if numpy is None:
+            return RevealEngine(self).reveal_many(indexes)
+
+        # an area may open millions of cells, so the only list is not copied
+        revealed = [self._reveal_region(index) for index in indexes]
+
+        if len(revealed) == 1:
+            return revealed[0]
+
+        return [index for opened in revealed for index in opened]
+
+    def _find_closed_area(self, index: int, first_row: int, passable):
+        # area of empty cells reachable from the cell without passing opened or marked
+        # cells, labelled again within the rows of the area it was first labelled in
+        rows, firsts, lasts = find_runs(passable)
+        labels = label_runs(rows, firsts, lasts, self.width)
+        row, column = divmod(index, self.width)
+        run = numpy.flatnonzero((rows == row - first_row) & (firsts <= column) &
+                                (lasts >= column))[0]
+        area = labels == labels[run]
+
+        return paint_runs(rows[area], firsts[area], lasts[area], passable.shape)
+
+    def _get_closed_rows(self, first_row: int, last_row: int):
+        # cells neither opened nor marked on whole rows
+        start = first_row * self.width
+        end = (last_row + 1) * self.width
+
+        return (self.opened.get_range(start, end) | self.marked.get_range(start, end))\
+            .reshape(last_row - first_row + 1, self.width) == 0
+
+    def _open_rows(self, first_row: int, opening) -> list[int]:
+        # opens cells of a mask over whole rows at once
+        start = first_row * self.width
+        self.opened.set_ones(start, opening.ravel().view(numpy.uint8))
+
+        revealed = numpy.flatnonzero(opening)
+        revealed += start
+        revealed = revealed.tolist()
+        self.counts.opened += len(revealed)
+        self.counts.closed_safe -= len(revealed)
+
+        return revealed
+
+    def _reveal_region(self, index: int) -> list[int]:
+        # opens the labelled area of an empty cell and the cells around it at once
+        if self.opened[index] or self.marked[index] or self.types[index] == PLANE:
+            return []
+
+        if self.types[index] != EMPTY:
+            self.open(index)
+            return [index]
+
+        regions = self._get_regions()
+        rows, firsts, lasts = regions.get_runs(regions.get_label(index))
+
+        # area's rows and one row above and below it
+        first_row = max(0, int(rows[0]) - 1)
+        last_row = min(self.height - 1, int(rows[-1]) + 1)
+        closed = self._get_closed_rows(first_row, last_row)
+        area = paint_runs(rows - first_row, firsts, lasts, closed.shape)
+
+        if (area & ~closed).any():
+            # open or marked empty cell may split the area
+            area = self._find_closed_area(
+                index, first_row, closed & self._get_empty_rows(first_row, last_row))
+
+        # empty cells have no planes around them, so every closed cell around is opened
+        opening = dilate(area)
+        opening &= closed
+        revealed = self._open_rows(first_row, opening)
+
+        # opened cell first, others in order; moved within the list as an area may
+        # open millions of cells
+        revealed.insert(0, revealed.pop(bisect.bisect_left(revealed, index)))
+
+        return revealed
+
+    def get_3bv(self) -> int:
+        """Get board's 3BV (Bechtel's Board Benchmark Value): least number of clicks
+            needed to open all cells without planes. With NumPy, empty areas are
+            labelled for the board, otherwise the whole board is read cell by cell.
+
+        Returns:
+            int: 3BV of the board
+        """
+        if numpy is None:
+            return super().get_3bv()
+
+        return self._get_regions().get_3bv()
+
+    def place_planes(self, plane_indexes: list[int], batched: bool = None):
+        """Place planes into given cells. Types and numbers of cells are calculated
+            later, chunk by chunk, when cells are first accessed. Any previous plane
+            placement is overwritten, marks are kept. Must not be called after cells
+            have been opened.
+
+        Args:
+            plane_indexes (list[int]): Indexes of cells containing plane
+            batched (bool, optional): Set plane bits in one batched NumPy operation
+                (True) or one by one (False).
+                Defaults to None which uses batched operation if NumPy is installed.
+        """
+        if batched is None:
+            batched = numpy is not None
+
+        total = len(self.opened)
+
+        if batched:
+            mask = numpy.zeros(total, dtype=numpy.uint8)
+            mask[numpy.asarray(plane_indexes, dtype=numpy.intp)] = 1
+            self._planes[:] = numpy.packbits(mask, bitorder="little").tobytes()
+        else:
+            self._planes[:] = bytes(len(self._planes))
+
+            for index in plane_indexes:
+                self._planes[index >> 3] |= 1 << (index & 7)
+
+        self.types.clear()
+        self.numbers.clear()
+        self._regions = None
+
+        self.counts.closed_safe = total - len(plane_indexes)
+
+    def pack_flags(self) -> tuple[bytes, bytes, bytes]:
+        """Get plane, open and mark flags of all cells packed eight cells per byte,
+            the first cell in the lowest bit of the first byte. Types and numbers
+            of cells are not loaded.
+
+        Returns:
+            tuple[bytes, bytes, bytes]: Packed plane, open and mark flags
+        """
+        return (bytes(self._planes), self.opened.pack_bits(), self.marked.pack_bits())
+
+    def unpack_flags(self, planes, opened, marked):
+        """Replace state of all cells with packed flags, as returned by pack_flags().
+            Types and numbers are calculated later when cells are accessed.
+
+        Args:
+            planes: Buffer (bytes, bytearray or memoryview) of packed plane flags.
+            opened: Buffer of packed open flags.
+            marked: Buffer of packed mark flags.
+        """
+        self._planes[:] = planes
+        self.types.clear()
+        self.numbers.clear()
+        self._regions = None
+        self.opened.unpack_bits(opened)
+        self.marked.unpack_bits(marked)
+
+        self._set_counters_from_flags(planes, opened, marked)
+
+    def get_allocated_chunks(self) -> int:
+        """Get total number of chunks currently allocated for cell data.
+
+        Returns:
+            int: Allocated chunks over types, numbers, opened and marked arrays
+        """
+        return self.types.get_allocated_chunks() + self.numbers.get_allocated_chunks() +\
+            self.opened.get_allocated_chunks() + self.marked.get_allocated_chunks()
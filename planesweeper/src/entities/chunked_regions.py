@@ -0,0 +1,195 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def find_runs(mask) -> tuple:
+    """Find runs of set cells on each row of a mask.
+
+    Args:
+        mask (numpy.ndarray): Two-dimensional (rows x width) boolean mask.
+
+    Returns:
+        tuple: Row, first column and last column of each run as NumPy arrays, runs
+            ordered by row and column
+    """
+    padded = numpy.zeros((mask.shape[0], mask.shape[1] + 2), dtype=numpy.int8)
+    padded[:, 1:-1] = mask
+    steps = numpy.diff(padded, axis=1)
+
+    rows, firsts = numpy.nonzero(steps == 1)
+    lasts = numpy.nonzero(steps == -1)[1] - 1
+
+    return (rows, firsts, lasts)
+
+def _find_touching_runs(rows, firsts, lasts, width: int) -> tuple:
+    # keys ordering runs over the whole mask, rows kept apart by two columns
+    stride = width + 2
+    first_keys = rows * stride + firsts
+    last_keys = rows * stride + lasts
+
+    # runs of the row above touching each run, diagonals included, form a range
+    # of consecutive runs
+    lows = numpy.searchsorted(last_keys, (rows - 1) * stride + firsts - 1, "left")
+    highs = numpy.searchsorted(first_keys, (rows - 1) * stride + lasts + 1, "right")
+    counts = numpy.maximum(highs - lows, 0)
+
+    runs = numpy.repeat(numpy.arange(len(rows)), counts)
+    above = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+    return (runs, above + numpy.repeat(lows, counts))
+
+def label_runs(rows, firsts, lasts, width: int):
+    """Group runs found by find_runs() into connected areas, touching diagonally too.
+
+    Args:
+        rows (numpy.ndarray): Row of each run.
+        firsts (numpy.ndarray): First column of each run.
+        lasts (numpy.ndarray): Last column of each run.
+        width (int): Mask width.
+
+    Returns:
+        numpy.ndarray: Area number of each run, starting from 0
+    """
+    runs, above = _find_touching_runs(rows, firsts, lasts, width)
+    parents = numpy.arange(len(rows))
+
+    # every run points to the lowest run known to be in its area: touching runs hook
+    # their roots to the lower one, and pointers are then followed to their roots,
+    # until touching runs agree
+    while True:
+        run_roots = parents[runs]
+        above_roots = parents[above]
+        differing = run_roots != above_roots
+
+        if not differing.any():
+            break
+
+        lowest = numpy.minimum(run_roots[differing], above_roots[differing])
+        numpy.minimum.at(parents, run_roots[differing], lowest)
+        numpy.minimum.at(parents, above_roots[differing], lowest)
+
+        roots = parents[parents]
+
+        while (roots != parents).any():
+            parents = roots
+            roots = parents[parents]
+
+    return numpy.unique(parents, return_inverse=True)[1]
+
+def paint_runs(rows, firsts, lasts, shape: tuple):
+    """Set the cells of runs on an empty mask.
+
+    Args:
+        rows (numpy.ndarray): Row of each run.
+        firsts (numpy.ndarray): First column of each run.
+        lasts (numpy.ndarray): Last column of each run.
+        shape (tuple): Mask's rows and width.
+
+    Returns:
+        numpy.ndarray: Boolean mask with the runs' cells set
+    """
+    # runs on a row are apart from each other, so a start and an end never meet
+    steps = numpy.zeros((shape[0], shape[1] + 1), dtype=numpy.int8)
+    steps[rows, firsts] = 1
+    steps[rows, lasts + 1] = -1
+
+    return numpy.cumsum(steps[:, :-1], axis=1, dtype=numpy.int8).view(numpy.bool_)
+
+def dilate(mask):
+    """Extend a mask to every cell around its set cells.
+
+    Args:
+        mask (numpy.ndarray): Two-dimensional boolean mask.
+
+    Returns:
+        numpy.ndarray: Boolean mask of the same shape
+    """
+    padded = numpy.pad(mask, 1)
+    rows = padded[:, :-2] | padded[:, 1:-1]
+    rows |= padded[:, 2:]
+    dilated = rows[:-2] | rows[1:-1]
+    dilated |= rows[2:]
+
+    return dilated
+
+class ChunkedRegions:
+    """Connected areas of empty cells on a chunked board, labelled at once with NumPy.
+        Only the runs of empty cells on each row and their area numbers are kept, so
+        memory use follows the number of runs rather than cells. Opening an empty cell
+        of an area opens the area's runs and the cells around them in one batched
+        operation over the rows the area spans.
+    """
+    def __init__(self, planes):
+        """Label areas of a board.
+
+        Args:
+            planes (numpy.ndarray): Two-dimensional (height x width) boolean mask of
+                planes of all cells. Not kept after labelling.
+        """
+        # empty cells have no plane on them or around them
+        empty = ~dilate(planes)
+        rows, firsts, self._lasts = find_runs(empty)
+        labels = label_runs(rows, firsts, self._lasts, planes.shape[1])
+
+        # runs ordered over the whole board for looking up the run of a cell, rows
+        # kept apart by two columns
+        self._stride = planes.shape[1] + 2
+        self._rows = rows
+        self._keys = rows * self._stride + firsts
+        self._labels = labels
+
+        # runs of each area one after another, area's runs still ordered by row
+        self._order = numpy.argsort(labels, kind="stable")
+        self._offsets = numpy.searchsorted(labels[self._order],
+                                           numpy.arange(labels.max(initial=-1) + 2))
+
+        # cells which can't be opened with an empty area each need a click of their own
+        self._3bv = len(self) + int(numpy.count_nonzero(~planes & ~dilate(empty)))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def get_label(self, index: int) -> int:
+        """Get area number of an empty cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            int: Area number starting from 0, None if the cell is not empty
+        """
+        row, column = divmod(index, self._stride - 2)
+        run = int(numpy.searchsorted(self._keys, row * self._stride + column, "right")) - 1
+
+        if run < 0 or self._rows[run] != row or self._lasts[run] < column:
+            return None
+
+        return int(self._labels[run])
+
+    def get_runs(self, label: int) -> tuple:
+        """Get runs of empty cells of an area.
+
+        Args:
+            label (int): Area number, as given by get_label().
+
+        Returns:
+            tuple: Row, first column and last column of each run as NumPy arrays,
+                ordered by row
+        """
+        runs = self._order[self._offsets[label]:self._offsets[label + 1]]
+
+        rows = self._rows[runs]
+
+        return (rows, self._keys[runs] - rows * self._stride, self._lasts[runs])
+
+    def get_3bv(self) -> int:
+        """Get board's 3BV (Bechtel's Board Benchmark Value): least number of clicks
+            needed to open all cells without planes, one for each area and one for
+            each numbered cell not bordering any area.
+
+        Returns:
+            int: 3BV of the board
+        """
+        return self._3bv
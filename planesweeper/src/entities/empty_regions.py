@@ -0,0 +1,175 @@
+import re
+from array import array
+from entities.board_piece import BoardPieceType
+
+
+EMPTY = BoardPieceType.EMPTY.value
+PLANE = BoardPieceType.PLANE.value
+
+# runs of empty cells on a row
+EMPTY_RUN = re.compile(re.escape(bytes([EMPTY])) + b"+")
+
+
+def _find(parents: list[int], run: int) -> int:
+    # root of a run's set, halving the path on the way
+    while parents[run] != run:
+        parents[run] = parents[parents[run]]
+        run = parents[run]
+
+    return run
+
+class EmptyRegions:
+    """Connected areas of empty cells on a board, together with the numbered cells
+        bordering them, labelled once after the planes are placed. Opening any empty
+        cell of an area opens exactly the area's cells, so they are looked up instead
+        of being searched for when the cell is opened.
+
+        Runs of empty cells on each row are joined with the runs they touch on the row
+        above using union-find, so labelling costs in proportion to the number of runs
+        rather than cells. Board is labelled the first time regions are needed, and
+        cells of a region are listed the first time they are needed.
+    """
+    def __init__(self, types, width: int, height: int):
+        """Initialize regions of a board, labelled on first use.
+
+        Args:
+            types: BoardPieceType value of each cell as bytes or bytearray.
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        self._types = types
+        self._width = width
+        self._height = height
+        self._labels: array = None
+        self._runs: list[list[tuple[int, int, int]]] = None
+        self._cells: list[array] = None
+        # each cell is stamped with the latest region it was listed in
+        self._stamps: array = None
+        self._3bv: int = None
+
+    def _label(self):
+        width = self._width
+        runs, parents = self._find_runs(self._types)
+        region_runs: dict[int, list[tuple[int, int, int]]] = {}
+
+        for run, (row, first, last) in enumerate(runs):
+            region_runs.setdefault(_find(parents, run), []).append((row, first, last))
+
+        self._labels = array("i", bytes(4 * width * self._height))
+        self._runs = list(region_runs.values())
+        self._cells = [None] * len(self._runs)
+
+        for label, runs_of_region in enumerate(self._runs, 1):
+            for row, first, last in runs_of_region:
+                start = row * width
+                self._labels[start + first:start + last + 1] = array("i", [label]) *\
+                    (last - first + 1)
+
+    @property
+    def labels(self) -> array:
+        """Region number of each empty cell starting from 1, 0 for others.
+
+        Returns:
+            array: Labels by cell index
+        """
+        if self._labels is None:
+            self._label()
+
+        return self._labels
+
+    def _find_runs(self, types) -> tuple[list[tuple[int, int, int]], list[int]]:
+        width = self._width
+        runs = []
+        parents = []
+        previous = []
+
+        for row in range(self._height):
+            current = []
+            touched = 0
+
+            for match in EMPTY_RUN.finditer(types, row * width, (row + 1) * width):
+                first = match.start() - row * width
+                last = match.end() - row * width - 1
+                run = len(runs)
+
+                runs.append((row, first, last))
+                parents.append(run)
+                current.append(run)
+
+                # runs of the row above touching this run, diagonals included
+                while touched < len(previous) and runs[previous[touched]][2] < first - 1:
+                    touched += 1
+
+                above = touched
+
+                while above < len(previous) and runs[previous[above]][1] <= last + 1:
+                    parents[_find(parents, previous[above])] = _find(parents, run)
+                    above += 1
+
+            previous = current
+
+        return (runs, parents)
+
+    def _get_stamps(self) -> array:
+        if self._stamps is None:
+            self._stamps = array("i", bytes(4 * self._width * self._height))
+
+        return self._stamps
+
+    def _collect_cells(self, label: int) -> array:
+        width = self._width
+        stamps = self._get_stamps()
+        cells = array("i")
+
+        for row, first, last in self._runs[label - 1]:
+            # empty cells and every cell around them
+            left = max(0, first - 1)
+            right = min(width - 1, last + 1) + 1
+            span = array("i", [label]) * (right - left)
+
+            for neighbour_row in range(max(0, row - 1), min(self._height, row + 2)):
+                start = neighbour_row * width
+                cells.extend(cell for cell in range(start + left, start + right)
+                             if stamps[cell] != label)
+                stamps[start + left:start + right] = span
+
+        return cells
+
+    def __len__(self) -> int:
+        if self._runs is None:
+            self._label()
+
+        return len(self._runs)
+
+    def get_cells(self, label: int) -> array:
+        """Get cells opened together with any empty cell of a region.
+
+        Args:
+            label (int): Region number, as given by labels.
+
+        Returns:
+            array: Indexes of the region's empty cells and the cells bordering them
+        """
+        if self._cells[label - 1] is None:
+            self._cells[label - 1] = self._collect_cells(label)
+
+        return self._cells[label - 1]
+
+    def get_3bv(self) -> int:
+        """Get board's 3BV (Bechtel's Board Benchmark Value): least number of clicks
+            needed to open all cells without planes, one for each region and one for
+            each numbered cell not bordering any region.
+
+        Returns:
+            int: 3BV of the board
+        """
+        if self._3bv is None:
+            for label in range(1, len(self) + 1):
+                self.get_cells(label)
+
+            # cells which can't be opened with an empty area each need a click of their own
+            self._3bv = len(self) + sum(1 for cell_type, stamp in
+                                        zip(self._types, self._get_stamps())
+                                        if stamp == 0 and cell_type != PLANE)
+
+        return self._3bv
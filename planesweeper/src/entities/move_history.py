@@ -0,0 +1,88 @@
+from collections import deque
+
+
+class Move:
+    """Changes made to a gameboard by one open, chord or mark operation. Only the indexes
+        of the changed cells are kept, so a move opening a large empty area is undone
+        and redone in time proportional to the cells it opened.
+    """
+    def __init__(self, opened: list[int] = None, marked: list[int] = None,
+                 unmarked: list[int] = None, state: int = 0):
+        """Initialize move.
+
+        Args:
+            opened (list[int], optional): Indexes of the cells opened. Defaults to None.
+            marked (list[int], optional): Indexes of the cells marked. Defaults to None.
+            unmarked (list[int], optional): Indexes of the cells unmarked. Defaults to None.
+            state (int, optional): Board state (BoardState) after the move.
+                Defaults to 0, game running.
+        """
+        self.opened = opened or []
+        self.marked = marked or []
+        self.unmarked = unmarked or []
+        self.state = state
+
+class MoveHistory:
+    """Bounded log of moves made on a gameboard for undo and redo. Oldest moves are
+        dropped once the log is full, so memory use does not grow with the game.
+    """
+    DEFAULT_CAPACITY = 100
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """Initialize empty history.
+
+        Args:
+            capacity (int, optional): Maximum number of moves kept for undo.
+                Defaults to DEFAULT_CAPACITY.
+
+        Raises:
+            ValueError: Capacity is less than one move.
+        """
+        if capacity < 1:
+            raise ValueError()
+
+        self._undo: deque[Move] = deque(maxlen=capacity)
+        self._redo: deque[Move] = deque(maxlen=capacity)
+
+    def record(self, move: Move):
+        """Add a move made on the board. Moves undone before it can no longer be redone.
+
+        Args:
+            move (Move): Move made
+        """
+        self._undo.append(move)
+        self._redo.clear()
+
+    def undo(self) -> Move:
+        """Take the latest move to be undone.
+
+        Returns:
+            Move: Latest move, None if there is nothing to undo
+        """
+        if not self._undo:
+            return None
+
+        move = self._undo.pop()
+        self._redo.append(move)
+
+        return move
+
+    def redo(self) -> Move:
+        """Take the latest undone move to be made again.
+
+        Returns:
+            Move: Latest undone move, None if there is nothing to redo
+        """
+        if not self._redo:
+            return None
+
+        move = self._redo.pop()
+        self._undo.append(move)
+
+        return move
+
+    def clear(self):
+        """Forget all moves.
+        """
+        self._undo.clear()
+        self._redo.clear()
@@ -0,0 +1,150 @@
+from array import array
+import functools
+
+
+def find_neighbours(index: int, width: int, height: int) -> list[int]:
+    """Calculate indexes of cells surrounding a cell.
+
+    Args:
+        index (int): Cell index.
+        width (int): Board width in cells.
+        height (int): Board height in cells.
+
+    Returns:
+        list[int]: Neighbour indexes clockwise starting from the cell above.
+    """
+    y_pos, x_pos = divmod(index, width)
+    neighbours = []
+
+    for x_check, y_check in [(x_pos, y_pos-1),
+                             (x_pos+1, y_pos-1),
+                             (x_pos+1, y_pos),
+                             (x_pos+1, y_pos+1),
+                             (x_pos, y_pos+1),
+                             (x_pos-1, y_pos+1),
+                             (x_pos-1, y_pos),
+                             (x_pos-1, y_pos-1)]:
+        if 0 <= x_check < width and 0 <= y_check < height:
+            neighbours.append(y_check * width + x_check)
+
+    return neighbours
+
+class NeighbourTable:
+    """Precomputed neighbour indexes for every cell of a board of specific size.
+        Neighbours are stored in compressed sparse row format: neighbours of cell i are
+        indexes[offsets[i]:offsets[i+1]]. Tables are built once per board size and
+        shared between all boards of that size, keeping the tables of CACHED_TABLES
+        most recently used sizes.
+
+    Attributes:
+        width (int): Board width in cells.
+        height (int): Board height in cells.
+        offsets (array): Start offset of each cell's neighbours in indexes, with
+            total number of neighbours as the last item.
+        indexes (array): Neighbour indexes of all cells one after another.
+    """
+    # predefined levels and a few custom sizes
+    CACHED_TABLES = 8
+    # largest cell count whose indexes fit in unsigned 16 bits
+    SHORT_INDEX_CELLS = 1 << 16
+
+    def __init__(self, width: int, height: int):
+        """Build neighbour table. Use NeighbourTable.get() instead to get cached table.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.offsets = array("i", [0])
+        self.indexes = array("H" if width * height <= NeighbourTable.SHORT_INDEX_CELLS
+                             else "i")
+
+        for index in range(width * height):
+            self.indexes.extend(find_neighbours(index, width, height))
+            self.offsets.append(len(self.indexes))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHED_TABLES)
+    def get(width: int, height: int) -> "NeighbourTable":
+        """Get neighbour table for board size, building it if it is not cached.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+
+        Returns:
+            NeighbourTable: Shared table for the size.
+        """
+        return NeighbourTable(width, height)
+
+    def neighbours(self, index: int) -> array:
+        """Get indexes of cells surrounding a cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            array: Neighbour indexes (3 to 8 items).
+        """
+        return self.indexes[self.offsets[index]:self.offsets[index+1]]
+
+    def count(self, index: int) -> int:
+        """Get number of cells surrounding a cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            int: Number of neighbours.
+        """
+        return self.offsets[index+1] - self.offsets[index]
+
+class ComputedNeighbours:
+    """Neighbour lookup with the same interface as NeighbourTable, but calculating
+        neighbours on every request instead of storing them. Used for very large
+        boards where a table would take more memory than the cells themselves.
+    """
+    def __init__(self, width: int, height: int):
+        """Initialize lookup.
+
+        Args:
+            width (int): Board width in cells.
+            height (int): Board height in cells.
+        """
+        self.width: int = width
+        self.height: int = height
+
+    def __len__(self):
+        return self.width * self.height
+
+    def neighbours(self, index: int) -> list[int]:
+        """Get indexes of cells surrounding a cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            list[int]: Neighbour indexes (3 to 8 items).
+        """
+        width = self.width
+        x_pos = index % width
+
+        # cells not on the board's edges have all eight neighbours
+        if 0 < x_pos < width - 1 and width < index < len(self) - width:
+            return [index-width, index-width+1, index+1, index+width+1,
+                    index+width, index+width-1, index-1, index-width-1]
+
+        return find_neighbours(index, width, self.height)
+
+    def count(self, index: int) -> int:
+        """Get number of cells surrounding a cell.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            int: Number of neighbours.
+        """
+        return len(find_neighbours(index, self.width, self.height))
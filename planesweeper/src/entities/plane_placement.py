@@ -0,0 +1,122 @@
+import random
+from entities.board_cells import BoardCells, sample_indexes
+
+
+class PlanePlacement:
+    """Placement of a gameboard's planes: the seed they are placed with, and whether
+        placement waits for the first opened piece so that the piece, and optionally
+        the pieces around it, are kept free of planes. The same seed and the same first
+        opened piece always give the same board. Placement also remembers whether the
+        first piece has been opened, which stays true even if the opening is undone.
+    """
+    def __init__(self, planes: int):
+        """Initialize placement of a board's planes.
+
+        Args:
+            planes (int): Number of planes on the board.
+        """
+        self._planes = planes
+        self._seed: int = None
+        self._placed = False
+        self._safe_area = False
+        self._first_opened = False
+
+    def reset(self, deferred: bool, safe_area: bool, seed: int = None):
+        """Start placement of a new board.
+
+        Args:
+            deferred (bool): Planes are placed only when the first piece is opened.
+            safe_area (bool): With deferred placement, also keep pieces surrounding
+                the first opened piece free of planes.
+            seed (int, optional): Seed for placing the planes. Defaults to None which
+                picks a random seed.
+        """
+        self._seed = seed if seed is not None else random.getrandbits(64)
+        self._placed = False
+        self._safe_area = deferred and safe_area
+        self._first_opened = False
+
+    def restore(self, placed: bool, safe_area: bool, seed: int, first_opened: bool):
+        """Continue placement of a decoded board.
+
+        Args:
+            placed (bool): Planes have been placed.
+            safe_area (bool): Pieces surrounding the first opened piece are kept free
+                of planes.
+            seed (int): Seed the planes are placed with.
+            first_opened (bool): First piece has been opened.
+        """
+        self._seed = seed
+        self._placed = placed
+        self._safe_area = safe_area
+        self._first_opened = first_opened
+
+    def get_seed(self) -> int:
+        """Get seed used for placing the planes.
+
+        Returns:
+            int: Seed, None if board has not been created
+        """
+        return self._seed
+
+    def is_placed(self) -> bool:
+        """Check if planes have been placed.
+
+        Returns:
+            bool: True if planes are on the board, False if waiting for the first open
+        """
+        return self._placed
+
+    def has_safe_area(self) -> bool:
+        """Check if pieces surrounding the first opened piece are kept free of planes.
+
+        Returns:
+            bool: True if the first open reveals an empty area, False otherwise
+        """
+        return self._safe_area
+
+    def is_first_opened(self) -> bool:
+        """Check if the first piece has been opened, after which planes are no longer
+            moved away from an opened piece.
+
+        Returns:
+            bool: True if a piece has been opened, False otherwise
+        """
+        return self._first_opened
+
+    def set_first_opened(self):
+        """Record that the first piece has been opened."""
+        self._first_opened = True
+
+    def _get_safe_area(self, cells: BoardCells, index: int) -> set[int]:
+        safe_area = {index}
+
+        if self._safe_area:
+            neighbours = cells.neighbours.neighbours(index)
+
+            # only possible if the rest of the board has room for all the planes
+            if len(cells) - len(neighbours) - 1 >= self._planes:
+                safe_area.update(neighbours)
+
+        return safe_area
+
+    def place(self, cells: BoardCells, excluded: set[int] = None):
+        """Place planes on the board.
+
+        Args:
+            cells (BoardCells): Board's cell storage.
+            excluded (set[int], optional): Indexes of cells which must not have
+                a plane. Defaults to None.
+        """
+        cells.place_planes(sample_indexes(len(cells), self._planes, excluded, self._seed))
+        self._placed = True
+
+    def place_around(self, cells: BoardCells, index: int):
+        """Place planes waiting for the first open, keeping the opened piece and, with
+            safe area, pieces surrounding it free of planes.
+
+        Args:
+            cells (BoardCells): Board's cell storage.
+            index (int): Index of the first opened piece.
+        """
+        self.place(cells, self._get_safe_area(cells, index))
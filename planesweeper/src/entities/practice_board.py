@@ -0,0 +1,110 @@
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard
+from entities.move_history import Move, MoveHistory
+
+
+class PracticeGameboard(Gameboard):
+    """Gameboard of a practice game, whose latest moves can be undone and made again.
+        Practice games are never eligible for high scores, so only they keep a move
+        history.
+    """
+    def __init__(self, level: int, debug: bool = False,
+                 size: Size = None, planes: int = None, bitboard: bool = False,
+                 undo_moves: int = MoveHistory.DEFAULT_CAPACITY):
+        """Initialize practice gameboard for a level.
+
+        Args:
+            level (int): Level (1-6) defining board size and number of planes, or
+                GameboardConfiguration.CUSTOM_LEVEL for custom board.
+            debug (bool, optional): Verify board's cell counters against a full scan
+                of the board after every operation. Defaults to False.
+            size (Size, optional): Custom board's size in pieces. Defaults to None.
+            planes (int, optional): Custom board's number of planes. Defaults to None.
+            bitboard (bool, optional): Keep board's cells as bit masks instead of byte
+                arrays. Defaults to False.
+            undo_moves (int, optional): Number of latest moves that can be undone.
+                Defaults to MoveHistory.DEFAULT_CAPACITY.
+
+        Raises:
+            ValueError: Level is not valid or custom board's size or planes are not given
+                or not valid, or number of undo moves is less than one.
+        """
+        super().__init__(level, debug, size, planes, bitboard)
+
+        self._history = MoveHistory(undo_moves)
+
+    def create(self, deferred: bool = False, safe_area: bool = False, seed: int = None,
+               start: Position = None):
+        self._history.clear()
+
+        super().create(deferred, safe_area, seed, start)
+
+    def _record(self, opened: list[int] = None, marked: list[int] = None,
+                unmarked: list[int] = None):
+        if opened or marked or unmarked:
+            self._history.record(Move(opened, marked, unmarked, self._status.get_state()))
+
+        super()._record(opened, marked, unmarked)
+
+    def undo(self) -> bool:
+        """Undo the latest move (open, chord or mark), also one that ended the game.
+            Only the cells changed by the move are restored. Planes stay where they
+            were placed, even if the first opened piece is closed again.
+
+        Returns:
+            bool: True if a move was undone, False if there was nothing to undo
+        """
+        move = self._history.undo()
+
+        if move is None:
+            return False
+
+        cells = self._cells
+        cells.close_many(move.opened)
+
+        for index in move.marked:
+            cells.unmark(index)
+
+        for index in move.unmarked:
+            cells.mark(index)
+
+        # moves are only made on running games
+        self._status.resume()
+        self._publish(move.opened, move.marked, move.unmarked)
+
+        if self._debug:
+            cells.verify_counters()
+
+        return True
+
+    def redo(self) -> bool:
+        """Make the latest undone move again, changing the same cells as the move did.
+
+        Returns:
+            bool: True if a move was made again, False if there was nothing to redo
+        """
+        move = self._history.redo()
+
+        if move is None:
+            return False
+
+        cells = self._cells
+
+        for index in move.opened:
+            cells.open(index)
+
+        for index in move.marked:
+            cells.mark(index)
+
+        for index in move.unmarked:
+            cells.unmark(index)
+
+        self._status.change(move.state)
+
+        self._publish(move.opened, move.marked, move.unmarked)
+
+        if self._debug:
+            cells.verify_counters()
+
+        return True
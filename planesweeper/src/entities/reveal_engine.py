@@ -0,0 +1,80 @@
+from entities.board_piece import BoardPieceType
+
+
+EMPTY = BoardPieceType.EMPTY.value
+PLANE = BoardPieceType.PLANE.value
+
+
+class RevealEngine:
+    """Opens board cells and automatically reveals areas of connected empty cells
+        along with the numbered cells bordering them (flood fill).
+    """
+    def __init__(self, cells: "BoardCells"):
+        """Initialize engine.
+
+        Args:
+            cells (BoardCells): Cell storage to open cells in.
+        """
+        self._cells = cells
+
+    def reveal(self, index: int) -> list[int]:
+        """Opens a cell and, if the cell is empty, all empty cells connected to it and
+            their neighbours. Marked cells are never opened and planes are not opened
+            by this method.
+
+        Args:
+            index (int): Index of the cell to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells in the order they were opened,
+                starting with the cell itself. Empty if nothing was opened.
+        """
+        return self.reveal_many([index])
+
+    def reveal_many(self, indexes: list[int]) -> list[int]:
+        """Opens several cells in one pass, along with the empty areas around them as
+            reveal() does. Areas reached from more than one of the cells are opened once.
+
+        Args:
+            indexes (list[int]): Indexes of the cells to open.
+
+        Returns:
+            list[int]: Indexes of all newly opened cells in the order they were opened,
+                starting with the given cells. Empty if nothing was opened.
+        """
+        cells = self._cells
+        types = cells.types
+        opened = cells.opened
+        marked = cells.marked
+        revealed = []
+
+        for index in indexes:
+            if opened[index] or marked[index] or types[index] == PLANE:
+                continue
+
+            cells.open(index)
+            revealed.append(index)
+
+        get_neighbours = cells.neighbours.neighbours
+
+        # breadth-first search using the list of revealed cells as the queue;
+        # a cell is queued only at the moment it's opened, so the opened flags act
+        # as the visited mask and no cell is processed twice
+        position = 0
+
+        while position < len(revealed):
+            current = revealed[position]
+            position += 1
+
+            if types[current] != EMPTY:
+                continue
+
+            for neighbour in get_neighbours(current):
+                if opened[neighbour] or marked[neighbour]:
+                    continue
+
+                # empty cell has no planes around it, so every neighbour is safe
+                cells.open(neighbour)
+                revealed.append(neighbour)
+
+        return revealed
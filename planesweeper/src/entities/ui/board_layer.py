@@ -0,0 +1,111 @@
+from entities.board import Gameboard
+from entities.board_changes import BoardChange
+from entities.board_piece import BoardPiece
+from entities.ui.board_grid_line import BoardGridLine
+from primitives.interfaces import RenderedLayer, RenderedObject
+from primitives.position import Position
+from primitives.size import Size
+
+
+class BoardGridLayer(RenderedLayer):
+    """Represents gameboard's grid lines as one layer under the pieces. Grid only
+        changes when the board is moved or its pieces are resized, so renderer does not
+        need to draw the lines again when pieces change or the board is created again.
+    """
+    def __init__(self, board: Gameboard):
+        """Initialize layer.
+
+        Args:
+            board (Gameboard): Gameboard whose grid is shown by the layer.
+        """
+        super().__init__(board.get_layout().get_position(), -1)
+        self._board = board
+
+    def get_position(self) -> Position:
+        return self._board.get_layout().get_position()
+
+    def get_layer_size(self) -> Size:
+        dimensions = self._board.get_dimensions()
+
+        # lines are drawn on both sides of the pieces
+        return Size(dimensions.width + 1, dimensions.height + 1)
+
+    def get_layer_key(self):
+        position = self._board.get_layout().get_position()
+
+        return (position.x, position.y, self._board.get_piece_dimensions().width)
+
+    def get_layer_items(self) -> list[RenderedObject]:
+        return [item for item in self._board.get_rendering_items()
+                if isinstance(item, BoardGridLine)]
+
+class BoardLayer(RenderedLayer):
+    """Represents gameboard's pieces as one layer, drawn over a BoardGridLayer. Layer
+        follows the board's changes, so that renderer only needs to draw again the pieces
+        changed by board's operations instead of comparing all pieces every frame.
+    """
+    def __init__(self, board: Gameboard):
+        """Initialize layer and start following the board.
+
+        Args:
+            board (Gameboard): Gameboard shown by the layer.
+        """
+        super().__init__(board.get_layout().get_position())
+        self._board = board
+        self._grid = BoardGridLayer(board)
+        self._changed: list[int] = []
+
+        board.get_changes().subscribe(self._add_change)
+
+    def _add_change(self, change: BoardChange):
+        self._changed.extend(change.indexes)
+
+    def close(self):
+        """Stop following the board, must be called when the layer is no longer shown.
+        """
+        self._board.get_changes().unsubscribe(self._add_change)
+
+    def get_board(self) -> Gameboard:
+        """Gets gameboard shown by the layer.
+
+        Returns:
+            Gameboard: Gameboard
+        """
+        return self._board
+
+    def get_grid_layer(self) -> BoardGridLayer:
+        """Gets layer of the board's grid lines, drawn under this layer.
+
+        Returns:
+            BoardGridLayer: Grid layer
+        """
+        return self._grid
+
+    def get_position(self) -> Position:
+        return self._board.get_layout().get_position()
+
+    def get_layer_size(self) -> Size:
+        return self._board.get_dimensions()
+
+    def get_layer_key(self):
+        # new cells when board is created again, new positions when it's moved
+        position = self._board.get_layout().get_position()
+
+        return (self._board.get_cells(), position.x, position.y,
+                self._board.get_piece_dimensions().width)
+
+    def get_layer_items(self) -> list[RenderedObject]:
+        return [item for item in self._board.get_rendering_items()
+                if isinstance(item, BoardPiece)]
+
+    def pop_changed_areas(self) -> list[tuple[Position, Size]]:
+        position = self._board.get_layout().get_position()
+        piece_size = self._board.get_piece_dimensions()
+        width = self._board.get_cells().width
+        areas = [(Position(position.x + index % width * piece_size.width,
+                           position.y + index // width * piece_size.height), piece_size)
+                 for index in dict.fromkeys(self._changed)]
+
+        self._changed.clear()
+
+        return areas
@@ -0,0 +1,36 @@
+from primitives.interfaces import RenderedObject
+from primitives.position import Position
+from primitives.size import Size
+from primitives.color import Color
+
+
+class ProbabilityTint(RenderedObject):
+    """Represents a translucent tint over a closed gameboard piece, stronger the more
+        likely the piece is to have a plane.
+    """
+    # most opaque tint, given to pieces certain to have a plane
+    MAX_ALPHA = 0.6
+
+    def __init__(self, position: Position, size: int, probability: float):
+        """Initialize tint.
+
+        Args:
+            position (Position): Top-left position of the piece.
+            size (int): Piece's size in pixels.
+            probability (float): Probability of the piece having a plane, between 0 and 1.
+        """
+        # drawn after the pieces having the same z-order
+        super().__init__(position)
+        self._size = size
+        self._probability = probability
+
+    def get_background_size(self) -> Size:
+        return Size(self._size, self._size)
+
+    def get_background_color(self) -> Color:
+        # safe pieces are tinted green, others from yellow to red
+        if self._probability == 0:
+            return Color(0, 200, 0, ProbabilityTint.MAX_ALPHA / 2)
+
+        return Color(255, int(220 * (1 - self._probability)), 0,
+                     ProbabilityTint.MAX_ALPHA * max(self._probability, 0.1))
@@ -2,7 +2,10 @@ import sys
 from pg.pygame_renderer import PygameRenderer
 from pg.pygame_events import PygameEvents
 from loop import CoreLoop
+from entities.board import GameboardConfiguration
+from services.board_pool_service import BoardPoolService
 from services.database_service import DatabaseService
+from services.no_guess_service import NoGuessService
 from services.language_service import LanguageService
 from repositories.configuration_repository import ConfigurationRepository
 from repositories.highscore_repository import HighScoreRepository
@@ -18,12 +21,23 @@ def run_game(game_database: DatabaseService,
     renderer = PygameRenderer(language_service.get_text("window_title"))
     pygame_events = PygameEvents()
 
+    # boards solvable without guessing are opt-in
+    no_guess = NoGuessService() if config_repo.get_no_guess() else None
+    board_pool = BoardPoolService(seed_finder=no_guess)
+    board_pool.prefill(GameboardConfiguration.LEVELS.keys())
+
     core_loop = CoreLoop(highscores_repository,
                          renderer,
                          pygame_events,
-                         language_service)
+                         language_service,
+                         board_pool)
     core_loop.run()
 
+    board_pool.stop()
+
+    if no_guess is not None:
+        no_guess.stop()
+
     game_database.close()
 
 def print_options():
@@ -32,6 +46,8 @@ def print_options():
     print()
     print("options:")
     print("  -setlang=[en|fi]  set game language (en by default)")
+    print("  -noguess=[on|off] use boards solvable without guessing on levels 1-3")
+    print("                    (off by default)")
     print()
 
 def set_language(args,
@@ -50,6 +66,22 @@ def set_language(args,
 
     print_options()
 
+def set_no_guess(args,
+                 config_repo: ConfigurationRepository):
+    """Change whether to use boards solvable without guessing.
+
+    Args:
+        args (str): Command-line --noguess=XX argument passed to the program
+        config_repo (ConfigurationRepository): Configuration repository to persist change to
+    """
+    parts = args.split("=")
+
+    if parts[1].lower() in ["on", "off"]:
+        config_repo.store_no_guess(parts[1].lower() == "on")
+        return
+
+    print_options()
+
 def configure(args,
               config_repo: ConfigurationRepository):
     """Handle game configuration from command-line parameters.
@@ -62,6 +94,8 @@ def configure(args,
         print_options()
     elif args[1].startswith("--setlang="):
         set_language(args[1], config_repo)
+    elif args[1].startswith("--noguess="):
+        set_no_guess(args[1], config_repo)
     else:
         print_options()
 
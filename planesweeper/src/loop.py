@@ -3,9 +3,11 @@ from primitives.interfaces import RenderedObject, Renderer, EventsCore
 from primitives.game import GameState, GameMode, GameInitialization, ChallengeGameProgress
 from primitives.state_transition import StateTransition
 from entities.board import Gameboard, BoardState, GameboardConfiguration
+from entities.practice_board import PracticeGameboard
 from entities.ui.text_overlay import TextOverlay
 from entities.ui.world_background import WorldBackground
 from repositories.highscore_repository import HighScoreRepository
+from services.board_pool_service import BoardPoolService
 from services.events_handling_service import EventsHandlingService, InputBuffer
 from services.language_service import LanguageService
 from services.ui_service import UiService
@@ -16,13 +18,15 @@ class CoreLoop:
                  highscores: HighScoreRepository,
                  renderer: Renderer,
                  events: EventsCore,
-                 language_service: LanguageService):
+                 language_service: LanguageService,
+                 board_pool: BoardPoolService = None):
         self._highscores = highscores
         self._renderer = renderer
         self._long_lived_elements = {}
         self._events_handler = EventsHandlingService(events, renderer)
         self._language_service = language_service
         self._ui_service = UiService(renderer, highscores, language_service)
+        self._board_pool = board_pool if board_pool is not None else BoardPoolService()
 
         background = WorldBackground(renderer)
         self._long_lived_elements["background"] = background
@@ -105,10 +109,12 @@ class CoreLoop:
         transition: StateTransition = None
 
         if game_result == BoardState.WON:
-            if game_initialization.mode == GameMode.SINGLE_GAME:
+            if game_initialization.mode != GameMode.CHALLENGE_GAME:
                 self._renderer.set_won_state()
                 transition = StateTransition(GameState.GAME_OVER)
-                if self._highscores.is_single_score_eligible(
+                # moves of practice games can be undone, so they get no high scores
+                if game_initialization.mode == GameMode.SINGLE_GAME and\
+                    self._highscores.is_single_score_eligible(
                     game_initialization.level,
                     game.get_elapsed_play_time()):
                     transition = StateTransition(GameState.GET_INITIALS)
@@ -117,7 +123,7 @@ class CoreLoop:
                 transition = StateTransition(GameState.PROCESS_CHALLENGE_ROUND_RESULT)
 
         if game_result == BoardState.LOST:
-            if game_initialization.mode == GameMode.SINGLE_GAME:
+            if game_initialization.mode != GameMode.CHALLENGE_GAME:
                 self._renderer.set_lost_state()
                 transition = StateTransition(GameState.GAME_OVER)
             else:
@@ -126,6 +132,18 @@ class CoreLoop:
 
         return transition
 
+    def _check_if_game_has_resumed(self,
+                                   game_initialization: GameInitialization,
+                                   game: Gameboard,
+                                   progress: ChallengeGameProgress) -> StateTransition:
+        # undoing the move that ended a practice game lets it continue
+        if game.get_current_board_state() != BoardState.RUNNING:
+            return None
+
+        self._long_lived_elements.pop("game_over_overlay", None)
+
+        return StateTransition(GameState.RUN_GAME, (game_initialization, game, progress))
+
     def _run_game(self,
                   state: GameState,
                   game_initialization: GameInitialization,
@@ -148,6 +166,12 @@ class CoreLoop:
                     game,
                     progress)
 
+            if transition is None and state == GameState.GAME_OVER:
+                transition = self._check_if_game_has_resumed(
+                    game_initialization,
+                    game,
+                    progress)
+
             if transition is not None:
                 break
 
@@ -176,7 +200,8 @@ class CoreLoop:
             self._highscores.store_single_highscore(
                 game_initialization.level,
                 game.get_elapsed_play_time(),
-                initials)
+                initials,
+                game.get_cells().get_3bv())
         else:
             self._highscores.store_challenge_highscore(
                 progress.score,
@@ -273,17 +298,17 @@ class CoreLoop:
             game_initialization = GameInitialization(1)
 
         if game_initialization.mode == GameMode.SINGLE_GAME:
-            game = Gameboard(game_initialization.level)
-            game.create()
+            game = self._board_pool.get_gameboard(game_initialization.level)
+        elif game_initialization.mode == GameMode.PRACTICE_GAME:
+            game = PracticeGameboard(game_initialization.level)
+            game.create(deferred=True)
         else:
             if game_initialization.ongoing_progress is None:
                 progress = ChallengeGameProgress()
-                game = Gameboard(1)
+                game = self._board_pool.get_gameboard(1)
             else:
                 progress = game_initialization.ongoing_progress
-                game = Gameboard(progress.current_level)
-
-            game.create()
+                game = self._board_pool.get_gameboard(progress.current_level)
 
         self._long_lived_elements["background"].position_board_on_world(game)
 
@@ -7,6 +7,22 @@ from primitives.position import Position
 class PygameEvents(EventsCore):
     """Implements event translation from Pygame events into internal EventData objects. 
     """
+    # events of keys pressed with Alt
+    ALT_KEYS = {
+        pygame.K_s: EventType.NEW_SINGLE_GAME,
+        pygame.K_c: EventType.NEW_CHALLENGE_GAME,
+        pygame.K_n: EventType.NEW_GAME,
+        pygame.K_p: EventType.NEW_PRACTICE_GAME,
+        pygame.K_z: EventType.UNDO_MOVE,
+        pygame.K_y: EventType.REDO_MOVE,
+        pygame.K_1: EventType.CHANGE_LEVEL_1,
+        pygame.K_2: EventType.CHANGE_LEVEL_2,
+        pygame.K_3: EventType.CHANGE_LEVEL_3,
+        pygame.K_4: EventType.CHANGE_LEVEL_4,
+        pygame.K_5: EventType.CHANGE_LEVEL_5,
+        pygame.K_6: EventType.CHANGE_LEVEL_6
+    }
+
     def _get_kb(self, event: pygame.event.Event):
         modifiers = pygame.key.get_mods()
         is_alt = modifiers & pygame.KMOD_ALT
@@ -21,24 +37,8 @@ class PygameEvents(EventsCore):
             # reports this bogus status for modifiers
             modifiers &= ~pygame.KMOD_NUM
 
-        if event.key == pygame.K_s and is_alt:
-            return EventData(EventType.NEW_SINGLE_GAME)
-        if event.key == pygame.K_c and is_alt:
-            return EventData(EventType. NEW_CHALLENGE_GAME)
-        if event.key == pygame.K_n and is_alt:
-            return EventData(EventType.NEW_GAME)
-        if event.key == pygame.K_1 and is_alt:
-            return EventData(EventType.CHANGE_LEVEL_1)
-        if event.key == pygame.K_2 and is_alt:
-            return EventData(EventType.CHANGE_LEVEL_2)
-        if event.key == pygame.K_3 and is_alt:
-            return EventData(EventType.CHANGE_LEVEL_3)
-        if event.key == pygame.K_4 and is_alt:
-            return EventData(EventType.CHANGE_LEVEL_4)
-        if event.key == pygame.K_5 and is_alt:
-            return EventData(EventType.CHANGE_LEVEL_5)
-        if event.key == pygame.K_6 and is_alt:
-            return EventData(EventType.CHANGE_LEVEL_6)
+        if is_alt and event.key in PygameEvents.ALT_KEYS:
+            return EventData(PygameEvents.ALT_KEYS[event.key])
 
         if not is_enter or is_upcase:
             return EventData(EventType.ALPHANUMERIC_KEY, None, event.unicode)
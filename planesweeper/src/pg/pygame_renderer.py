@@ -1,20 +1,71 @@
 import pygame
-from primitives.interfaces import Renderer, RenderedObject, Asset
+from primitives.interfaces import Renderer, RenderedObject, RenderedLayer, Asset
 from primitives.position import Position
 from primitives.border import Border
 from primitives.color import Color
 from primitives.size import Size
 from primitives.text_object import TextObject
 from services.asset_service import AssetService
+from entities.board_piece import BoardPiece
+from pg.sprite_atlas import SpriteAtlas
+from pg.text_cache import TextCache
 
 
+class LayerImage:
+    """Offscreen image of a layer's children, kept by the renderer between frames.
+
+    Attributes:
+        key: Layer's key when the image was drawn.
+        surface (pygame.Surface): Transparent image of the layer's size.
+        items (list[RenderedObject]): Layer's children sorted by z-order.
+        drawn (list[pygame.Rect]): Area drawn by each child on the image.
+    """
+    def __init__(self, key, surface: pygame.Surface, items: list[RenderedObject],
+                 drawn: list[pygame.Rect]):
+        self.key = key
+        self.surface = surface
+        self.items = items
+        self.drawn = drawn
+
+class ScreenCache:
+    """What the renderer keeps of the screen between frames, for redrawing only the
+        parts which have changed.
+
+    Attributes:
+        dirty_rects (bool): Redraw only changed parts of the screen (True) or the whole
+            screen every frame (False).
+        background (pygame.Surface): Screen without any objects, None when the whole
+            screen must be redrawn.
+        drawn (dict[tuple, tuple[pygame.Rect, pygame.Rect]]): Drawn and hovered areas
+            of the objects drawn last frame, by their looks.
+        layers (dict[RenderedLayer, LayerImage]): Images of the layers drawn last frame.
+    """
+    def __init__(self, dirty_rects: bool):
+        self.dirty_rects = dirty_rects
+        self.background: pygame.Surface = None
+        self.drawn: dict[tuple, tuple[pygame.Rect, pygame.Rect]] = {}
+        self.layers: dict[RenderedLayer, LayerImage] = {}
+
 class PygameRenderer(Renderer):
-    """Implements Renderer interface class using Pygame library. 
+    """Implements Renderer interface class using Pygame library.
+
+        In dirty rectangle mode only the objects which have moved or changed their looks
+        since the previous frame are redrawn, over a cached background and together with
+        anything overlapping them, and only their rectangles are updated on the display.
+
+        Children of layers are drawn into an offscreen image, which is drawn as one
+        object. Afterwards only the areas the layer reports as changed are drawn again
+        on the image, until the layer's key changes.
     """
+    # when more rectangles than this have changed, redrawing the whole screen is cheaper
+    # than redrawing the rectangles one by one
+    DIRTY_RECTS_MAX = 64
+
+    # most rendered texts kept, enough for every text on the screen with room to spare
+    TEXT_CACHE_SIZE = 256
+
     _loaded_images = {}
     _fonts = {}
-    _text_measurement_cache = {}
-    _status_font: pygame.font.Font = None
     _status_colors = {
         "game": pygame.Color(0, 0, 0),
         "won": pygame.Color(0, 220, 0),
@@ -22,7 +73,15 @@ class PygameRenderer(Renderer):
     }
 
     def __init__(self,
-                 window_title: str = None):
+                 window_title: str = None,
+                 dirty_rects: bool = True):
+        """Initialize renderer and open the game window.
+
+        Args:
+            window_title (str, optional): Title of the window. Defaults to None.
+            dirty_rects (bool, optional): Redraw only changed parts of the screen (True)
+                or the whole screen every frame (False). Defaults to True.
+        """
         super().__init__()
 
         pygame.init()
@@ -38,47 +97,86 @@ class PygameRenderer(Renderer):
         self._clock = pygame.time.Clock()
         self._screen = pygame.display.set_mode(
             (Renderer.WINDOW_WIDTH, Renderer.WINDOW_HEIGHT))
-        self._status_font = pygame.font.Font(
-            pygame.font.get_default_font(), 14)
+        # board pieces are drawn from an atlas of converted tiles for each piece size
+        self._sprites = self._load_sprites()
 
         self._current_status_color = self._status_colors["game"]
 
         self._last_cursor_is_hand = False
 
+        self._cache = ScreenCache(dirty_rects)
+        # top-left corner of the surface drawn on, other than (0,0) when drawing layers
+        self._origin = Position(0, 0)
+        # texts rendered for drawing and measuring
+        self._texts = TextCache(PygameRenderer.TEXT_CACHE_SIZE)
+
+    @staticmethod
+    def _load_sprites() -> dict[str, tuple[pygame.Surface, pygame.Rect]]:
+        sprites = {}
+
+        for piece_size in BoardPiece.PIXEL_SIZES:
+            sprites.update(SpriteAtlas(BoardPiece.get_asset_table(piece_size)).get_sprites())
+
+        return sprites
+
     def _get_font_for_text(self, font_size: int) -> pygame.font.Font:
         if font_size is None:
             # get default size'd font
             font_size = 11
 
-        font = None
-
         if font_size not in self._fonts:
-            font = pygame.font.Font(pygame.font.get_default_font(), font_size)
-        else:
-            font = self._fonts[font_size]
+            self._fonts[font_size] = pygame.font.Font(pygame.font.get_default_font(),
+                                                      font_size)
 
-        return font
+        return self._fonts[font_size]
 
     def _get_rendered_text(self, text_object: TextObject) -> pygame.Surface:
-        font = self._get_font_for_text(text_object.get_size())
         color = text_object.get_color()
+        key = (text_object.get_text(), text_object.get_size(),
+               (color.rgb_r, color.rgb_g, color.rgb_b, color.alpha))
+        rendered_text = self._texts.get(key)
+
+        if rendered_text is None:
+            font = self._get_font_for_text(text_object.get_size())
+            rendered_text = font.render(text_object.get_text(),
+                                        True,
+                                        pygame.Color(color.rgb_r,
+                                                     color.rgb_g,
+                                                     color.rgb_b,
+                                                     color.alpha * 255))
+            self._texts.put(key, rendered_text)
+
+        return rendered_text
+
+    def _get_image(self, asset: Asset) -> pygame.Surface:
+        if asset.key not in self._loaded_images:
+            image = pygame.image.load(asset.path)
+
+            # converted to display's pixel format once instead of on every blit
+            self._loaded_images[asset.key] = image.convert_alpha()\
+                if image.get_flags() & pygame.SRCALPHA else image.convert()
+
+        return self._loaded_images[asset.key]
+
+    def _get_image_rect(self, asset: Asset, pos: Position) -> pygame.Rect:
+        sprite = self._sprites.get(asset.key)
 
-        return font.render(text_object.get_text(),
-                                    True,
-                                    pygame.Color(color.rgb_r,
-                                                 color.rgb_g,
-                                                 color.rgb_b,
-                                                 color.alpha * 255))
+        if sprite is not None:
+            return pygame.Rect(pos.x, pos.y, sprite[1].width, sprite[1].height)
+
+        return self._get_image(asset).get_rect(topleft=(pos.x, pos.y))
 
     def _render_asset(self, asset: Asset, pos: Position) -> pygame.Rect:
-        if asset.key not in self._loaded_images:
-            self._loaded_images[asset.key] = pygame.image.load(asset.path)
+        sprite = self._sprites.get(asset.key)
 
-        return self._screen.blit(self._loaded_images[asset.key], (pos.x, pos.y))
+        if sprite is not None:
+            return self._screen.blit(sprite[0], (pos.x, pos.y), sprite[1])
 
-    def _render_text(self, text_object: TextObject, pos: Position) -> pygame.Rect:
+        return self._screen.blit(self._get_image(asset), (pos.x, pos.y))
+
+    def _get_text_position(self, text_object: TextObject, pos: Position,
+                           rendered_text: pygame.Surface) -> tuple[int, int]:
         relative_pos = text_object.get_position()
-        rendered_text = self._get_rendered_text(text_object)
 
         text_x = pos.x
         text_y = pos.y
@@ -95,16 +193,21 @@ class PygameRenderer(Renderer):
         else:
             text_y = pos.y + relative_pos.y
 
-        return self._screen.blit(rendered_text, (text_x, text_y))
+        return (text_x, text_y)
+
+    def _render_text(self, text_object: TextObject, pos: Position) -> pygame.Rect:
+        rendered_text = self._get_rendered_text(text_object)
+
+        return self._screen.blit(rendered_text,
+                                 self._get_text_position(text_object, pos, rendered_text))
 
     def _render_line(self, line: tuple[Position, Position, Color]):
         pygame.draw.line(self._screen,
-                            pygame.Color(
-                                line[2].rgb_r,
-                                line[2].rgb_g,
-                                line[2].rgb_b),
-                                (line[0].x, line[0].y),
-                                (line[1].x, line[1].y))
+                            (line[2].rgb_r,
+                             line[2].rgb_g,
+                             line[2].rgb_b),
+                                (line[0].x - self._origin.x, line[0].y - self._origin.y),
+                                (line[1].x - self._origin.x, line[1].y - self._origin.y))
 
     def _render_border(self, position: Position,
                        size: Size, border: Border):
@@ -171,6 +274,14 @@ class PygameRenderer(Renderer):
 
         return True
 
+    def _render_layer(self, layer: RenderedLayer, pos: Position) -> pygame.Rect:
+        return self._screen.blit(self._cache.layers[layer].surface, (pos.x, pos.y))
+
+    def _get_drawing_position(self, obj: RenderedObject) -> Position:
+        pos = self.calculate_child_position(obj.get_position())
+
+        return Position(pos.x - self._origin.x, pos.y - self._origin.y)
+
     def _render_item(self,
                      obj: RenderedObject,
                      mouse_pos: tuple[int,int]) -> bool:
@@ -178,9 +289,10 @@ class PygameRenderer(Renderer):
         image_asset = obj.get_asset()
         text = obj.get_text()
         line = obj.get_line()
-        rendered_rect = None
 
-        pos = self.calculate_child_position(obj.get_position())
+        pos = self._get_drawing_position(obj)
+        rendered_rect = self._render_layer(obj, pos) if isinstance(obj, RenderedLayer)\
+            else None
 
         if background_size is not None:
             rendered_rect = self._render_background(pos, background_size,
@@ -203,14 +315,79 @@ class PygameRenderer(Renderer):
         return self._is_mouse_over_rendered(rendered_rect, mouse_pos)\
             if mouse_pos is not None and rendered_rect is not None else None
 
-    def compose(self, objects: list[RenderedObject]):
+    @staticmethod
+    def _get_signature(obj: RenderedObject) -> tuple:
+        # everything drawing of the object depends on, equal for objects drawn alike
+        position = obj.get_position()
+        background_size = obj.get_background_size()
+        border = obj.get_border()
+        image_asset = obj.get_asset()
+        text = obj.get_text()
+        line = obj.get_line()
+
+        return (obj.get_z_order(), position.x, position.y,
+                None if background_size is None else (background_size.width,
+                                                      background_size.height,
+                                                      obj.get_background_color()),
+                None if border is None else (border.color, border.thickness),
+                None if image_asset is None else image_asset.path,
+                None if text is None else (text.get_text(), text.get_position().x,
+                                           text.get_position().y, text.get_size(),
+                                           text.get_color()),
+                None if line is None else (line[0].x, line[0].y, line[1].x, line[1].y,
+                                           line[2]))
+
+    @staticmethod
+    def _measure_background(obj: RenderedObject, pos: Position) -> list[pygame.Rect]:
+        background_size = obj.get_background_size()
+
+        if background_size is None:
+            return []
+
+        rect = pygame.Rect(pos.x, pos.y, background_size.width, background_size.height)
+
+        if obj.get_border() is None:
+            return [rect]
+
+        thickness = obj.get_border().thickness
+
+        return [rect, rect.inflate(2 * thickness + 1, 2 * thickness + 1)]
+
+    def _measure_item(self, obj: RenderedObject) -> tuple[pygame.Rect, pygame.Rect]:
+        # areas drawn and hovered over by _render_item()
+        pos = self.calculate_child_position(obj.get_position())
+
+        if isinstance(obj, RenderedLayer):
+            size = obj.get_layer_size()
+            return (pygame.Rect(pos.x, pos.y, size.width, size.height),) * 2
+
+        image_asset = obj.get_asset()
+        text = obj.get_text()
+        line = obj.get_line()
+        drawn = self._measure_background(obj, pos)
+
+        if image_asset is not None and image_asset.path is not None:
+            drawn.append(self._get_image_rect(image_asset, pos))
+
+        if text is not None:
+            rendered_text = self._get_rendered_text(text)
+            drawn.append(rendered_text.get_rect(
+                topleft=self._get_text_position(text, pos, rendered_text)))
+
+        hovered = drawn[0] if drawn else None
+
+        if line is not None:
+            drawn.append(pygame.Rect(min(line[0].x, line[1].x), min(line[0].y, line[1].y),
+                                     abs(line[1].x - line[0].x) + 1,
+                                     abs(line[1].y - line[0].y) + 1))
+
+        return (drawn[0].unionall(drawn[1:]) if drawn else pygame.Rect(0, 0, 0, 0), hovered)
+
+    def _compose_all(self, objects: list[RenderedObject],
+                     cursor_pos: tuple[int,int]) -> RenderedObject:
         # main game area
         self._screen.fill(self._current_status_color)
 
-        objects.sort(key=lambda rendered_object: rendered_object.get_z_order())
-
-        # get cursor position
-        cursor_pos = pygame.mouse.get_pos() if pygame.mouse.get_focused() else None
         over_object: RenderedObject = None
 
         # all objects
@@ -218,6 +395,135 @@ class PygameRenderer(Renderer):
             if self._render_item(obj, cursor_pos):
                 over_object = obj
 
+        return over_object
+
+    def _find_changes(self, objects: list[RenderedObject]) -> tuple[list[pygame.Rect],
+                                                                   list[tuple]]:
+        # rectangles to redraw, and drawn and hovered areas of each object
+        drawn = {}
+        dirty = []
+        rects = []
+
+        for obj in objects:
+            # layer looks different only when its image is drawn again
+            signature = (obj, self._cache.layers[obj]) if isinstance(obj, RenderedLayer)\
+                else self._get_signature(obj)
+            obj_rects = self._cache.drawn.get(signature)
+
+            if obj_rects is None:
+                obj_rects = self._measure_item(obj)
+                dirty.append(obj_rects[0])
+
+            drawn[signature] = obj_rects
+            rects.append(obj_rects)
+
+        # objects gone or changed since last frame
+        dirty.extend(obj_rects[0] for signature, obj_rects in self._cache.drawn.items()
+                     if signature not in drawn)
+        self._cache.drawn = drawn
+
+        return (dirty, rects)
+
+    def _compose_changes(self, objects: list[RenderedObject],
+                         cursor_pos: tuple[int,int],
+                         layer_changes: list[pygame.Rect]) -> RenderedObject:
+        dirty, rects = self._find_changes(objects)
+        dirty.extend(layer_changes)
+
+        if self._cache.background is None or len(dirty) > PygameRenderer.DIRTY_RECTS_MAX:
+            self._compose_all(objects, None)
+            self._cache.background = self._screen.copy()
+            self._cache.background.fill(self._current_status_color)
+            pygame.display.flip()
+        elif dirty:
+            self._redraw_rects(objects, [obj_rects[0] for obj_rects in rects], dirty)
+            pygame.display.update(dirty)
+
+        if cursor_pos is None:
+            return None
+
+        return next((obj for obj, (_, hovered) in zip(reversed(objects), reversed(rects))
+                     if hovered is not None and
+                     self._is_mouse_over_rendered(hovered, cursor_pos)), None)
+
+    def _redraw_rects(self, objects: list[RenderedObject], drawn: list[pygame.Rect],
+                      dirty: list[pygame.Rect]):
+        for rect in dirty:
+            self._screen.set_clip(rect)
+            self._screen.blit(self._cache.background, rect, rect)
+
+            # in drawing order, as objects are sorted by z-order
+            for index in rect.collidelistall(drawn):
+                self._render_item(objects[index], None)
+
+        self._screen.set_clip(None)
+
+    def _draw_layer_items(self, image: LayerImage, origin: Position, indexes):
+        # children are drawn on the layer's image instead of the screen
+        screen = self._screen
+        self._screen = image.surface
+        self._origin = origin
+
+        for index in indexes:
+            self._render_item(image.items[index], None)
+
+        self._screen = screen
+        self._origin = Position(0, 0)
+
+    def _draw_layer(self, layer: RenderedLayer, key) -> LayerImage:
+        size = layer.get_layer_size()
+        origin = self.calculate_child_position(layer.get_position())
+        items = sorted(layer.get_layer_items(),
+                       key=lambda rendered_object: rendered_object.get_z_order())
+        drawn = [self._measure_item(item)[0].move(-origin.x, -origin.y) for item in items]
+
+        image = LayerImage(key, pygame.Surface((size.width, size.height), pygame.SRCALPHA),
+                           items, drawn)
+        self._draw_layer_items(image, origin, range(len(items)))
+
+        return image
+
+    def _redraw_layer_areas(self, layer: RenderedLayer, image: LayerImage) -> list[pygame.Rect]:
+        origin = self.calculate_child_position(layer.get_position())
+        areas = [pygame.Rect(position.x, position.y, size.width, size.height)
+                 for position, size in layer.pop_changed_areas()]
+
+        for area in areas:
+            rect = area.move(-origin.x, -origin.y)
+            image.surface.set_clip(rect)
+            image.surface.fill((0, 0, 0, 0))
+            self._draw_layer_items(image, origin, rect.collidelistall(image.drawn))
+
+        image.surface.set_clip(None)
+
+        return areas
+
+    def _update_layers(self, objects: list[RenderedObject]) -> list[pygame.Rect]:
+        # screen rectangles changed on the layers' images
+        layers = {}
+        changed = []
+
+        for obj in objects:
+            if not isinstance(obj, RenderedLayer):
+                continue
+
+            image = self._cache.layers.get(obj)
+            key = obj.get_layer_key()
+
+            if image is None or image.key != key:
+                # whole layer is drawn, earlier changes are included
+                obj.pop_changed_areas()
+                image = self._draw_layer(obj, key)
+            else:
+                changed.extend(self._redraw_layer_areas(obj, image))
+
+            layers[obj] = image
+
+        self._cache.layers = layers
+
+        return changed
+
+    def _update_cursor(self, over_object: RenderedObject):
         if over_object is not None:
             if over_object.show_hand_cursor():
                 if not self._last_cursor_is_hand:
@@ -232,34 +538,44 @@ class PygameRenderer(Renderer):
                 pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
                 self._last_cursor_is_hand = False
 
-        pygame.display.flip()
+    def compose(self, objects: list[RenderedObject]):
+        objects.sort(key=lambda rendered_object: rendered_object.get_z_order())
+
+        # get cursor position
+        cursor_pos = pygame.mouse.get_pos() if pygame.mouse.get_focused() else None
+
+        layer_changes = self._update_layers(objects)
+
+        if self._cache.dirty_rects:
+            over_object = self._compose_changes(objects, cursor_pos, layer_changes)
+        else:
+            over_object = self._compose_all(objects, cursor_pos)
+            pygame.display.flip()
+
+        self._update_cursor(over_object)
 
     def tick(self):
         self._clock.tick(self._fps)
 
+    def _set_status_color(self, color: pygame.Color):
+        if color != self._current_status_color:
+            self._current_status_color = color
+            self._cache.background = None
+
     def set_game_state(self):
-        self._current_status_color = self._status_colors["game"]
+        self._set_status_color(self._status_colors["game"])
 
     def set_won_state(self):
-        self._current_status_color = self._status_colors["won"]
+        self._set_status_color(self._status_colors["won"])
 
     def set_lost_state(self):
-        self._current_status_color = self._status_colors["lost"]
+        self._set_status_color(self._status_colors["lost"])
 
     def measure_text_dimensions(self, text_object: TextObject) -> Size:
         if text_object is None:
             return None
 
-        text = text_object.get_text()
-        text_size = text_object.get_size()
-        cache_key = (text, text_size)
-        measured_size: Size = None
-
-        if cache_key not in self._text_measurement_cache:
-            rendered_text = self._get_rendered_text(text_object)
-            measured_size = Size(rendered_text.get_width(), rendered_text.get_height())
-            self._text_measurement_cache[cache_key] = measured_size
-        else:
-            measured_size = self._text_measurement_cache[cache_key]
+        # text is measured as rendered, and drawn later from the same cache
+        rendered_text = self._get_rendered_text(text_object)
 
-        return measured_size
+        return Size(rendered_text.get_width(), rendered_text.get_height())
@@ -0,0 +1,56 @@
+import pygame
+from primitives.asset import Asset
+
+
+class SpriteAtlas:
+    """Images of the same size packed side by side into surfaces converted to the
+        display's pixel format once, so that drawing them needs no conversion. Opaque
+        images are packed apart from the ones with alpha, as copying them is cheaper
+        than blending. Must be created after the display mode has been set.
+    """
+    def __init__(self, assets: list[Asset]):
+        """Load and pack images.
+
+        Args:
+            assets (list[Asset]): Image assets to pack, None and assets without image
+                file are left out.
+        """
+        images = [(asset.key, pygame.image.load(asset.path)) for asset in assets
+                  if asset is not None and asset.path is not None]
+
+        self._sprites: dict[str, tuple[pygame.Surface, pygame.Rect]] = {}
+        self._pack([(key, image) for key, image in images
+                    if not image.get_flags() & pygame.SRCALPHA], False)
+        self._pack([(key, image) for key, image in images
+                    if image.get_flags() & pygame.SRCALPHA], True)
+
+    def _pack(self, images: list[tuple[str, pygame.Surface]], alpha: bool):
+        if not images:
+            return
+
+        surface = pygame.Surface((sum(image.get_width() for _, image in images),
+                                  max(image.get_height() for _, image in images)),
+                                 pygame.SRCALPHA if alpha else 0, images[0][1])
+        areas = {}
+        x_pos = 0
+
+        for key, image in images:
+            # surface is fully transparent, so taking maximum copies pixels and alpha as
+            # they are instead of blending them
+            areas[key] = surface.blit(image, (x_pos, 0),
+                                      special_flags=pygame.BLEND_RGBA_MAX if alpha else 0)
+            x_pos += image.get_width()
+
+        surface = surface.convert_alpha() if alpha else surface.convert()
+
+        for key, area in areas.items():
+            self._sprites[key] = (surface, area)
+
+    def get_sprites(self) -> dict[str, tuple[pygame.Surface, pygame.Rect]]:
+        """Get packed images.
+
+        Returns:
+            dict[str, tuple[pygame.Surface, pygame.Rect]]: Surface and the area on it of
+                each image by asset key
+        """
+        return self._sprites
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+import pygame
+
+
+class TextCache:
+    """Rendered text surfaces kept for reuse, so that texts which stay the same between
+        frames are rendered only once. When full, the least recently used surface is
+        dropped first.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups not found in the cache.
+    """
+    def __init__(self, max_size: int):
+        """Initialize an empty cache.
+
+        Args:
+            max_size (int): Most surfaces kept at a time.
+        """
+        self._max_size = max_size
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(self, key: tuple) -> pygame.Surface:
+        """Get a surface and mark it used most recently.
+
+        Args:
+            key (tuple): Text, font size and color the surface was rendered with.
+
+        Returns:
+            pygame.Surface: Rendered text, None when it isn't cached
+        """
+        surface = self._surfaces.get(key)
+
+        if surface is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+
+        return surface
+
+    def put(self, key: tuple, surface: pygame.Surface):
+        """Add a surface, dropping the least recently used one when the cache is full.
+
+        Args:
+            key (tuple): Text, font size and color the surface was rendered with.
+            surface (pygame.Surface): Rendered text.
+        """
+        self._surfaces[key] = surface
+        self._surfaces.move_to_end(key)
+
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
@@ -12,12 +12,15 @@ class EventType(Enum):
     NEW_GAME = 4
     NEW_SINGLE_GAME = 5
     NEW_CHALLENGE_GAME = 6
+    NEW_PRACTICE_GAME = 7
     CHANGE_LEVEL_1 = 11
     CHANGE_LEVEL_2 = 12
     CHANGE_LEVEL_3 = 13
     CHANGE_LEVEL_4 = 14
     CHANGE_LEVEL_5 = 15
     CHANGE_LEVEL_6 = 16
+    UNDO_MOVE = 20
+    REDO_MOVE = 21
     ALPHANUMERIC_KEY = 40
 
 class EventData:
@@ -17,6 +17,7 @@ class GameMode(Enum):
     """
     SINGLE_GAME = 0
     CHALLENGE_GAME = 1
+    PRACTICE_GAME = 2
 
 class ChallengeGameProgress:
     """Progress tracking for on-going challenge game.
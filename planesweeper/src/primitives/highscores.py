@@ -1,10 +1,12 @@
 class SingleGameHighscore:
     """High-score board entry (time) for a won single game, specific for a level.
     """
-    def __init__(self, level: int, time: float, initials: str):
+    def __init__(self, level: int, time: float, initials: str, bbbv: int = None):
         self.level = level
         self.time = time
         self.initials = initials
+        # 3BV of the board, None for results stored before it was recorded
+        self.bbbv = bbbv
 
 class ChallengeGameHighscore:
     """High-score board entry (score) for a won challenge game.
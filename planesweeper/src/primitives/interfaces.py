@@ -146,6 +146,9 @@ class Renderer:
 class RenderedObject:
     """Base interface class for all UI drawn object classes to derive from.
     """
+    __slots__ = ("_position", "_text", "_background_size", "_background_color", "_border",
+                 "_z_order", "_use_hand_cursor", "_renderer")
+
     def __init__(self,
                  initial_position: Position = Position(0,0),
                  z_order: int = 0,
@@ -251,6 +254,50 @@ class RenderedObject:
         """
         return self._use_hand_cursor
 
+class RenderedLayer(RenderedObject):
+    """Base interface class for UI objects made of many child objects, such as the
+        gameboard. Renderer may draw the children once into an offscreen image, draw the
+        image as one object and afterwards draw again only the areas the layer reports
+        as changed.
+    """
+    def get_layer_size(self) -> Size:
+        """Gets size of the area covered by the children, starting from the layer's
+            position. Method in this base class does not implement any logic by design.
+
+        Returns:
+            Size: Size of the layer or None.
+        """
+        return None
+
+    def get_layer_key(self):
+        """Gets value identifying the layer's children and their positioning. Whenever
+            the value changes, whole layer must be drawn again. Method in this base class
+            does not implement any logic by design.
+
+        Returns:
+            Hashable value, compared for equality.
+        """
+        return None
+
+    def get_layer_items(self) -> list:
+        """Gets all child objects of the layer, positioned on the window like any other
+            UI objects. Method in this base class does not implement any logic by design.
+
+        Returns:
+            list[RenderedObject]: Child objects.
+        """
+        return []
+
+    def pop_changed_areas(self) -> list[tuple[Position, Size]]:
+        """Gets areas of the window in which children have changed since the previous
+            call, and forgets them. Method in this base class does not implement any
+            logic by design.
+
+        Returns:
+            list[tuple[Position, Size]]: Top-left position and size of each changed area.
+        """
+        return []
+
 class EventsCore:
     """Base interface class for all event handling implementations.
     """
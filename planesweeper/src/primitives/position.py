@@ -7,6 +7,8 @@ class Position:
         x_pos (int): Position in X-axis.
         y_pos (int): Position in Y-axis.
     """
+    __slots__ = ("x", "y")
+
     def __init__(self, x_pos: int, y_pos: int):
         """Initialize coordinate position.
 
@@ -50,6 +50,23 @@ class ConfigurationRepository:
         if language_id in ["en", "fi"]:
             self._store_configuration_setting("language", language_id)
 
+    def get_no_guess(self) -> bool:
+        """Get whether boards solvable without guessing are configured for the levels
+            allowing them.
+
+        Returns:
+            bool: True if configured, False by default.
+        """
+        return self._get_configuration_setting("no_guess") == "on"
+
+    def store_no_guess(self, enabled: bool):
+        """Change whether boards solvable without guessing are used.
+
+        Args:
+            enabled (bool): True to use boards solvable without guessing.
+        """
+        self._store_configuration_setting("no_guess", "on" if enabled else "off")
+
     def get_api_key(self) -> str:
         """Get configured Aviationstack API key.
 
@@ -26,7 +26,8 @@ class HighScoreRepository:
 
             highscore = SingleGameHighscore(row["level"],
                                             row["time"],
-                                            row["initials"])
+                                            row["initials"],
+                                            row["bbbv"])
             highscores.append(highscore)
 
         return sorted(highscores, key= lambda highscore: highscore.time)
@@ -70,13 +71,15 @@ class HighScoreRepository:
 
         return False
 
-    def store_single_highscore(self, level: int, time: float, initials: str):
+    def store_single_highscore(self, level: int, time: float, initials: str,
+                               bbbv: int = None):
         """Store single game completion time for a level with player initials as high-score.
 
         Args:
             level (int): Level for which to store high-score result.
             time (float): Completion time to store as a high-score result.
             initials (str): Player's initials to store for time.
+            bbbv (int, optional): 3BV of the completed board. Defaults to None.
         """
         if not self.is_single_score_eligible(level, time):
             return
@@ -90,7 +93,7 @@ class HighScoreRepository:
                                                       [level, max_time]):
                 return
 
-        self._database.store_row_to_table("single_highscores", (level, time, initials))
+        self._database.store_row_to_table("single_highscores", (level, time, initials, bbbv))
 
 
     def is_challenge_score_eligible(self, score: int) -> bool:
@@ -0,0 +1,227 @@
+import threading
+from collections import deque
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration
+
+
+class BoardPoolService:
+    """Keeps a bounded number of ready-made gameboards for each kind of board (level, or
+        custom size and number of planes), created ahead of time in a background thread.
+        Starting a new game takes a board from the pool without waiting for it to be
+        created, and the pool is refilled in the background after each board taken.
+
+        Planes of pooled boards are placed and numbers of their pieces calculated in the
+        background, which takes most of the time of creating a large board. If the first
+        opened piece has a plane, the planes are placed again at that point, so that the
+        first open is never a plane.
+
+        With a seed finder, boards of levels allowing it are solvable without guessing:
+        the pool searches for their planes in the background and hands them out with the
+        start piece in the middle of the board already opened. A search that runs out of
+        time is tried again after a growing pause, and after SEARCH_ATTEMPTS failed
+        searches a board with planes placed at random is pooled instead.
+    """
+    DEFAULT_POOL_SIZE = 2
+    SEARCH_ATTEMPTS = 3
+    # pause in seconds after the first failed search, doubled after each further one
+    SEARCH_BACKOFF = 0.1
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, seed_finder=None):
+        """Initialize service. Background thread is started when boards are first needed.
+
+        Args:
+            pool_size (int, optional): Number of boards kept ready for each kind of board.
+                Defaults to DEFAULT_POOL_SIZE.
+            seed_finder (optional): Object whose find_seed(configuration, position,
+                safe_area) gives a seed for a board solvable without guessing from
+                the position, or None if none was found, for example NoGuessService.
+                Used for levels allowing it (GameboardConfiguration.allows_no_guess).
+                Defaults to None which gives no boards solvable without guessing.
+        """
+        self._pool_size = pool_size
+        self._seed_finder = seed_finder
+        self._pools: dict[tuple[int, Size, int], deque[Gameboard]] = {}
+        self._condition = threading.Condition()
+        self._worker: threading.Thread = None
+        self._stopped = False
+
+    def _is_no_guess(self, key: tuple[int, Size, int]) -> bool:
+        return self._seed_finder is not None and GameboardConfiguration(*key).allows_no_guess
+
+    @staticmethod
+    def _create_gameboard(key: tuple[int, Size, int]) -> Gameboard:
+        level, size, planes = key
+
+        game = Gameboard(level, size=size, planes=planes)
+        game.create()
+
+        return game
+
+    def _create_no_guess_gameboard(self, key: tuple[int, Size, int]) -> Gameboard:
+        level, size, planes = key
+        configuration = GameboardConfiguration(level, size, planes)
+        position = Position(configuration.size.width // 2, configuration.size.height // 2)
+
+        # boards solvable without guessing are far more common when the first open
+        # reveals an empty area
+        seed = self._seed_finder.find_seed(configuration, position, True)
+
+        if seed is None:
+            return None
+
+        game = Gameboard(level, size=size, planes=planes)
+        game.create(deferred=True, safe_area=True, seed=seed, start=position)
+
+        return game
+
+    def _wait_for_stop(self, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._stopped, timeout)
+
+    def _create_pooled_gameboard(self, key: tuple[int, Size, int]) -> Gameboard:
+        if self._is_no_guess(key):
+            for attempt in range(BoardPoolService.SEARCH_ATTEMPTS):
+                game = self._create_no_guess_gameboard(key)
+
+                if game is not None:
+                    return game
+
+                # search ran out of time, pause before trying again
+                if self._wait_for_stop(BoardPoolService.SEARCH_BACKOFF * 2 ** attempt):
+                    return None
+
+        return self._create_gameboard(key)
+
+    def _get_unfilled_pool(self) -> tuple[int, Size, int]:
+        for key, pool in self._pools.items():
+            if len(pool) < self._pool_size:
+                return key
+
+        return None
+
+    def _refill_pools(self):
+        while True:
+            with self._condition:
+                key = self._get_unfilled_pool()
+
+                while key is None and not self._stopped:
+                    self._condition.wait()
+                    key = self._get_unfilled_pool()
+
+                if self._stopped:
+                    return
+
+            # board is created without holding the lock, so boards can be taken
+            # from the pools at the same time
+            game = self._create_pooled_gameboard(key)
+
+            with self._condition:
+                pool = self._pools.get(key)
+
+                # pools are cleared when the service is stopped
+                if pool is not None and len(pool) < self._pool_size:
+                    pool.append(game)
+
+                self._condition.notify_all()
+
+    def _request_refill(self, key: tuple[int, Size, int]):
+        # must be called holding the lock
+        self._pools.setdefault(key, deque())
+
+        if self._worker is None and not self._stopped:
+            self._worker = threading.Thread(target=self._refill_pools,
+                                            name="board-pool", daemon=True)
+            self._worker.start()
+
+        self._condition.notify_all()
+
+    def prefill(self, levels: list[int]):
+        """Start creating boards of given levels in the background.
+
+        Args:
+            levels (list[int]): Levels to keep boards ready for.
+
+        Raises:
+            ValueError: Some of the levels is not valid.
+        """
+        for level in levels:
+            GameboardConfiguration(level)
+
+        with self._condition:
+            for level in levels:
+                self._request_refill((level, None, None))
+
+    def get_gameboard(self, level: int, size: Size = None, planes: int = None) -> Gameboard:
+        """Get new gameboard ready for play. Board is taken from the pool if one is
+            available and created immediately otherwise; in both cases the pool is
+            refilled in the background. Board solvable without guessing is never
+            searched for here: if none is ready, a board with planes placed at random
+            is given instead.
+
+        Args:
+            level (int): Level of the board, or GameboardConfiguration.CUSTOM_LEVEL.
+            size (Size, optional): Custom board's size in pieces. Defaults to None.
+            planes (int, optional): Custom board's number of planes. Defaults to None.
+
+        Raises:
+            ValueError: Level, custom size or number of planes is not valid.
+
+        Returns:
+            Gameboard: Gameboard not given out before, with no moves played
+        """
+        key = (level, size, planes)
+        game = None
+
+        with self._condition:
+            if len(self._pools.get(key, ())) > 0:
+                game = self._pools[key].popleft()
+
+        if game is None:
+            # board kind is registered for refilling only after it proved to be valid
+            game = self._create_gameboard(key)
+
+        with self._condition:
+            self._request_refill(key)
+
+        return game
+
+    def get_pooled_count(self, level: int, size: Size = None, planes: int = None) -> int:
+        """Get number of boards currently ready in the pool.
+
+        Args:
+            level (int): Level of the board, or GameboardConfiguration.CUSTOM_LEVEL.
+            size (Size, optional): Custom board's size in pieces. Defaults to None.
+            planes (int, optional): Custom board's number of planes. Defaults to None.
+
+        Returns:
+            int: Number of pooled boards
+        """
+        with self._condition:
+            return len(self._pools.get((level, size, planes), ()))
+
+    def wait_until_filled(self, timeout: float = None) -> bool:
+        """Wait until all pools have been filled.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds.
+                Defaults to None which waits without limit.
+
+        Returns:
+            bool: True if pools were filled, False if timeout elapsed or service stopped
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._stopped or self._get_unfilled_pool() is None,
+                timeout) and not self._stopped
+
+    def stop(self):
+        """Stop background board creation and release pooled boards.
+        """
+        with self._condition:
+            self._stopped = True
+            self._pools.clear()
+            self._condition.notify_all()
+
+        if self._worker is not None:
+            self._worker.join()
@@ -18,7 +18,7 @@ class DatabaseService:
     def _initialize_tables(self):
         try:
             self._connection.execute(
-                "CREATE TABLE IF NOT EXISTS single_highscores(level, time, initials);")
+                "CREATE TABLE IF NOT EXISTS single_highscores(level, time, initials, bbbv);")
             self._connection.execute(
                 "CREATE TABLE IF NOT EXISTS challenge_highscores(score, initials);")
             self._connection.execute(
@@ -28,6 +28,22 @@ class DatabaseService:
         except sqlite3.OperationalError:
             self._is_available = False
 
+        self._add_missing_columns()
+
+    def _add_missing_columns(self):
+        # columns added after databases were already created by earlier versions
+        if not self._is_available:
+            return
+
+        try:
+            columns = [row[1] for row in
+                       self._connection.execute("PRAGMA table_info(single_highscores);")]
+
+            if "bbbv" not in columns:
+                self._connection.execute("ALTER TABLE single_highscores ADD COLUMN bbbv;")
+        except sqlite3.OperationalError:
+            self._is_available = False
+
     def _initialize_database(self, database_path: str, create_as_new: bool):
         try:
             # we MUST disable check for access from multiple threads as game's background
@@ -4,6 +4,7 @@ from primitives.position import Position
 from primitives.game import GameState, GameMode, GameInitialization
 from primitives.state_transition import StateTransition
 from entities.board import Gameboard
+from entities.practice_board import PracticeGameboard
 from entities.ui.button import Button
 
 
@@ -159,7 +160,7 @@ class EventsHandlingService:
         new_game: GameInitialization = None
 
         if existing_game is not None:
-            if mode == GameMode.SINGLE_GAME:
+            if mode != GameMode.CHALLENGE_GAME:
                 new_game = GameInitialization(existing_game.get_level(), mode)
             else:
                 # New challenge game from beginning
@@ -183,6 +184,10 @@ class EventsHandlingService:
         if event == EventType.NEW_CHALLENGE_GAME:
             next_state = self._process_new_game_event(None, 1, GameMode.CHALLENGE_GAME)
 
+        if event == EventType.NEW_PRACTICE_GAME:
+            # practice on the level being played
+            next_state = self._process_new_game_event(existing_game, 1, GameMode.PRACTICE_GAME)
+
         if event in (EventType.NEW_SINGLE_GAME, EventType.CHANGE_LEVEL_1):
             next_state = self._process_new_game_event(None, 1)
 
@@ -203,6 +208,37 @@ class EventsHandlingService:
 
         return next_state
 
+    def _process_move_history_event(self,
+                                    current_state: GameState,
+                                    event: EventType,
+                                    game: Gameboard) -> EventsHandlingResult:
+
+        # only moves of practice games can be undone
+        if current_state in (GameState.RUN_GAME, GameState.GAME_OVER) and\
+                isinstance(game, PracticeGameboard):
+            if event == EventType.UNDO_MOVE:
+                game.undo()
+            else:
+                game.redo()
+
+        return EventsHandlingResult(None)
+
+    def _process_game_event(self,
+                            current_state: GameState,
+                            data: EventData,
+                            game: Gameboard,
+                            ui_buttons: list[Button]) -> EventsHandlingResult:
+
+        if data.event in (EventType.UNDO_MOVE, EventType.REDO_MOVE):
+            return self._process_move_history_event(current_state, data.event, game)
+
+        return self._process_mouse_click_event(
+            current_state,
+            data.event,
+            data.position,
+            game,
+            ui_buttons)
+
     def _process_event(self,
                        data: EventData,
                        current_state: GameState,
@@ -218,17 +254,14 @@ class EventsHandlingService:
                 next_state = StateTransition(GameState.EXIT)
                 break
 
-            if data.event in (EventType.LEFT_CLICK, EventType.RIGHT_CLICK):
-                result = self._process_mouse_click_event(
-                    current_state,
-                    data.event,
-                    data.position,
-                    game,
-                    ui_buttons)
+            if data.event in (EventType.LEFT_CLICK, EventType.RIGHT_CLICK,
+                              EventType.UNDO_MOVE, EventType.REDO_MOVE):
+                result = self._process_game_event(current_state, data, game, ui_buttons)
 
             if data.event in (
                         EventType.NEW_SINGLE_GAME,
                         EventType.NEW_CHALLENGE_GAME,
+                        EventType.NEW_PRACTICE_GAME,
                         EventType.NEW_GAME,
                         EventType.CHANGE_LEVEL_1,
                         EventType.CHANGE_LEVEL_2,
@@ -25,5 +25,7 @@ class English(LanguageResource):
         "status_playtime": "Time: {0}",
         "status_score": "Current score: {0}",
         "status_new_game":
-            "Press Alt+S or Alt+[1-6] to start a new single game, Alt+C for challenge"
+            "Press Alt+S or Alt+[1-6] to start a new single game, Alt+C for challenge, " +\
+            "Alt+P for practice",
+        "practice_undo": "Alt+Z undoes and Alt+Y redoes a move in practice games."
     }
@@ -25,5 +25,8 @@ class Finnish(LanguageResource):
         "status_radar_contacts": "Tutkakontakteja: {0} / {1}",
         "status_playtime": "Aika: {0}",
         "status_score": "Tämänhetkiset pisteet: {0}",
-        "status_new_game": "Paina Alt+S tai Alt+[1-6] uusi yksittäispeli tai Alt+C haastepeli"
+        "status_new_game":
+            "Paina Alt+S tai Alt+[1-6] uusi yksittäispeli, Alt+C haastepeli tai " +\
+            "Alt+P harjoituspeli",
+        "practice_undo": "Harjoituspelissä Alt+Z peruu siirron ja Alt+Y tekee sen uudelleen."
     }
@@ -0,0 +1,124 @@
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from primitives.position import Position
+from entities.board import Gameboard, GameboardConfiguration
+from entities.board_solver import is_solvable_without_guessing
+
+
+def find_solvable_seed(configuration: GameboardConfiguration, position: Position,
+                       safe_area: bool, seeds: list[int]) -> int:
+    """Check candidate boards one seed at a time. Run in worker processes.
+
+    Args:
+        configuration (GameboardConfiguration): Board's level, size and planes.
+        position (Position): First opened piece.
+        safe_area (bool): Keep pieces around the first opened piece free of planes.
+        seeds (list[int]): Seeds to check.
+
+    Returns:
+        int: First seed giving a board solvable without guessing, None if there was none
+    """
+    for seed in seeds:
+        game = Gameboard(configuration.level, size=configuration.size,
+                         planes=configuration.planes)
+        game.create(deferred=True, safe_area=safe_area, seed=seed)
+        game.open_piece(position)
+
+        if is_solvable_without_guessing(game):
+            return seed
+
+    return None
+
+class NoGuessService:
+    """Finds plane placements that can be solved from the first opened piece without
+        guessing. Candidate boards are checked by the solver in a pool of worker
+        processes, one per CPU core, and the first solvable one is used. If none is
+        found within the time budget, no seed is given.
+
+        Search blocks the caller for at most the time budget, so it is run ahead of
+        time, for example by BoardPoolService in its background thread, and never when
+        a piece is opened.
+    """
+    DEFAULT_TIME_BUDGET = 0.5
+    SEEDS_PER_TASK = 8
+
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET, workers: int = None):
+        """Initialize service. Worker processes are started when first needed.
+
+        Args:
+            time_budget (float, optional): Maximum time in seconds to search for each
+                board. Defaults to DEFAULT_TIME_BUDGET.
+            workers (int, optional): Number of worker processes.
+                Defaults to None which uses one per CPU core.
+        """
+        self._time_budget = time_budget
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._workers)
+
+        return self._executor
+
+    def _fill_queue(self, pending: set[Future], configuration: GameboardConfiguration,
+                    position: Position, safe_area: bool):
+        executor = self._get_executor()
+
+        # keep every worker busy with the next batch queued behind it
+        while len(pending) < 2 * self._workers:
+            seeds = [random.getrandbits(64) for _ in range(NoGuessService.SEEDS_PER_TASK)]
+            pending.add(executor.submit(find_solvable_seed, configuration, position,
+                                        safe_area, seeds))
+
+    @staticmethod
+    def _get_found_seed(done: set[Future]) -> int:
+        for future in done:
+            seed = future.result()
+
+            if seed is not None:
+                return seed
+
+        return None
+
+    def find_seed(self, configuration: GameboardConfiguration, position: Position,
+                  safe_area: bool) -> int:
+        """Search for a seed giving a board solvable without guessing.
+
+        Args:
+            configuration (GameboardConfiguration): Board's level, size and planes.
+            position (Position): First opened piece.
+            safe_area (bool): Keep pieces around the first opened piece free of planes.
+
+        Returns:
+            int: Seed for placing the planes, None if no solvable board was found within
+                the time budget
+        """
+        deadline = time.monotonic() + self._time_budget
+        pending = set()
+
+        try:
+            while time.monotonic() < deadline:
+                self._fill_queue(pending, configuration, position, safe_area)
+
+                done, pending = wait(pending, deadline - time.monotonic(),
+                                     return_when=FIRST_COMPLETED)
+                seed = NoGuessService._get_found_seed(done)
+
+                if seed is not None:
+                    return seed
+        finally:
+            # batches already running are left to finish in the background
+            for future in pending:
+                future.cancel()
+
+        return None
+
+    def stop(self):
+        """Stop worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,142 @@
+import csv
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.bots import BotStrategy, BotMove
+
+
+RESULT_FIELDS = ("level", "seed", "won", "clicks", "seconds")
+
+
+def play_games(level: int, strategy: BotStrategy, seeds: list[int],
+               safe_area: bool = True) -> list[tuple[int, int, bool, int, float]]:
+    """Play one game for each seed with a bot. Run in worker processes.
+
+    Args:
+        level (int): Level of the boards.
+        strategy (BotStrategy): Bot making the moves.
+        seeds (list[int]): Seeds for placing the planes.
+        safe_area (bool, optional): Keep pieces around the first opened piece free of
+            planes, as in the game. Defaults to True.
+
+    Returns:
+        list[tuple[int, int, bool, int, float]]: For each game level, seed, was the game
+            won, number of moves made and time played in seconds
+    """
+    results = []
+
+    for seed in seeds:
+        started = time.perf_counter()
+
+        game = Gameboard(level)
+        game.create(deferred=True, safe_area=safe_area, seed=seed)
+        strategy.start(game, seed)
+        clicks = 0
+
+        while game.get_current_board_state() == BoardState.RUNNING:
+            move = strategy.next_move(game)
+
+            if move is None:
+                break  # bot gave up
+
+            action, position = move
+            clicks += 1
+
+            if action == BotMove.MARK:
+                game.mark_piece(position)
+            else:
+                game.open_piece(position)
+
+        results.append((level, seed, game.get_current_board_state() == BoardState.WON,
+                        clicks, time.perf_counter() - started))
+
+    return results
+
+class SimulationService:
+    """Plays large numbers of games with a bot without UI, for example to evaluate the
+        difficulty of the levels. Games are played directly on gameboards in a pool of
+        worker processes, one per CPU core, and results are written to a CSV file as
+        soon as each batch of games is done.
+    """
+    GAMES_PER_TASK = 100
+
+    def __init__(self, strategy: BotStrategy, workers: int = None, safe_area: bool = True):
+        """Initialize service.
+
+        Args:
+            strategy (BotStrategy): Bot playing the games.
+            workers (int, optional): Number of worker processes.
+                Defaults to None which uses one per CPU core.
+            safe_area (bool, optional): Keep pieces around the first opened piece free of
+                planes, as in the game. Defaults to True.
+        """
+        self._strategy = strategy
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._safe_area = safe_area
+
+    def _get_tasks(self, levels: list[int], games: int, rnd: random.Random):
+        for level in levels:
+            for first in range(0, games, SimulationService.GAMES_PER_TASK):
+                count = min(SimulationService.GAMES_PER_TASK, games - first)
+
+                yield (level, [rnd.getrandbits(64) for _ in range(count)])
+
+    @staticmethod
+    def _write_results(writer, results: list[tuple[int, int, bool, int, float]],
+                       summary: dict[int, tuple[int, int]]):
+        writer.writerows(results)
+
+        for level, _, won, _, _ in results:
+            played, wins = summary[level]
+            summary[level] = (played + 1, wins + won)
+
+    def run(self, levels: list[int], games: int, results_path: str,
+            seed: int = None) -> dict[int, tuple[int, int]]:
+        """Play games of each level and write a row for each game to a CSV file having
+            the columns of RESULT_FIELDS. Rows are in the order the games finish.
+
+        Args:
+            levels (list[int]): Levels to play.
+            games (int): Number of games played on each level.
+            results_path (str): File to write, replaced if it exists.
+            seed (int, optional): Seed for the boards' seeds, the same seed giving the same
+                games. Defaults to None which picks a random seed.
+
+        Raises:
+            ValueError: Some of the levels is not valid.
+
+        Returns:
+            dict[int, tuple[int, int]]: Number of games played and won by level
+        """
+        for level in levels:
+            GameboardConfiguration(level)
+
+        tasks = self._get_tasks(levels, games, random.Random(seed))
+        summary = {level: (0, 0) for level in levels}
+
+        with open(results_path, "w", newline="", encoding="utf-8") as results_file,\
+                ProcessPoolExecutor(self._workers) as executor:
+            writer = csv.writer(results_file)
+            writer.writerow(RESULT_FIELDS)
+            pending = set()
+
+            while True:
+                # a few tasks per worker are queued, so memory does not grow with games
+                for level, seeds in tasks:
+                    pending.add(executor.submit(play_games, level, self._strategy, seeds,
+                                                self._safe_area))
+
+                    if len(pending) >= 2 * self._workers:
+                        break
+
+                if not pending:
+                    return summary
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    self._write_results(writer, future.result(), summary)
+
+                results_file.flush()
@@ -1,7 +1,9 @@
 from entities.board import Gameboard, BoardState
+from entities.board_probabilities import PlaneProbabilities
 from entities.ui.text_overlay import TextOverlay
 from entities.ui.button import Button
 from entities.ui.status_item import StatusItem
+from entities.ui.board_layer import BoardLayer
 from primitives.interfaces import RenderedObject, Renderer
 from primitives.game import GameMode, GameInitialization, GameState, ChallengeGameProgress
 from primitives.position import Position
@@ -24,6 +26,7 @@ class UiService:
         self._renderer = renderer
         self._highscores = highscores
         self._language_service = language_service
+        self._board_layer: BoardLayer = None
 
     def _get_formatted_play_time(self, total_time: float) -> str:
         minutes = int(total_time // 60)
@@ -35,7 +38,10 @@ class UiService:
                               game_initialization: GameInitialization) -> str:
         text = ""
 
-        if game_initialization.mode == GameMode.SINGLE_GAME:
+        if game_initialization.mode == GameMode.PRACTICE_GAME:
+            # practice games are not eligible for high scores
+            text += f" {self._language_service.get_text('practice_undo')}"
+        elif game_initialization.mode == GameMode.SINGLE_GAME:
             high_scores = self._highscores.get_single_highscores(game_initialization.level)
 
             if len(high_scores) > 0:
@@ -193,16 +199,31 @@ class UiService:
 
     def render_gameboard(self,
                        rendered_objects: list[RenderedObject],
-                       game: Gameboard):
+                       game: Gameboard,
+                       probabilities: PlaneProbabilities = None):
         """Creates main gameboard UI elements.
 
         Args:
             rendered_objects (list[RenderedObject]):
                 Main list of rendered objects for which UI elements are added to.
             game (Gameboard): Current gameboard object.
+            probabilities (PlaneProbabilities, optional): Probabilities following the
+                gameboard, closed pieces are tinted by them if given. Defaults to None.
         """
-        for board_item in game.get_rendering_items():
-            rendered_objects.append(board_item)
+        if self._board_layer is None or self._board_layer.get_board() is not game:
+            if self._board_layer is not None:
+                self._board_layer.close()
+
+            self._board_layer = BoardLayer(game)
+
+        # pieces change only on board's operations and grid only when board is moved,
+        # so both are drawn as layers
+        rendered_objects.append(self._board_layer.get_grid_layer())
+        rendered_objects.append(self._board_layer)
+
+        if probabilities is not None:
+            rendered_objects.extend(game.get_probability_tints(
+                probabilities.get_probabilities()))
 
     def render_status_bar(self, rendered_objects: list[RenderedObject],
                            state: GameState,
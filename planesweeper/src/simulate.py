@@ -0,0 +1,46 @@
+import argparse
+import time
+from entities.board import GameboardConfiguration
+from entities.bots import RandomBot, SolverBot
+from services.simulation_service import SimulationService
+
+
+BOTS = {
+    "random": RandomBot,
+    "solver": SolverBot,
+    "probabilities": lambda: SolverBot(probabilities=True)
+}
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Read simulation options from the command line.
+
+    Returns:
+        argparse.Namespace: Options
+    """
+    parser = argparse.ArgumentParser(description="Play games with a bot without UI.")
+    parser.add_argument("--levels", type=int, nargs="+",
+                        default=list(GameboardConfiguration.LEVELS.keys()))
+    parser.add_argument("--games", type=int, default=1000, help="games per level")
+    parser.add_argument("--bot", choices=BOTS.keys(), default="solver")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="simulation.csv")
+
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    options = parse_arguments()
+    service = SimulationService(BOTS[options.bot](), options.workers)
+
+    started = time.perf_counter()
+    summary = service.run(options.levels, options.games, options.output, options.seed)
+    elapsed = time.perf_counter() - started
+
+    print(f"{'level':<10}{'games':>8}{'won':>8}{'win rate':>10}")
+
+    for level, (played, won) in summary.items():
+        print(f"{level:<10}{played:>8}{won:>8}{won / max(1, played) * 100:>9.1f}%")
+
+    total = sum(played for played, _ in summary.values())
+    print(f"{total} games in {elapsed:.1f} s, {total / elapsed * 60:.0f} games per minute")
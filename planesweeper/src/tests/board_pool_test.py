@@ -0,0 +1,120 @@
+import unittest
+from unittest import mock
+from primitives.size import Size
+from entities.board import BoardState, GameboardConfiguration
+from services.board_pool_service import BoardPoolService
+
+
+class TestBoardPoolService(unittest.TestCase):
+    def setUp(self):
+        self._pool = BoardPoolService(2)
+
+    def tearDown(self):
+        self._pool.stop()
+
+    def test_board_is_created_when_pool_is_empty(self):
+        game = self._pool.get_gameboard(3)
+
+        self.assertEqual(game.get_level(), 3)
+        self.assertEqual(game.get_current_board_state(), BoardState.RUNNING)
+        self.assertEqual(game.get_cells().counts.opened, 0)
+
+    def test_prefilled_pools_are_filled_in_background(self):
+        self._pool.prefill(GameboardConfiguration.LEVELS.keys())
+
+        self.assertTrue(self._pool.wait_until_filled(10))
+
+        for level in GameboardConfiguration.LEVELS:
+            self.assertEqual(self._pool.get_pooled_count(level), 2)
+
+    def test_pooled_boards_have_planes_placed(self):
+        self._pool.prefill([6])
+        self._pool.wait_until_filled(10)
+
+        game = self._pool.get_gameboard(6)
+
+        self.assertTrue(game._placement.is_placed())
+        self.assertEqual(game.get_cells().counts.opened, 0)
+
+    def test_pool_is_refilled_after_board_is_taken(self):
+        self._pool.prefill([1])
+        self._pool.wait_until_filled(10)
+
+        game = self._pool.get_gameboard(1)
+
+        self.assertEqual(game.get_level(), 1)
+        self.assertTrue(self._pool.wait_until_filled(10))
+        self.assertEqual(self._pool.get_pooled_count(1), 2)
+
+    def test_boards_are_given_out_only_once(self):
+        self._pool.prefill([2])
+        self._pool.wait_until_filled(10)
+
+        games = [self._pool.get_gameboard(2) for _ in range(5)]
+
+        self.assertEqual(len(set(map(id, games))), 5)
+
+    def test_custom_boards_are_pooled_by_size_and_planes(self):
+        size = Size(300, 300)
+        game = self._pool.get_gameboard(GameboardConfiguration.CUSTOM_LEVEL, size, 9000)
+
+        self.assertEqual(game.get_pieces_on_board(), 300 * 300)
+        self.assertEqual(game.get_total_planes(), 9000)
+        self.assertTrue(self._pool.wait_until_filled(10))
+        self.assertEqual(
+            self._pool.get_pooled_count(GameboardConfiguration.CUSTOM_LEVEL, size, 9000), 2)
+        self.assertEqual(
+            self._pool.get_pooled_count(GameboardConfiguration.CUSTOM_LEVEL, size, 100), 0)
+
+    def test_invalid_boards_are_not_pooled(self):
+        with self.assertRaises(ValueError):
+            self._pool.get_gameboard(GameboardConfiguration.get_max_level() + 1)
+        with self.assertRaises(ValueError):
+            self._pool.prefill([1, 0])
+
+        self.assertTrue(self._pool.wait_until_filled(10))
+
+        game = self._pool.get_gameboard(1)
+
+        self.assertEqual(game.get_level(), 1)
+
+    def test_stopped_pool_still_creates_boards(self):
+        self._pool.prefill([1])
+        self._pool.stop()
+
+        self.assertEqual(self._pool.get_pooled_count(1), 0)
+        self.assertEqual(self._pool.get_gameboard(1).get_level(), 1)
+        self.assertFalse(self._pool.wait_until_filled(1))
+
+    def test_boards_with_seed_finder_are_placed_ahead_of_time(self):
+        finder = mock.Mock()
+        finder.find_seed.return_value = 7
+        pool = BoardPoolService(1, seed_finder=finder)
+        pool.prefill([1])
+        self.assertTrue(pool.wait_until_filled(10))
+        game = pool.get_gameboard(1)
+        pool.stop()
+
+        configuration, position, safe_area = finder.find_seed.call_args.args
+        self.assertEqual(configuration.level, 1)
+        self.assertEqual((position.x, position.y), (2, 2))
+        self.assertTrue(safe_area)
+        self.assertEqual(game._placement.get_seed(), 7)
+        self.assertGreater(game.get_cells().counts.opened, 0)
+        self.assertEqual(game.get_current_board_state(), BoardState.RUNNING)
+
+    def test_failed_searches_fall_back_to_board_without_search(self):
+        finder = mock.Mock()
+        finder.find_seed.return_value = None
+        pool = BoardPoolService(1, seed_finder=finder)
+
+        with mock.patch.object(BoardPoolService, "SEARCH_BACKOFF", 0.01):
+            pool.prefill([1])
+            self.assertTrue(pool.wait_until_filled(10))
+
+        game = pool.get_gameboard(1)
+        pool.stop()
+
+        self.assertGreaterEqual(finder.find_seed.call_count, BoardPoolService.SEARCH_ATTEMPTS)
+        self.assertTrue(game._placement.is_placed())
+        self.assertEqual(game.get_cells().counts.opened, 0)
@@ -0,0 +1,186 @@
+import unittest
+import itertools
+import random
+from unittest import mock
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.practice_board import PracticeGameboard
+from entities.board_cells import PLANE, NUMBER
+from entities.board_solver import BoardSolver, ComponentEnumerator
+from entities.board_probabilities import PlaneProbabilities, get_component_weights
+from entities.ui.probability_tint import ProbabilityTint
+
+
+class TestPlaneProbabilities(unittest.TestCase):
+    def _create_board(self, width: int, height: int, plane_indexes: list[int]) -> Gameboard:
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(width, height),
+                         planes=len(plane_indexes))
+        game.create()
+        game.get_cells().place_planes(plane_indexes)
+
+        return game
+
+    def _count_placements(self, game: Gameboard) -> dict[int, float]:
+        # every placement of all planes on closed pieces agreeing with the opened numbers
+        cells = game.get_cells()
+        opened = [index for index in range(len(cells)) if cells.opened[index]]
+        closed = [index for index in range(len(cells)) if not cells.opened[index]]
+        occurrences = dict.fromkeys(closed, 0)
+        placements = 0
+
+        for planes in itertools.combinations(closed, game.get_total_planes()):
+            planes = set(planes)
+
+            if all(cells.numbers[index] == len(planes.intersection(
+                    cells.neighbours.neighbours(index))) for index in opened):
+                placements += 1
+
+                for index in planes:
+                    occurrences[index] += 1
+
+        return {index: count / placements for index, count in occurrences.items()}
+
+    def _play_until_guess(self, game: Gameboard, seed: int) -> Gameboard:
+        game.create(deferred=True, safe_area=True, seed=seed)
+        cells = game.get_cells()
+        game.open_piece(Position(cells.width // 2, cells.height // 2))
+        solver = BoardSolver(game)
+
+        while True:
+            deduction = solver.step()
+
+            if deduction.is_empty():
+                return game
+
+            for index in deduction.safe:
+                game.open_piece(solver.get_position(index))
+
+    def test_probabilities_match_counted_placements(self):
+        rnd = random.Random(13)
+
+        for _ in range(40):
+            width, height = rnd.randint(2, 5), rnd.randint(2, 4)
+            game = self._create_board(width, height,
+                                      rnd.sample(range(width * height),
+                                                 rnd.randint(1, width * height // 3 + 1)))
+            cells = game.get_cells()
+            probabilities = PlaneProbabilities(game)
+
+            for _ in range(3):
+                closed_safe = [index for index in range(len(cells))
+                               if not cells.opened[index] and cells.types[index] != PLANE]
+
+                if not closed_safe or game.get_current_board_state() != BoardState.RUNNING:
+                    break
+
+                index = rnd.choice(closed_safe)
+                game.open_piece(Position(index % width, index // width))
+
+                expected = self._count_placements(game)
+                calculated = probabilities.get_probabilities()
+
+                self.assertEqual(calculated.keys(), expected.keys())
+
+                for index, probability in expected.items():
+                    self.assertAlmostEqual(calculated[index], probability, places=12)
+
+    def test_probabilities_add_up_to_planes_of_board(self):
+        for level in (4, 5, 6):
+            game = self._play_until_guess(Gameboard(level), level)
+            probabilities = PlaneProbabilities(game)
+
+            self.assertAlmostEqual(sum(probabilities.get_probabilities().values()),
+                                   game.get_total_planes(), places=6)
+            self.assertTrue(probabilities.is_exact())
+
+    def test_interior_pieces_share_remaining_planes(self):
+        # number 1 next to two closed pieces, the other plane is on one of the three
+        # pieces away from the number
+        game = self._create_board(6, 1, [0, 5])
+        game.open_piece(Position(1, 0))
+        probabilities = PlaneProbabilities(game).get_probabilities()
+
+        self.assertEqual(probabilities.keys(), {0, 2, 3, 4, 5})
+        self.assertAlmostEqual(probabilities[0], 1 / 2)
+        self.assertAlmostEqual(probabilities[2], 1 / 2)
+
+        for index in (3, 4, 5):
+            self.assertAlmostEqual(probabilities[index], 1 / 3)
+
+    def test_marks_are_trusted_only_when_requested(self):
+        game = self._create_board(3, 2, [1])
+        game.open_piece(Position(0, 1))
+        game.mark_piece(Position(1, 0))
+
+        self.assertEqual(PlaneProbabilities(game, trust_marks=True).get_probabilities(),
+                         {0: 0.0, 1: 1.0, 2: 0.0, 4: 0.0, 5: 0.0})
+        self.assertAlmostEqual(PlaneProbabilities(game).get_probabilities()[1], 1 / 3)
+
+    def test_only_changed_groups_are_enumerated_again(self):
+        game = self._play_until_guess(Gameboard(GameboardConfiguration.CUSTOM_LEVEL,
+                                                size=Size(30, 16), planes=80), 2)
+        cells = game.get_cells()
+        probabilities = PlaneProbabilities(game)
+
+        with mock.patch.object(ComponentEnumerator, "count", autospec=True,
+                               side_effect=ComponentEnumerator.count) as count:
+            before = probabilities.get_probabilities()
+            groups = [set(call.args[0].cells) for call in count.call_args_list]
+
+            self.assertEqual(len(groups), 2)
+
+            count.reset_mock()
+
+            # nothing changed on the board
+            self.assertIs(probabilities.get_probabilities(), before)
+            self.assertEqual(count.call_count, 0)
+
+            # a number opened in one group leaves the other group as it was
+            changed, unchanged = groups if any(cells.types[index] == NUMBER
+                                               for index in groups[0]) else groups[::-1]
+            index = next(index for index in changed if cells.types[index] == NUMBER)
+            game.open_piece(Position(index % cells.width, index // cells.width))
+            probabilities.get_probabilities()
+
+            self.assertGreater(count.call_count, 0)
+            self.assertNotIn(unchanged, [set(call.args[0].cells)
+                                         for call in count.call_args_list])
+
+    def test_weights_count_planes_away_from_numbers(self):
+        # one group of a single cell, either empty or having a plane, and three
+        # interior cells sharing the rest of two planes
+        total, weights, interior_occurrences = get_component_weights([{0: 1, 1: 1}], 3, 2)
+
+        self.assertEqual(total, 3 + 3)
+        self.assertEqual(weights, [{0: 3, 1: 3}])
+        # a given interior cell has a plane in two placements of two planes and
+        # in one placement of one plane
+        self.assertEqual(interior_occurrences, 2 + 1)
+
+    def test_undone_opening_is_closed_again(self):
+        game = PracticeGameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(3, 2),
+                                 planes=1, undo_moves=5)
+        game.create()
+        game.get_cells().place_planes([1])
+        probabilities = PlaneProbabilities(game)
+        game.open_piece(Position(0, 1))
+        game.open_piece(Position(2, 1))
+        game.open_piece(Position(1, 1))
+        self.assertEqual(probabilities.get_probabilities()[1], 1.0)
+
+        game.undo()
+
+        self.assertEqual(probabilities.get_probabilities(), self._count_placements(game))
+        self.assertEqual(len(probabilities.get_probabilities()), 4)
+
+    def test_closed_pieces_are_tinted(self):
+        game = self._create_board(3, 2, [1])
+        game.open_piece(Position(0, 1))
+        game.mark_piece(Position(1, 0))
+
+        tints = game.get_probability_tints(PlaneProbabilities(game).get_probabilities())
+
+        self.assertEqual(len(tints), 4)
+        self.assertIsInstance(tints[0], ProbabilityTint)
+        self.assertEqual(tints[0].get_background_size(), game.get_piece_dimensions())
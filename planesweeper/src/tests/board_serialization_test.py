@@ -0,0 +1,150 @@
+import unittest
+import random
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.board_piece import BoardPieceType
+from entities.practice_board import PracticeGameboard
+from entities import board_format
+
+
+class TestBoardSerialization(unittest.TestCase):
+    def setUp(self):
+        self._random = random.Random(42)
+
+    def _play(self, game: Gameboard, moves: int):
+        size = game._configuration.size
+
+        for _ in range(moves):
+            position = Position(self._random.randrange(size.width),
+                                self._random.randrange(size.height))
+
+            if self._random.random() < 0.2:
+                game.mark_piece(position)
+            else:
+                game.open_piece(position)
+
+    def _assert_same_board(self, game: Gameboard, decoded: Gameboard):
+        self.assertEqual(decoded.get_level(), game.get_level())
+        self.assertEqual(decoded.get_pieces_on_board(), game.get_pieces_on_board())
+        self.assertEqual(decoded.get_total_planes(), game.get_total_planes())
+        self.assertEqual(decoded._placement.get_seed(), game._placement.get_seed())
+        self.assertEqual(decoded.get_current_board_state(), game.get_current_board_state())
+        self.assertEqual(decoded.get_cells().counts.opened, game.get_cells().counts.opened)
+        self.assertEqual(decoded.get_radar_contacts(), game.get_radar_contacts())
+        self.assertEqual(decoded._cells.pack_flags(), game._cells.pack_flags())
+        self.assertEqual(decoded._cells.counts.closed_safe, game._cells.counts.closed_safe)
+        self.assertEqual(type(decoded._cells), type(game._cells))
+
+        for index in range(game.get_pieces_on_board()):
+            self.assertEqual(decoded._cells.get_type(index), game._cells.get_type(index))
+            self.assertEqual(decoded._cells.get_number(index), game._cells.get_number(index))
+
+        decoded._cells.verify_counters()
+
+    def test_played_boards_round_trip(self):
+        for level in GameboardConfiguration.LEVELS:
+            for bitboard in (False, True):
+                game = Gameboard(level, bitboard=bitboard)
+                game.create()
+                self._play(game, 10)
+
+                self._assert_same_board(game, Gameboard.deserialize(game.serialize()))
+
+    def test_custom_chunked_board_round_trips(self):
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(300, 257), planes=15000)
+        game.create(deferred=True, safe_area=True)
+        self._play(game, 5)
+
+        decoded = Gameboard.deserialize(game.serialize())
+
+        self.assertEqual(decoded._cells.pack_flags(), game._cells.pack_flags())
+        self.assertEqual(decoded.get_cells().counts.opened, game.get_cells().counts.opened)
+        self.assertEqual(decoded._cells.counts.closed_safe, game._cells.counts.closed_safe)
+
+    def test_lost_board_round_trips(self):
+        game = Gameboard(2)
+        game.create()
+        game.open_piece(Position(0, 0))
+
+        index = next(index for index in range(game.get_pieces_on_board())
+                     if game._cells.get_type(index) == BoardPieceType.PLANE)
+        game.open_piece(game._get_position_from_index(index))
+
+        self.assertEqual(game.get_current_board_state(), BoardState.LOST)
+
+        decoded = Gameboard.deserialize(game.serialize())
+
+        self._assert_same_board(game, decoded)
+        self.assertAlmostEqual(decoded.get_elapsed_play_time(),
+                               game.get_elapsed_play_time(), places=3)
+
+    def test_deferred_board_places_planes_after_decoding(self):
+        game = Gameboard(4)
+        game.create(deferred=True, safe_area=True)
+
+        decoded = Gameboard.deserialize(game.serialize())
+
+        self.assertEqual(decoded.get_cells().counts.opened, 0)
+        self.assertEqual(decoded.get_elapsed_play_time(), 0.0)
+
+        decoded.open_piece(Position(5, 5))
+        game.open_piece(Position(5, 5))
+
+        # same seed and same first open give the same board
+        self.assertEqual(decoded._cells.pack_flags(), game._cells.pack_flags())
+
+    def test_seed_zero_is_kept_apart_from_no_seed(self):
+        game = Gameboard(4)
+        game.create(deferred=True, seed=0)
+
+        self.assertEqual(Gameboard.deserialize(game.serialize())._placement.get_seed(), 0)
+        self.assertIsNone(Gameboard.deserialize(Gameboard(4).serialize())._placement.get_seed())
+
+    def test_undone_first_open_is_kept_after_decoding(self):
+        game = PracticeGameboard(2)
+        game.create(deferred=True, seed=3)
+        game.open_piece(Position(4, 4))
+        game.undo()
+
+        decoded = PracticeGameboard.deserialize(game.serialize())
+        plane = next(index for index in range(decoded.get_pieces_on_board())
+                     if decoded._cells.get_type(index) == BoardPieceType.PLANE)
+        decoded.open_piece(decoded._get_position_from_index(plane))
+
+        self.assertIsInstance(decoded, PracticeGameboard)
+        self.assertEqual(decoded.get_current_board_state(), BoardState.LOST)
+
+    def test_decoding_accepts_memoryview(self):
+        game = Gameboard(3)
+        game.create()
+
+        data = bytearray(b"xx" + game.serialize())
+
+        self._assert_same_board(game, Gameboard.deserialize(memoryview(data)[2:]))
+
+    def test_encoded_size_is_three_bits_per_piece(self):
+        for level in GameboardConfiguration.LEVELS:
+            game = Gameboard(level)
+            game.create()
+
+            self.assertEqual(len(game.serialize()),
+                             board_format.HEADER.size + 3 * ((game.get_pieces_on_board() + 7) // 8))
+
+    def test_invalid_data_is_rejected(self):
+        game = Gameboard(1)
+        game.create()
+        data = game.serialize()
+
+        for invalid in [b"", data[:10], b"XXXX" + data[4:],
+                        data[:4] + bytes([board_format.VERSION + 1]) + data[5:],
+                        data[:-1], data + b"\x00"]:
+            with self.assertRaises(ValueError):
+                Gameboard.deserialize(invalid)
+
+        # level 1 header with level 2 size
+        header = board_format.BoardHeader(1, Size(9, 9), 10, 0)
+        flags = bytes(board_format.get_flags_length(Size(9, 9)))
+
+        with self.assertRaises(ValueError):
+            Gameboard.deserialize(board_format.pack_board(header, flags, flags, flags))
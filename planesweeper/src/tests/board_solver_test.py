@@ -0,0 +1,193 @@
+import unittest
+import random
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.practice_board import PracticeGameboard
+from entities.board_cells import PLANE
+from entities.board_solver import BoardSolver, ComponentEnumerator, SolverRule, \
+    get_changed_indexes
+
+
+class TestBoardSolver(unittest.TestCase):
+    def _create_board(self, width: int, height: int, plane_indexes: list[int]) -> Gameboard:
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(width, height),
+                         planes=len(plane_indexes))
+        game.create()
+        game.get_cells().place_planes(plane_indexes)
+
+        return game
+
+    def _create_number_row(self) -> Gameboard:
+        # closed top row with planes above the second and fourth piece,
+        # bottom row opened showing numbers 1 1 2 1 1
+        game = self._create_board(5, 2, [1, 3])
+
+        for x_pos in range(5):
+            game.open_piece(Position(x_pos, 1))
+
+        return game
+
+    def test_single_rule_finds_plane_next_to_number(self):
+        game = self._create_board(3, 1, [0])
+        game.open_piece(Position(2, 0))
+        solver = BoardSolver(game)
+
+        deduction = solver.step()
+
+        self.assertEqual(deduction.rule, SolverRule.SINGLE)
+        self.assertEqual(deduction.planes, [0])
+        self.assertEqual(deduction.safe, [])
+        self.assertEqual(solver.get_plane_cells(), [0])
+
+    def test_single_rule_uses_remaining_planes_of_board(self):
+        game = self._create_number_row()
+        game.mark_piece(Position(1, 0))
+        game.mark_piece(Position(3, 0))
+
+        deduction = BoardSolver(game).step()
+
+        self.assertEqual(deduction.rule, SolverRule.SINGLE)
+        self.assertEqual(deduction.safe, [0, 2, 4])
+
+    def test_pair_rule_solves_what_single_rule_cannot(self):
+        game = self._create_number_row()
+        solver = BoardSolver(game)
+
+        self.assertTrue(solver.step(SolverRule.SINGLE).is_empty())
+
+        deduction = solver.step(SolverRule.PAIR)
+
+        self.assertEqual(deduction.rule, SolverRule.PAIR)
+        self.assertEqual(deduction.safe, [0, 2, 4])
+        self.assertEqual(deduction.planes, [1, 3])
+        self.assertEqual(solver.get_safe_cells(), [0, 2, 4])
+
+    def test_opened_safe_cells_are_followed(self):
+        game = self._create_number_row()
+        solver = BoardSolver(game)
+        solver.step()
+
+        game.open_piece(Position(2, 0))
+        solver.step()
+
+        self.assertEqual(solver.get_safe_cells(), [0, 4])
+
+    def test_marks_are_trusted_only_when_requested(self):
+        game = self._create_board(3, 2, [1])
+        game.open_piece(Position(0, 1))
+        game.mark_piece(Position(1, 0))
+
+        self.assertEqual(BoardSolver(game).step().safe, [0, 4])
+        self.assertEqual(BoardSolver(game, trust_marks=False).step(SolverRule.PAIR).safe, [])
+
+    def test_unmarking_is_followed(self):
+        game = self._create_board(3, 2, [1])
+        game.open_piece(Position(0, 1))
+        game.mark_piece(Position(1, 0))
+        solver = BoardSolver(game)
+
+        game.mark_piece(Position(1, 0))
+
+        self.assertTrue(solver.step(SolverRule.PAIR).is_empty())
+
+    def test_undone_opening_is_closed_again(self):
+        game = PracticeGameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(3, 2),
+                                 planes=1, undo_moves=5)
+        game.create()
+        game.get_cells().place_planes([1])
+        solver = BoardSolver(game)
+        game.open_piece(Position(0, 1))
+        game.open_piece(Position(2, 1))
+        game.open_piece(Position(1, 1))
+        self.assertEqual(solver.step(SolverRule.PAIR).safe, [0, 2])
+
+        game.undo()
+
+        self.assertTrue(solver.update())
+        self.assertEqual(solver.get_states()[4], 0)
+        self.assertEqual(solver.get_states()[0], 0)
+        self.assertTrue(solver.step(SolverRule.PAIR).is_empty())
+
+        game.redo()
+
+        self.assertEqual(solver.step(SolverRule.PAIR).safe, [0, 2])
+
+    def test_enumerator_counts_placements_by_number_of_planes(self):
+        # two numbers needing one plane each, sharing the middle cell
+        results = ComponentEnumerator([10, 11, 12], [(1, [10, 11]), (1, [11, 12])])\
+            .enumerate(3, 1000)
+
+        self.assertEqual(results, {1: (1, [0, 1, 0]), 2: (1, [1, 0, 1])})
+
+    def test_enumerator_counts_interchangeable_cells_together(self):
+        results = ComponentEnumerator([1, 2, 3, 4], [(2, [1, 2, 3, 4])]).enumerate(10, 1000)
+
+        self.assertEqual(results, {2: (6, [3, 3, 3, 3])})
+
+    def test_enumerator_respects_limits(self):
+        enumerator = ComponentEnumerator([1, 2, 3], [(1, [1, 2]), (1, [2, 3])])
+
+        self.assertEqual(enumerator.enumerate(1, 1000), {1: (1, [0, 1, 0])})
+        self.assertIsNone(enumerator.enumerate(3, 2))
+        self.assertEqual(ComponentEnumerator([1], [(2, [1])]).enumerate(3, 1000), {})
+
+    def test_changed_flags_are_found(self):
+        old = bytes(200)
+        new = bytearray(old)
+        new[0] = 0b101
+        new[150] = 0b10000000
+
+        self.assertEqual(get_changed_indexes(old, bytes(new)), [0, 2, 1207])
+
+    def test_deductions_are_correct_during_play(self):
+        rnd = random.Random(7)
+        used_rules = set()
+
+        for level in GameboardConfiguration.LEVELS:
+            for bitboard in (False, True):
+                game = Gameboard(level, bitboard=bitboard)
+                game.create(deferred=True, seed=rnd.getrandbits(64))
+                cells = game.get_cells()
+                solver = BoardSolver(game)
+                game.open_piece(solver.get_position(rnd.randrange(len(cells))))
+
+                while game.get_current_board_state() == BoardState.RUNNING:
+                    deduction = solver.step()
+                    used_rules.add(deduction.rule)
+
+                    for index in deduction.planes:
+                        self.assertEqual(cells.types[index], PLANE)
+                        game.mark_piece(solver.get_position(index))
+
+                    for index in deduction.safe:
+                        self.assertNotEqual(cells.types[index], PLANE)
+                        game.open_piece(solver.get_position(index))
+
+                    if deduction.is_empty():
+                        # guess, but without losing the game
+                        closed_safe = [index for index in range(len(cells))
+                                       if not cells.opened[index] and cells.types[index] != PLANE]
+                        game.open_piece(solver.get_position(rnd.choice(closed_safe)))
+
+                self.assertEqual(game.get_current_board_state(), BoardState.WON)
+
+        self.assertEqual(used_rules, {SolverRule.NONE, SolverRule.SINGLE, SolverRule.PAIR,
+                                      SolverRule.ENUMERATION})
+
+    def test_large_custom_board_is_solved_incrementally(self):
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(200, 200), planes=4000)
+        game.create(deferred=True, safe_area=True, seed=3)
+        game.open_piece(Position(100, 100))
+        solver = BoardSolver(game)
+        solver.step()
+
+        for index in solver.get_safe_cells():
+            game.open_piece(solver.get_position(index))
+
+        deduction = solver.step(SolverRule.SINGLE)
+        cells = game.get_cells()
+
+        self.assertFalse(deduction.is_empty())
+        self.assertTrue(all(cells.types[index] == PLANE for index in deduction.planes))
+        self.assertTrue(all(cells.types[index] != PLANE for index in deduction.safe))
@@ -1,10 +1,17 @@
 import unittest
 import os
+import random
+from functools import partial
+from unittest import mock
 from primitives.position import Position
 from primitives.size import Size
-from entities.board_piece import BoardPiece, BoardPieceType
+from entities.board_piece import BoardPiece, BoardPieceType, PieceState
 from entities.ui.board_grid_line import BoardGridLine
 from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.board_cells import BoardCells, is_numpy_available
+from entities.chunked_board_cells import ChunkedBoardCells, CHUNK_SIZE
+from entities.bitboard_cells import BitboardCells
+from entities.neighbour_table import NeighbourTable
 from services.asset_service import AssetService
 
 
@@ -96,12 +103,229 @@ class TestGameboard(unittest.TestCase):
 
         self.assertEqual(planes, GameboardConfiguration.LEVELS[level][1])
 
+    def test_pieces_are_created_only_for_rendering(self):
+        board = Gameboard(6)
+        board.create()
+
+        board.open_piece(Position(10, 10))
+        board.mark_piece(Position(0, 0))
+
+        self.assertIsNone(board.get_layout()._piece_views)
+
+        board.get_rendering_items()
+
+        self.assertEqual(len(board.get_layout()._piece_views), board.get_pieces_on_board())
+
+    def test_piece_views_reflect_cell_state(self):
+        board = Gameboard(3)
+        board.create()
+
+        pieces = board._pieces
+
+        for index, piece in enumerate(pieces):
+            self.assertEqual(piece.get_type(), board._cells.get_type(index))
+            self.assertEqual(piece.get_number(), board._cells.get_number(index))
+
+            if piece.get_type() == BoardPieceType.PLANE:
+                board.mark_piece(board._get_position_from_index(index))
+
+                self.assertTrue(piece.is_marked())
+                self.assertTrue(board._cells.is_marked(index))
+                break
+
+    def test_cell_arrays_are_shared_with_numpy(self):
+        cells = BoardCells(4, 3)
+
+        if not is_numpy_available():
+            self.assertIsNone(cells.as_array(cells.opened))
+            return
+
+        array = cells.as_array(cells.opened)
+
+        self.assertEqual(array.shape, (3, 4))
+
+        cells.open(5)
+
+        self.assertEqual(array[1][1], 1)
+
+        array[2][3] = 1
+
+        self.assertTrue(cells.is_open(11))
+        self.assertEqual(cells.opened.count(1), 2)
+
+    def test_batched_and_per_cell_numbers_match(self):
+        if not is_numpy_available():
+            self.skipTest("NumPy is not installed")
+
+        for width, height, planes in [(5, 5, 3), (58, 29, 599), (40, 7, 200), (1, 9, 4)]:
+            plane_indexes = random.sample(range(0, width * height), planes)
+
+            per_cell = BoardCells(width, height)
+            per_cell.place_planes(plane_indexes, False)
+
+            batched = BoardCells(width, height)
+            batched.place_planes(plane_indexes, True)
+
+            self.assertEqual(per_cell.types, batched.types)
+            self.assertEqual(per_cell.numbers, batched.numbers)
+
+    def test_neighbour_tables_are_cached_for_latest_sizes(self):
+        first = NeighbourTable.get(5, 5)
+
+        self.assertIs(NeighbourTable.get(5, 5), first)
+        self.assertEqual(first.indexes.typecode, "H")
+
+        for width in range(1, NeighbourTable.CACHED_TABLES + 2):
+            NeighbourTable.get(width, 3)
+
+        self.assertEqual(NeighbourTable.get.cache_info().currsize, NeighbourTable.CACHED_TABLES)
+        self.assertIsNot(NeighbourTable.get(5, 5), first)
+        self.assertEqual(NeighbourTable(300, 300).indexes.typecode, "i")
+
+    def test_neighbour_table_contains_all_neighbours(self):
+        for width, height in [(1, 1), (1, 5), (5, 5), (15, 12)]:
+            table = NeighbourTable.get(width, height)
+
+            for index in range(width * height):
+                y_pos, x_pos = divmod(index, width)
+                expected = set()
+
+                for y_check in range(y_pos - 1, y_pos + 2):
+                    for x_check in range(x_pos - 1, x_pos + 2):
+                        if (x_check, y_check) == (x_pos, y_pos):
+                            continue
+                        if 0 <= x_check < width and 0 <= y_check < height:
+                            expected.add(y_check * width + x_check)
+
+                self.assertEqual(set(table.neighbours(index)), expected)
+                self.assertEqual(table.count(index), len(expected))
+
+    def test_neighbour_table_is_shared_between_boards_of_same_size(self):
+        first = Gameboard(4)
+        first.create()
+        second = Gameboard(4)
+        second.create()
+
+        self.assertIs(first._cells.neighbours, second._cells.neighbours)
+        self.assertIsNot(first._cells.neighbours, Gameboard(5)._cells.neighbours)
+
+    def test_counters_match_full_scan_during_play(self):
+        for level in GameboardConfiguration.LEVELS.keys():
+            board = Gameboard(level, debug=True)
+            board.create()
+
+            for index in random.sample(range(board.get_pieces_on_board()),
+                                       board.get_pieces_on_board() // 2):
+                position = board._get_position_from_index(index)
+
+                if board._cells.get_type(index) == BoardPieceType.PLANE:
+                    board.mark_piece(position)
+                    board.mark_piece(position)
+                    board.mark_piece(position)
+                else:
+                    board.open_piece(position)
+
+            cells = board._cells
+            cells.verify_counters()
+
+            self.assertEqual(board.get_radar_contacts(), cells.marked.count(1))
+
+    def test_counter_verification_detects_mismatch(self):
+        cells = BoardCells(5, 5)
+        cells.place_planes([0, 1, 2])
+        cells.open(10)
+        cells.verify_counters()
+
+        cells.opened[11] = 1
+
+        with self.assertRaises(RuntimeError):
+            cells.verify_counters()
+
+    def test_closed_safe_cells_are_counted(self):
+        cells = BoardCells(5, 5)
+        cells.place_planes([0, 1, 2])
+
+        self.assertEqual(cells.counts.closed_safe, 22)
+
+        cells.open(24)
+        cells.open(24)
+        cells.open(0)
+
+        self.assertEqual(cells.counts.closed_safe, 21)
+        self.assertEqual(cells.counts.opened, 2)
+
     def test_incorrect_levels_not_accepted(self):
         with self.assertRaises(ValueError):
             Gameboard(min(GameboardConfiguration.LEVELS.keys())-1)
         with self.assertRaises(ValueError):
             Gameboard(max(GameboardConfiguration.LEVELS.keys())+1)
 
+    def test_incorrect_custom_boards_not_accepted(self):
+        custom = GameboardConfiguration.CUSTOM_LEVEL
+
+        for size, planes in [(None, None), (Size(10, 10), None), (None, 10),
+                             (Size(0, 10), 1), (Size(2001, 10), 1), (Size(10, 2001), 1),
+                             (Size(10, 10), 100), (Size(10, 10), -1)]:
+            with self.assertRaises(ValueError):
+                Gameboard(custom, size=size, planes=planes)
+
+    def test_custom_board_is_created(self):
+        board = Gameboard(GameboardConfiguration.CUSTOM_LEVEL,
+                          size=Size(40, 30), planes=200)
+        board.create()
+
+        self.assertEqual(board.get_total_planes(), 200)
+        self.assertEqual(board.get_pieces_on_board(), 40 * 30)
+        self.assertEqual(sum(1 for piece in board._pieces
+                             if piece.get_type() == BoardPieceType.PLANE), 200)
+
+    def test_chunked_cells_match_flat_cells(self):
+        width, height = 150, 130
+        plane_indexes = random.sample(range(width * height), 3000)
+
+        for batched in (False, True):
+            if batched and not is_numpy_available():
+                continue
+
+            flat = BoardCells(width, height)
+            chunked = ChunkedBoardCells(width, height)
+            flat.place_planes(plane_indexes)
+            chunked.place_planes(plane_indexes, batched)
+
+            self.assertEqual(bytes(chunked.types), bytes(flat.types))
+            self.assertEqual(bytes(chunked.numbers), bytes(flat.numbers))
+            self.assertEqual(chunked.counts.closed_safe, flat.counts.closed_safe)
+
+    def test_chunked_cells_are_allocated_on_access(self):
+        cells = ChunkedBoardCells(2000, 2000)
+        cells.place_planes([0, 5, 3_999_999])
+
+        self.assertEqual(cells.get_allocated_chunks(), 0)
+
+        cells.open(2)
+
+        self.assertEqual(cells.get_number(1), 1)
+        self.assertEqual(cells.get_type(3_999_999), BoardPieceType.PLANE)
+        self.assertEqual(cells.counts.opened, 1)
+        # types and numbers of first and last chunk, opened flags of first chunk
+        self.assertEqual(cells.get_allocated_chunks(), 5)
+
+    def test_large_custom_board_uses_chunked_cells(self):
+        board = Gameboard(GameboardConfiguration.CUSTOM_LEVEL,
+                          size=Size(1000, 1000), planes=200_000)
+        board.create(deferred=True)
+
+        self.assertIsInstance(board._cells, ChunkedBoardCells)
+
+        board.open_piece(Position(500, 500))
+        board.mark_piece(Position(0, 0))
+
+        self.assertEqual(board.get_current_board_state(), BoardState.RUNNING)
+        self.assertGreater(board._cells.counts.opened, 0)
+        self.assertEqual(board.get_radar_contacts(), 1)
+        # far fewer than the chunks of the four arrays for the whole board
+        self.assertLess(board._cells.get_allocated_chunks(), 1000 * 1000 // CHUNK_SIZE)
+
     def test_correct_reported_number_of_planes(self):
         for level in GameboardConfiguration.LEVELS.keys():
             planes = GameboardConfiguration.LEVELS[level][1]
@@ -155,6 +379,47 @@ class TestGameboard(unittest.TestCase):
 
         self.assertEqual(board.get_current_board_state(), BoardState.RUNNING)
 
+    def test_deferred_board_places_planes_on_first_open(self):
+        for level in GameboardConfiguration.LEVELS.keys():
+            board = Gameboard(level)
+            board.create(deferred=True)
+
+            self.assertEqual(board._cells.types.count(BoardPieceType.PLANE.value), 0)
+
+            first = board._get_index_from_position(Position(1, 1))
+            board.mark_piece(Position(0, 0))
+            board.open_piece(Position(1, 1))
+
+            self.assertEqual(board._cells.types.count(BoardPieceType.PLANE.value),
+                             board.get_total_planes())
+            self.assertTrue(board._cells.is_open(first))
+            self.assertTrue(board._cells.is_marked(0))
+            self.assertEqual(board.get_current_board_state(), BoardState.RUNNING)
+            board._cells.verify_counters()
+
+    def test_deferred_board_with_safe_area_opens_empty_area_first(self):
+        for level in GameboardConfiguration.LEVELS.keys():
+            board = Gameboard(level)
+            board.create(deferred=True, safe_area=True)
+
+            pieces = board._pieces
+            board.open_piece(Position(2, 2))
+
+            first = board._get_index_from_position(Position(2, 2))
+
+            self.assertEqual(pieces[first].get_type(), BoardPieceType.EMPTY)
+
+            for neighbour in board._cells.neighbours.neighbours(first):
+                self.assertNotEqual(pieces[neighbour].get_type(), BoardPieceType.PLANE)
+                self.assertTrue(pieces[neighbour].is_open())
+
+    def test_start_piece_is_opened_before_game_starts(self):
+        board = Gameboard(3)
+        board.create(deferred=True, safe_area=True, seed=1, start=Position(7, 6))
+
+        self.assertGreater(board.get_cells().counts.opened, 0)
+        self.assertEqual(board.get_elapsed_play_time(), 0.0)
+
     def test_open_plane_piece_cause_losing(self):
         board = Gameboard(6)
         board.create()
@@ -282,7 +547,7 @@ class TestGameboard(unittest.TestCase):
         marked = 0
 
         for index, piece in enumerate(board._pieces):
-            if piece._marked:
+            if piece.is_marked():
                 marked += 1
 
         planes = board.get_total_planes()
@@ -461,4 +726,157 @@ class TestGameboard(unittest.TestCase):
             expected = os.path.join(path, f"plane-{in_pixels}.png")
 
             self.assertEqual(asset.path, expected)
-            self.assertTrue(os.path.exists(asset.path))
\ No newline at end of file
+            self.assertTrue(os.path.exists(asset.path))
+
+    def test_pieces_share_asset_table_of_their_size(self):
+        board = self._create_custom_board(3, 3, [0])
+        board.open_piece(Position(2, 2))
+        board.mark_piece(Position(0, 0))
+        pieces = board._pieces
+
+        self.assertFalse(hasattr(pieces[0], "__dict__"))
+        self.assertIs(pieces[0].get_asset(), BoardPiece.get_asset_table(15)[PieceState.MARKED])
+        self.assertIs(pieces[4].get_asset(), pieces[1].get_asset())
+        self.assertEqual([piece.get_state() for piece in pieces],
+                         [board.get_cells().get_state(index) for index in range(9)])
+
+    def _create_custom_board(self, width: int, height: int,
+                             plane_indexes: list[int]) -> Gameboard:
+        board = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(width, height),
+                          planes=len(plane_indexes), debug=True)
+        board.create()
+        board.get_cells().place_planes(plane_indexes)
+
+        return board
+
+    def test_chord_opens_surrounding_pieces_when_marks_match_number(self):
+        board = self._create_custom_board(3, 3, [0])
+        board.open_piece(Position(1, 1))
+        board.mark_piece(Position(0, 0))
+
+        board.open_piece(Position(1, 1))
+
+        self.assertEqual(board.get_cells().counts.opened, 8)
+        self.assertEqual(board.get_current_board_state(), BoardState.WON)
+
+    def test_chord_reveals_empty_areas_of_surrounding_pieces(self):
+        board = self._create_custom_board(6, 1, [0])
+        board.open_piece(Position(1, 0))
+        board.mark_piece(Position(0, 0))
+
+        board.open_piece(Position(1, 0))
+
+        self.assertEqual(board.get_cells().counts.opened, 5)
+        self.assertEqual(board.get_current_board_state(), BoardState.WON)
+
+    def test_chord_is_ignored_when_marks_do_not_match_number(self):
+        board = self._create_custom_board(3, 3, [0])
+        board.open_piece(Position(1, 1))
+
+        board.open_piece(Position(1, 1))
+
+        self.assertEqual(board.get_cells().counts.opened, 1)
+        self.assertEqual(board.get_current_board_state(), BoardState.RUNNING)
+
+    def test_chord_with_wrong_mark_causes_losing(self):
+        board = self._create_custom_board(3, 3, [0])
+        board.open_piece(Position(1, 1))
+        board.mark_piece(Position(1, 0))
+
+        board.open_piece(Position(1, 1))
+
+        self.assertEqual(board.get_current_board_state(), BoardState.LOST)
+        self.assertTrue(board.get_cells().is_open(0))
+        self.assertFalse(board.get_cells().is_open(8))
+
+    def test_cells_reveal_many_in_one_pass(self):
+        plane_indexes = random.sample(range(0, 30 * 16), 60)
+        revealed = []
+
+        for cells in (BoardCells(30, 16), ChunkedBoardCells(30, 16), BitboardCells(30, 16)):
+            cells.place_planes(plane_indexes)
+            cells.mark(plane_indexes[0])
+            opened = cells.reveal_many(list(range(0, 30 * 16, 7)))
+
+            self.assertEqual(len(opened), len(set(opened)))
+            self.assertEqual(len(opened), cells.counts.opened)
+            cells.verify_counters()
+            revealed.append(sorted(opened))
+
+        self.assertEqual(revealed[0], revealed[1])
+        self.assertEqual(revealed[0], revealed[2])
+
+    def test_changed_cells_are_published_to_subscribers(self):
+        board = self._create_custom_board(30, 30, [0, 1, 30, 899])
+        changes = []
+        board.get_changes().subscribe(changes.append)
+
+        board.open_piece(Position(15, 15))
+
+        self.assertEqual(len(changes[0]), board.get_cells().counts.opened)
+        self.assertEqual(dict(changes[0])[15 * 30 + 15], PieceState.EMPTY)
+        self.assertEqual(dict(changes[0])[31], PieceState.of_number(3))
+
+        board.mark_piece(Position(0, 0))
+        board.mark_piece(Position(0, 0))
+
+        self.assertEqual([list(change) for change in changes[1:]],
+                         [[(0, PieceState.MARKED)], [(0, PieceState.CLOSED)]])
+
+        board.open_piece(Position(29, 29))
+
+        self.assertEqual(list(changes[-1]), [(899, PieceState.PLANE)])
+        self.assertEqual(changes[-1].board_state, BoardState.LOST)
+
+        board.get_changes().unsubscribe(changes.append)
+        board.create()
+        board.open_piece(Position(15, 15))
+
+        self.assertEqual(len(changes), 4)
+
+class TestBitboardGameboard(TestGameboard):
+    """Runs all gameboard scenarios again with cells kept as bitboards.
+    """
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch(f"{__name__}.Gameboard", partial(Gameboard, bitboard=True))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_large_custom_board_uses_chunked_cells(self):
+        board = Gameboard(GameboardConfiguration.CUSTOM_LEVEL,
+                          size=Size(300, 300), planes=10_000)
+        board.create()
+
+        self.assertIsInstance(board._cells, BitboardCells)
+
+    def test_bitboard_numbers_match_byte_arrays(self):
+        for width, height, planes in [(1, 1, 0), (1, 9, 4), (9, 1, 4), (5, 5, 3),
+                                      (58, 29, 599), (40, 7, 200), (64, 3, 50)]:
+            plane_indexes = random.sample(range(0, width * height), planes)
+
+            cells = BoardCells(width, height)
+            cells.place_planes(plane_indexes)
+
+            bitboard = BitboardCells(width, height)
+            bitboard.place_planes(plane_indexes)
+
+            self.assertEqual(list(bitboard.types), list(cells.types))
+            self.assertEqual(list(bitboard.numbers), list(cells.numbers))
+            self.assertEqual(bitboard.counts.closed_safe, cells.counts.closed_safe)
+
+    def test_bitboard_win_is_detected_from_masks(self):
+        cells = BitboardCells(3, 3)
+        cells.place_planes([4])
+
+        for index in range(9):
+            self.assertFalse(cells.is_cleared())
+
+            if index == 4:
+                cells.mark(index)
+            else:
+                cells.open(index)
+
+        self.assertTrue(cells.is_cleared())
+        cells.verify_counters()
@@ -68,3 +68,14 @@ class TestGameConfiguration(unittest.TestCase):
         set_lang_new = config_repo.get_languge()
 
         self.assertEqual(set_lang_new, language)
+
+    def test_no_guess_is_off_unless_set(self):
+        config_repo = ConfigurationRepository(self._database_service)
+
+        self.assertFalse(config_repo.get_no_guess())
+
+        game.configure(['', '--noguess=on'], config_repo)
+        self.assertTrue(config_repo.get_no_guess())
+
+        game.configure(['', '--noguess=off'], config_repo)
+        self.assertFalse(config_repo.get_no_guess())
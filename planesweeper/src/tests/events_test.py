@@ -3,7 +3,9 @@ from primitives.interfaces import EventsCore, Renderer, EventData, EventType
 from primitives.position import Position
 from primitives.size import Size
 from services.events_handling_service import InputBuffer, EventsHandlingService
-from primitives.game import GameState
+from primitives.game import GameState, GameMode
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.practice_board import PracticeGameboard
 from entities.ui.button import Button
 
 class EventsMock(EventsCore):
@@ -37,6 +39,16 @@ class EventsMock(EventsCore):
         
         return data
 
+class QueuedEventsMock(EventsCore):
+    def __init__(self, events: list[EventType]):
+        self.events = list(events)
+
+    def get(self) -> EventData:
+        if not self.events:
+            return EventData(EventType.NONE)
+
+        return EventData(self.events.pop(0))
+
 class TestEventsHandling(unittest.TestCase):
     def setUp(self):
         pass
@@ -98,3 +110,65 @@ class TestEventsHandling(unittest.TestCase):
 
         self.assertIsNone(transition)
         self.assertEqual(read, EventsMock.keypresses[:keypresses_count])
+
+    def _click_piece(self, game: Gameboard, position: Position, left: bool = True):
+        pixels = game.get_piece_dimensions().width
+        click_pos = Position(position.x * pixels + pixels // 2, position.y * pixels + pixels // 2)
+        service = EventsHandlingService(EventsMock(left, not left, click_pos))
+
+        service.process_events(GameState.RUN_GAME, None, game)
+
+    def test_click_on_opened_number_opens_surrounding_pieces(self):
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(3, 3), planes=1)
+        game.create()
+        game.get_cells().place_planes([0])
+
+        self._click_piece(game, Position(1, 1))
+        self._click_piece(game, Position(0, 0), False)
+
+        self.assertEqual(game.get_cells().counts.opened, 1)
+
+        self._click_piece(game, Position(1, 1))
+
+        self.assertEqual(game.get_cells().counts.opened, 8)
+        self.assertEqual(game.get_current_board_state(), BoardState.WON)
+
+    def test_moves_of_practice_game_are_undone_and_redone(self):
+        game = PracticeGameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(3, 1), planes=1)
+        game.create()
+        game.get_cells().place_planes([0])
+        game.open_piece(Position(2, 0))
+        game.mark_piece(Position(0, 0))
+
+        service = EventsHandlingService(QueuedEventsMock([EventType.UNDO_MOVE]))
+        service.process_events(GameState.GAME_OVER, None, game)
+
+        self.assertEqual(game.get_radar_contacts(), 0)
+        self.assertEqual(game.get_current_board_state(), BoardState.RUNNING)
+
+        service = EventsHandlingService(QueuedEventsMock([EventType.REDO_MOVE]))
+        service.process_events(GameState.RUN_GAME, None, game)
+
+        self.assertEqual(game.get_current_board_state(), BoardState.WON)
+
+    def test_moves_of_timed_game_are_not_undone(self):
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(3, 1), planes=1)
+        game.create()
+        game.get_cells().place_planes([0])
+        game.open_piece(Position(2, 0))
+        game.mark_piece(Position(0, 0))
+
+        service = EventsHandlingService(QueuedEventsMock([EventType.UNDO_MOVE]))
+        service.process_events(GameState.GAME_OVER, None, game)
+
+        self.assertEqual(game.get_current_board_state(), BoardState.WON)
+
+    def test_new_practice_game_keeps_level(self):
+        game = Gameboard(4)
+        service = EventsHandlingService(QueuedEventsMock([EventType.NEW_PRACTICE_GAME]))
+
+        transition = service.process_events(GameState.RUN_GAME, None, game)
+
+        self.assertEqual(transition.next, GameState.INITIALIZE_NEW_GAME)
+        self.assertEqual(transition.data.mode, GameMode.PRACTICE_GAME)
+        self.assertEqual(transition.data.level, 4)
@@ -3,7 +3,10 @@ from loop import CoreLoop
 from primitives.interfaces import Renderer, EventsCore
 from primitives.game import GameInitialization, GameMode, GameState, ChallengeGameProgress
 from primitives.state_transition import StateTransition
-from entities.board import Gameboard, GameboardConfiguration
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.practice_board import PracticeGameboard
+from primitives.position import Position
+from primitives.size import Size
 from services.database_service import DatabaseService
 from services.language_service import LanguageService
 from repositories.highscore_repository import HighScoreRepository
@@ -307,3 +310,54 @@ class TestCoreLoop(unittest.TestCase):
 
         _ = core_loop._render_overlays(GameState.GET_INITIALS, game_initialization, game, None)
         self.assertTrue("initials_overlay" in core_loop._long_lived_elements)
+
+    def _create_practice_board(self) -> PracticeGameboard:
+        game = PracticeGameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(3, 1), planes=1)
+        game.create()
+        game.get_cells().place_planes([0])
+
+        return game
+
+    def test_practice_game_initialization_state_transition(self):
+        core_loop = self._core_loop
+        game_initialization: GameInitialization = GameInitialization(2, GameMode.PRACTICE_GAME)
+
+        transition: StateTransition = core_loop._initialize_new_game(game_initialization)
+
+        game_initialization, game, progress = transition.data
+
+        self.assertEqual(transition.next, GameState.RUN_GAME)
+        self.assertEqual(game_initialization.mode, GameMode.PRACTICE_GAME)
+        self.assertIsInstance(game, PracticeGameboard)
+        self.assertEqual(game.get_level(), 2)
+        self.assertIsNone(progress)
+
+    def test_won_practice_game_gets_no_high_score(self):
+        core_loop = self._core_loop
+        game_initialization: GameInitialization = GameInitialization(0, GameMode.PRACTICE_GAME)
+        game = self._create_practice_board()
+
+        game.open_piece(Position(2, 0))
+        game.mark_piece(Position(0, 0))
+
+        self.assertEqual(game.get_current_board_state(), BoardState.WON)
+
+        transition = core_loop._check_if_game_has_ended(game_initialization, game, None)
+
+        self.assertEqual(transition.next, GameState.GAME_OVER)
+
+    def test_undone_practice_game_is_resumed(self):
+        core_loop = self._core_loop
+        game_initialization: GameInitialization = GameInitialization(0, GameMode.PRACTICE_GAME)
+        game = self._create_practice_board()
+        game.open_piece(Position(2, 0))
+        game.open_piece(Position(0, 0))
+
+        self.assertIsNone(core_loop._check_if_game_has_resumed(game_initialization, game, None))
+
+        game.undo()
+
+        transition = core_loop._check_if_game_has_resumed(game_initialization, game, None)
+
+        self.assertEqual(transition.next, GameState.RUN_GAME)
+        self.assertEqual(transition.data, (game_initialization, game, None))
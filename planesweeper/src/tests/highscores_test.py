@@ -1,5 +1,5 @@
 import unittest
-import shutil, tempfile
+import shutil, tempfile, sqlite3
 from services.database_service import DatabaseService
 from repositories.highscore_repository import HighScoreRepository
 
@@ -22,6 +22,38 @@ class TestHighscores(unittest.TestCase):
         
         self.assertEqual(len(repository.get_single_highscores(1)), 1)
 
+    def test_single_highscore_keeps_3bv(self):
+        repository = HighScoreRepository(self._database_service)
+
+        repository.store_single_highscore(1, 5, "TST", 42)
+        repository.store_single_highscore(1, 6, "OLD")
+
+        scores = repository.get_single_highscores(1)
+
+        self.assertEqual(scores[0].bbbv, 42)
+        self.assertIsNone(scores[1].bbbv)
+
+    def test_database_without_3bv_column_is_migrated(self):
+        path = f"{self._test_dir}/TestMigration"
+        connection = sqlite3.connect(path)
+        connection.execute("CREATE TABLE single_highscores(level, time, initials);")
+        connection.execute("INSERT INTO single_highscores VALUES (1, 5, 'OLD');")
+        connection.commit()
+        connection.close()
+
+        database_service = DatabaseService(False, path)
+        repository = HighScoreRepository(database_service)
+        repository.store_single_highscore(1, 4, "NEW", 30)
+        database_service.close()
+
+        # migrated database is opened as it is
+        database_service = DatabaseService(False, path)
+        scores = HighScoreRepository(database_service).get_single_highscores(1)
+        database_service.close()
+
+        self.assertEqual([(score.initials, score.bbbv) for score in scores],
+                         [("NEW", 30), ("OLD", None)])
+
     def test_new_single_highscore_levels_not_mixed(self):
         repository = HighScoreRepository(self._database_service)
 
@@ -0,0 +1,87 @@
+import unittest
+from unittest import mock
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import Gameboard, GameboardConfiguration, BoardState
+from entities.board_solver import is_solvable_without_guessing
+from services.board_pool_service import BoardPoolService
+from services.no_guess_service import NoGuessService, find_solvable_seed
+
+
+class TestNoGuessService(unittest.TestCase):
+    def setUp(self):
+        self._service = NoGuessService(time_budget=20, workers=2)
+
+    def tearDown(self):
+        self._service.stop()
+
+    def _create_board(self, width: int, height: int, plane_indexes: list[int]) -> Gameboard:
+        game = Gameboard(GameboardConfiguration.CUSTOM_LEVEL, size=Size(width, height),
+                         planes=len(plane_indexes))
+        game.create()
+        game.get_cells().place_planes(plane_indexes)
+
+        return game
+
+    def test_board_needing_no_guess_is_solvable(self):
+        game = self._create_board(4, 1, [0])
+        game.open_piece(Position(3, 0))
+
+        self.assertTrue(is_solvable_without_guessing(game))
+        self.assertEqual(game.get_current_board_state(), BoardState.WON)
+
+    def test_board_needing_guess_is_not_solvable(self):
+        # one plane in any of three pieces around an opened 1
+        game = self._create_board(2, 2, [3])
+        game.open_piece(Position(0, 0))
+
+        self.assertFalse(is_solvable_without_guessing(game))
+        self.assertEqual(game.get_current_board_state(), BoardState.RUNNING)
+
+    def test_found_seed_gives_solvable_board(self):
+        configuration = GameboardConfiguration(2)
+        position = Position(4, 4)
+
+        seed = self._service.find_seed(configuration, position, True)
+
+        self.assertIsNotNone(seed)
+        self.assertEqual(find_solvable_seed(configuration, position, True, [seed]), seed)
+
+    def test_no_seed_is_found_without_time_budget(self):
+        service = NoGuessService(time_budget=0, workers=1)
+
+        self.assertIsNone(service.find_seed(GameboardConfiguration(2), Position(0, 0), True))
+        service.stop()
+
+    def test_pooled_boards_are_solvable_from_opened_start(self):
+        pool = BoardPoolService(1, seed_finder=self._service)
+        pool.prefill([2])
+        self.assertTrue(pool.wait_until_filled(20))
+        game = pool.get_gameboard(2)
+        pool.stop()
+
+        self.assertGreater(game.get_cells().counts.opened, 0)
+        self.assertEqual(game.get_elapsed_play_time(), 0.0)
+        self.assertTrue(is_solvable_without_guessing(game))
+
+    def test_levels_without_solvable_boards_are_not_searched(self):
+        finder = mock.Mock()
+        pool = BoardPoolService(1, seed_finder=finder)
+        pool.prefill([4])
+        self.assertTrue(pool.wait_until_filled(10))
+        game = pool.get_gameboard(4)
+        pool.stop()
+
+        finder.find_seed.assert_not_called()
+        self.assertEqual(game.get_cells().counts.opened, 0)
+
+    def test_board_is_not_searched_when_taken_from_empty_pool(self):
+        finder = mock.Mock()
+        finder.find_seed.return_value = None
+        pool = BoardPoolService(1, seed_finder=finder)
+        pool.stop()
+
+        game = pool.get_gameboard(2)
+
+        finder.find_seed.assert_not_called()
+        self.assertEqual(game.get_cells().counts.opened, 0)
@@ -0,0 +1,134 @@
+import unittest
+from unittest import mock
+from primitives.position import Position
+from primitives.size import Size
+from entities.board import GameboardConfiguration, BoardState
+from entities.board_cells import PLANE
+from entities.board_piece import PieceState
+from entities.practice_board import PracticeGameboard
+
+
+class TestPracticeGameboard(unittest.TestCase):
+    def _create_board(self, width: int, height: int, plane_indexes: list[int],
+                      undo_moves: int = 10) -> PracticeGameboard:
+        board = PracticeGameboard(GameboardConfiguration.CUSTOM_LEVEL,
+                                  size=Size(width, height), planes=len(plane_indexes),
+                                  debug=True, undo_moves=undo_moves)
+        board.create()
+        board.get_cells().place_planes(plane_indexes)
+
+        return board
+
+    def test_undo_closes_flood_filled_area_in_one_step(self):
+        board = self._create_board(30, 30, [0, 1, 30])
+        cells = board.get_cells()
+        board.open_piece(Position(29, 29))
+        opened = board.get_cells().counts.opened
+
+        self.assertGreaterEqual(opened, 800)
+
+        with mock.patch.object(type(cells), "close_many", autospec=True,
+                               side_effect=type(cells).close_many) as close_many:
+            self.assertTrue(board.undo())
+
+        close_many.assert_called_once()
+        self.assertEqual(len(close_many.call_args.args[1]), opened)
+        self.assertEqual(board.get_cells().counts.opened, 0)
+        self.assertEqual(cells.counts.closed_safe, 30 * 30 - 3)
+
+        self.assertTrue(board.redo())
+        self.assertEqual(board.get_cells().counts.opened, opened)
+        self.assertFalse(board.redo())
+
+    def test_undo_reverts_marks_and_lost_game(self):
+        board = self._create_board(3, 3, [0])
+        board.open_piece(Position(1, 1))
+        board.mark_piece(Position(2, 2))
+        board.mark_piece(Position(2, 2))
+        board.open_piece(Position(0, 0))
+
+        self.assertEqual(board.get_current_board_state(), BoardState.LOST)
+
+        self.assertTrue(board.undo())
+        self.assertEqual(board.get_current_board_state(), BoardState.RUNNING)
+        self.assertFalse(board.get_cells().is_open(0))
+
+        self.assertTrue(board.undo())
+        self.assertTrue(board.get_cells().is_marked(8))
+        self.assertTrue(board.undo())
+        self.assertFalse(board.get_cells().is_marked(8))
+
+        self.assertTrue(board.redo())
+        self.assertTrue(board.redo())
+        self.assertTrue(board.redo())
+        self.assertEqual(board.get_current_board_state(), BoardState.LOST)
+        self.assertEqual(board.get_cells().counts.opened, 2)
+
+    def test_new_move_discards_undone_moves(self):
+        board = self._create_board(3, 3, [0, 2, 6, 8])
+        board.open_piece(Position(1, 1))
+        board.undo()
+        board.open_piece(Position(1, 0))
+
+        self.assertFalse(board.redo())
+        self.assertTrue(board.get_cells().is_open(1))
+        self.assertFalse(board.get_cells().is_open(4))
+
+    def test_undo_is_limited_to_latest_moves(self):
+        board = self._create_board(3, 3, [0, 2, 6, 8], undo_moves=2)
+
+        for index in (1, 3, 4, 5):
+            board.open_piece(Position(index % 3, index // 3))
+
+        self.assertTrue(board.undo())
+        self.assertTrue(board.undo())
+        self.assertFalse(board.undo())
+        self.assertEqual(board.get_cells().counts.opened, 2)
+
+    def test_undo_is_published_to_subscribers(self):
+        board = self._create_board(3, 3, [0])
+        changes = []
+        board.get_changes().subscribe(changes.append)
+
+        board.mark_piece(Position(0, 0))
+        board.undo()
+        board.redo()
+
+        self.assertEqual([list(change) for change in changes],
+                         [[(0, PieceState.MARKED)], [(0, PieceState.CLOSED)],
+                          [(0, PieceState.MARKED)]])
+
+    def test_start_piece_is_not_a_move(self):
+        board = PracticeGameboard(3)
+        board.create(deferred=True, safe_area=True, seed=1, start=Position(7, 6))
+
+        self.assertGreater(board.get_cells().counts.opened, 0)
+        self.assertFalse(board.undo())
+
+    def test_planes_stay_in_place_after_first_open_is_undone(self):
+        board = PracticeGameboard(2, debug=True)
+        board.create(deferred=True, seed=3)
+        board.open_piece(Position(4, 4))
+        cells = board.get_cells()
+        planes = [index for index in range(len(cells)) if cells.types[index] == PLANE]
+
+        self.assertTrue(board.undo())
+        self.assertEqual(cells.counts.opened, 0)
+
+        board.open_piece(Position(planes[0] % 9, planes[0] // 9))
+
+        self.assertEqual(board.get_current_board_state(), BoardState.LOST)
+        self.assertEqual([index for index in range(len(cells)) if cells.types[index] == PLANE],
+                         planes)
+
+    def test_new_board_forgets_moves(self):
+        board = self._create_board(3, 3, [0])
+        board.open_piece(Position(1, 1))
+
+        board.create()
+
+        self.assertFalse(board.undo())
+        self.assertFalse(board.redo())
+
+    def test_undo_needs_at_least_one_move(self):
+        self.assertRaises(ValueError, PracticeGameboard, 1, undo_moves=0)
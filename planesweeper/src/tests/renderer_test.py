@@ -0,0 +1,222 @@
+import os
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pg.pygame_renderer import PygameRenderer
+from pg.sprite_atlas import SpriteAtlas
+from pg.text_cache import TextCache
+from entities.board_piece import BoardPiece
+from entities.board import Gameboard
+from entities.practice_board import PracticeGameboard
+from entities.ui.world_background import WorldBackground
+from entities.ui.board_layer import BoardLayer
+from entities.ui.text_overlay import TextOverlay
+from primitives.position import Position
+from primitives.size import Size
+from primitives.color import Color
+from primitives.text_object import TextObject
+
+
+class TestPygameRenderer(unittest.TestCase):
+    def _play_frames(self, renderer: PygameRenderer, layered: bool = False) -> list[bytes]:
+        game = PracticeGameboard(3, undo_moves=5)
+        game.create(deferred=True, safe_area=True, seed=5)
+        background = WorldBackground(renderer)
+        background.position_board_on_world(game)
+        overlay = TextOverlay("Overlay", 14, Position(5, 10), Color(255, 255, 255),
+                              Position(20, 100), Size(300, 40), Color(19, 146, 119, 0.5),
+                              None, renderer)
+        layer = BoardLayer(game)
+        frames = []
+
+        for frame in range(10):
+            if frame == 2:
+                game.open_piece(Position(7, 6))
+            elif frame in (3, 4):
+                game.mark_piece(Position(0, 0))
+            elif frame == 6:
+                game.undo()
+            elif frame == 8:
+                game.create(deferred=True, seed=7)
+            elif frame == 9:
+                game.change_position(Position(10, 20))
+
+            objects = [background]
+            objects.extend([layer.get_grid_layer(), layer] if layered
+                           else game.get_rendering_items())
+
+            if 4 <= frame <= 5:
+                objects.append(overlay)
+
+            if frame == 7:
+                renderer.set_lost_state()
+
+            renderer.compose(objects)
+            frames.append(pygame.image.tostring(pygame.display.get_surface(), "RGB"))
+
+        return frames
+
+    def test_dirty_rects_draw_same_frames_as_full_redraw(self):
+        full_frames = self._play_frames(PygameRenderer(dirty_rects=False))
+        frames = self._play_frames(PygameRenderer(dirty_rects=True))
+
+        for frame, full_frame in zip(frames, full_frames):
+            self.assertEqual(frame, full_frame)
+
+    def test_board_layer_draws_same_frames_as_board_items(self):
+        full_frames = self._play_frames(PygameRenderer(dirty_rects=False))
+        frames = self._play_frames(PygameRenderer(dirty_rects=True), True)
+
+        for frame, full_frame in zip(frames, full_frames):
+            self.assertEqual(frame, full_frame)
+
+    def test_unchanged_frame_updates_nothing(self):
+        renderer = PygameRenderer()
+        game = Gameboard(1)
+        game.create()
+
+        renderer.compose(list(game.get_rendering_items()))
+
+        with mock.patch.object(renderer, "_render_item") as render_item,\
+                mock.patch.object(pygame.display, "update") as update:
+            renderer.compose(list(game.get_rendering_items()))
+
+        render_item.assert_not_called()
+        update.assert_not_called()
+
+    def test_unchanged_text_is_rendered_once(self):
+        renderer = PygameRenderer()
+        overlay = TextOverlay("Overlay", 14, Position(5, 10), Color(255, 255, 255),
+                              Position(20, 100), Size(300, 40), Color(19, 146, 119, 0.5),
+                              None, renderer)
+
+        # font is looked up only for rendering a text not found in the cache
+        with mock.patch.object(renderer, "_get_font_for_text",
+                               wraps=getattr(renderer, "_get_font_for_text")) as get_font:
+            # overlay's text was rendered when it was measured for clipping
+            for _ in range(3):
+                renderer.compose([overlay])
+                renderer.measure_text_dimensions(TextObject("Other", None, 14,
+                                                            Color(255, 255, 255)))
+
+        get_font.assert_called_once_with(14)
+
+    def test_fonts_are_created_once_for_each_size(self):
+        renderer = PygameRenderer()
+        text = TextObject("Text", Position(0, 0), 33)
+
+        renderer.measure_text_dimensions(text)
+
+        with mock.patch.object(pygame.font, "Font") as font:
+            renderer.measure_text_dimensions(TextObject("Other text", Position(0, 0), 33))
+
+        font.assert_not_called()
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        self._cache = TextCache(2)
+        self._surfaces = [pygame.Surface((index + 1, 1)) for index in range(3)]
+
+    def test_hits_and_misses_are_counted(self):
+        self.assertIsNone(self._cache.get(("a", 11, None)))
+
+        self._cache.put(("a", 11, None), self._surfaces[0])
+
+        self.assertIs(self._cache.get(("a", 11, None)), self._surfaces[0])
+        self.assertIsNone(self._cache.get(("a", 12, None)))
+        self.assertEqual((self._cache.hits, self._cache.misses), (1, 2))
+
+    def test_least_recently_used_surface_is_dropped(self):
+        self._cache.put("a", self._surfaces[0])
+        self._cache.put("b", self._surfaces[1])
+        self._cache.get("a")
+        self._cache.put("c", self._surfaces[2])
+
+        self.assertEqual(len(self._cache), 2)
+        self.assertIs(self._cache.get("a"), self._surfaces[0])
+        self.assertIsNone(self._cache.get("b"))
+        self.assertIs(self._cache.get("c"), self._surfaces[2])
+
+class TestSpriteAtlas(unittest.TestCase):
+    def setUp(self):
+        PygameRenderer()
+        self._assets = [asset for asset in BoardPiece.get_asset_table(20) if asset is not None]
+        self._sprites = SpriteAtlas(self._assets + [None]).get_sprites()
+
+    def test_tiles_are_drawn_as_loaded(self):
+        for asset in self._assets:
+            expected = pygame.Surface((20, 20))
+            expected.fill((10, 80, 160))
+            expected.blit(pygame.image.load(asset.path), (0, 0))
+
+            drawn = pygame.Surface((20, 20))
+            drawn.fill((10, 80, 160))
+            surface, area = self._sprites[asset.key]
+            drawn.blit(surface, (0, 0), area)
+
+            self.assertEqual(pygame.image.tostring(drawn, "RGB"),
+                             pygame.image.tostring(expected, "RGB"), asset.key)
+
+    def test_opaque_tiles_are_packed_without_alpha(self):
+        for asset in self._assets:
+            surface, _ = self._sprites[asset.key]
+            alpha = bool(pygame.image.load(asset.path).get_flags() & pygame.SRCALPHA)
+
+            self.assertEqual(bool(surface.get_flags() & pygame.SRCALPHA), alpha, asset.key)
+
+class TestBoardLayer(unittest.TestCase):
+    def setUp(self):
+        self._game = Gameboard(1)
+        self._game.create()
+        self._game.change_position(Position(100, 50))
+        self._layer = BoardLayer(self._game)
+
+    def tearDown(self):
+        self._layer.close()
+
+    def test_changed_pieces_are_reported_once(self):
+        self._game.mark_piece(Position(2, 1))
+        self._game.mark_piece(Position(2, 1))
+
+        areas = self._layer.pop_changed_areas()
+
+        self.assertEqual([(position.x, position.y) for position, _ in areas], [(150, 75)])
+        self.assertEqual(areas[0][1], self._game.get_piece_dimensions())
+        self.assertEqual(self._layer.pop_changed_areas(), [])
+
+    def test_key_changes_when_board_is_created_or_moved(self):
+        key = self._layer.get_layer_key()
+
+        self.assertEqual(self._layer.get_layer_key(), key)
+
+        self._game.create()
+        created_key = self._layer.get_layer_key()
+
+        self.assertNotEqual(created_key, key)
+
+        self._game.change_position(Position(0, 0))
+
+        self.assertNotEqual(self._layer.get_layer_key(), created_key)
+
+    def test_closed_layer_does_not_follow_board(self):
+        self._layer.close()
+        self._game.mark_piece(Position(0, 0))
+
+        self.assertEqual(self._layer.pop_changed_areas(), [])
+        self._layer = BoardLayer(self._game)
+
+    def test_grid_key_changes_only_when_board_is_moved(self):
+        grid = self._layer.get_grid_layer()
+        key = grid.get_layer_key()
+
+        self._game.create()
+        self._game.mark_piece(Position(0, 0))
+
+        self.assertEqual(grid.get_layer_key(), key)
+
+        self._game.change_position(Position(0, 0))
+
+        self.assertNotEqual(grid.get_layer_key(), key)
@@ -0,0 +1,282 @@
+import unittest
+import random
+from collections import deque
+from primitives.position import Position
+from entities.board_cells import BoardCells, EMPTY, NUMBER, PLANE
+from entities.reveal_engine import RevealEngine
+from entities.bitboard_cells import BitboardCells
+from entities.chunked_board_cells import ChunkedBoardCells
+from entities.empty_regions import EmptyRegions
+
+
+class LegacyVisitedStackItem:
+    def __init__(self, position: Position, neighbours: list[Position],
+                 item_processed: bool = False,
+                 is_empty: bool = False):
+        self.position: Position = position
+        self.neighbours: list[Position] = neighbours
+        self.index: int = 0
+        self.item_processed: bool = item_processed
+        self.is_empty: bool = is_empty
+
+class LegacyReveal:
+    """Stack based flood fill which Gameboard used before RevealEngine, kept here
+        as the reference implementation.
+    """
+    def __init__(self, cells: BoardCells):
+        self._cells = cells
+
+    def _get_neighbouring_positions(self, position: Position,
+                                    exclude: set[Position] = None) -> list[Position]:
+        positions = []
+
+        for x_pos,y_pos in [(position.x, position.y-1),
+                            (position.x+1, position.y-1),
+                            (position.x+1, position.y),
+                            (position.x+1, position.y+1),
+                            (position.x, position.y+1),
+                            (position.x-1, position.y+1),
+                            (position.x-1, position.y),
+                            (position.x-1, position.y-1)
+                            ]:
+            if x_pos < 0 or x_pos > self._cells.width-1 or \
+                y_pos < 0 or y_pos > self._cells.height-1:
+                continue
+
+            new_pos = Position(x_pos, y_pos)
+
+            if exclude is not None and new_pos in exclude:
+                continue
+
+            positions.append(new_pos)
+
+        return positions
+
+    def _open_adjacent_piece(self, item: LegacyVisitedStackItem):
+        item.item_processed = True
+
+        index = item.position.y * self._cells.width + item.position.x
+
+        if not self._cells.is_open(index) and not self._cells.is_marked(index):
+            piece_type = self._cells.types[index]
+
+            if piece_type in (EMPTY, NUMBER):
+                self._cells.open(index)
+
+            if piece_type == EMPTY:
+                item.is_empty = True
+
+    def open_adjacent_pieces(self, position: Position):
+        visited = set()
+        item = LegacyVisitedStackItem(position, self._get_neighbouring_positions(position),
+                                item_processed = True, is_empty = True)
+        visit_stack = deque()
+        visit_stack.append(item)
+
+        while len(visit_stack) > 0:
+            item = visit_stack.pop()
+
+            visited.add(item.position)
+
+            if not item.item_processed:
+                self._open_adjacent_piece(item)
+
+            item.index += 1
+
+            if item.index <= len(item.neighbours):
+                visit_stack.append(item)
+
+                if not item.is_empty:
+                    continue
+
+                next_position = item.neighbours[item.index-1]
+                item = LegacyVisitedStackItem(next_position,
+                                        self._get_neighbouring_positions(next_position, visited))
+                visit_stack.append(item)
+
+class TestRevealEngine(unittest.TestCase):
+    def setUp(self):
+        self._random = random.Random(1234)
+
+    def _create_cells_pair(self, width: int, height: int, planes: int,
+                           cells_type: type = BoardCells) -> tuple[BoardCells, BoardCells]:
+        plane_indexes = self._random.sample(range(width * height), planes)
+        marked_indexes = self._random.sample(range(width * height), planes // 3)
+        opened_indexes = self._random.sample(range(width * height), planes // 3)
+
+        pair = (BoardCells(width, height), cells_type(width, height))
+
+        for cells in pair:
+            cells.place_planes(plane_indexes)
+
+            for index in marked_indexes:
+                cells.mark(index)
+
+            for index in opened_indexes:
+                if cells.types[index] == NUMBER:
+                    cells.open(index)
+
+        return pair
+
+    def test_reveal_opens_same_cells_as_legacy_flood_fill(self):
+        sizes = [(5, 5, 3), (9, 9, 10), (15, 12, 20), (30, 16, 40), (58, 29, 120),
+                 (1, 20, 2), (40, 3, 6)]
+
+        for _ in range(25):
+            for width, height, planes in sizes:
+                legacy_cells, cells = self._create_cells_pair(width, height, planes)
+
+                starts = [index for index in range(width * height)
+                          if cells.types[index] == EMPTY and
+                          not cells.is_open(index) and not cells.is_marked(index)]
+
+                if len(starts) == 0:
+                    continue
+
+                start = self._random.choice(starts)
+
+                opened_before = bytes(cells.opened)
+
+                legacy_cells.open(start)
+                LegacyReveal(legacy_cells).open_adjacent_pieces(
+                    Position(start % width, start // width))
+
+                revealed = RevealEngine(cells).reveal(start)
+
+                self.assertEqual(cells.opened, legacy_cells.opened)
+                self.assertEqual(cells.counts.opened, legacy_cells.counts.opened)
+
+                newly_opened = [index for index in range(width * height)
+                                if cells.opened[index] and not opened_before[index]]
+
+                self.assertEqual(sorted(revealed), newly_opened)
+                self.assertEqual(revealed[0], start)
+
+    def test_bitboard_reveal_opens_same_cells_as_reveal_engine(self):
+        sizes = [(5, 5, 3), (9, 9, 10), (15, 12, 20), (30, 16, 40), (58, 29, 120),
+                 (1, 20, 2), (40, 3, 6), (64, 2, 4)]
+
+        for _ in range(25):
+            for width, height, planes in sizes:
+                cells, bitboard = self._create_cells_pair(width, height, planes,
+                                                          BitboardCells)
+
+                starts = [index for index in range(width * height)
+                          if not cells.is_open(index) and not cells.is_marked(index)]
+                start = self._random.choice(starts)
+
+                revealed = RevealEngine(cells).reveal(start)
+
+                self.assertEqual(bitboard.reveal(start), revealed[:1] + sorted(revealed[1:]))
+                self.assertEqual(list(bitboard.opened), list(cells.opened))
+                self.assertEqual(bitboard.counts.opened, cells.counts.opened)
+                self.assertEqual(bitboard.counts.closed_safe, cells.counts.closed_safe)
+                bitboard.verify_counters()
+
+    def test_reveal_number_opens_only_itself(self):
+        cells = BoardCells(5, 5)
+        cells.place_planes([0])
+
+        self.assertEqual(RevealEngine(cells).reveal(1), [1])
+        self.assertEqual(cells.counts.opened, 1)
+
+    def test_reveal_does_not_open_planes_marked_or_opened(self):
+        cells = BoardCells(5, 5)
+        cells.place_planes([0])
+        cells.mark(24)
+
+        engine = RevealEngine(cells)
+
+        self.assertEqual(engine.reveal(0), [])
+        self.assertEqual(engine.reveal(24), [])
+
+        revealed = engine.reveal(12)
+
+        self.assertEqual(len(revealed), 23)
+        self.assertNotIn(0, revealed)
+        self.assertNotIn(24, revealed)
+        self.assertEqual(engine.reveal(12), [])
+        self.assertEqual(cells.types[0], PLANE)
+
+    def test_region_reveal_opens_same_cells_as_reveal_engine(self):
+        sizes = [(5, 5, 3), (9, 9, 10), (15, 12, 20), (30, 16, 40), (58, 29, 120),
+                 (1, 20, 2), (40, 3, 6), (64, 2, 4)]
+
+        for _ in range(25):
+            for width, height, planes in sizes:
+                searched, cells = self._create_cells_pair(width, height, planes)
+
+                starts = [index for index in range(width * height)
+                          if not cells.is_open(index) and not cells.is_marked(index)]
+                starts = self._random.sample(starts, min(3, len(starts)))
+
+                revealed = RevealEngine(searched).reveal_many(starts)
+
+                self.assertEqual(sorted(cells.reveal_many(starts)), sorted(revealed))
+                self.assertEqual(cells.opened, searched.opened)
+                self.assertEqual(cells.counts.closed_safe, searched.counts.closed_safe)
+                cells.verify_counters()
+
+    def test_chunked_reveal_opens_same_cells_as_reveal_engine(self):
+        sizes = [(5, 5, 3), (58, 29, 120), (1, 20, 2), (40, 3, 6), (300, 40, 200),
+                 (130, 130, 900)]
+
+        for _ in range(10):
+            for width, height, planes in sizes:
+                searched, cells = self._create_cells_pair(width, height, planes,
+                                                          ChunkedBoardCells)
+
+                starts = [index for index in range(width * height)
+                          if not cells.is_open(index) and not cells.is_marked(index)]
+
+                for start in self._random.sample(starts, min(3, len(starts))):
+                    revealed = RevealEngine(searched).reveal(start)
+
+                    self.assertEqual(cells.reveal(start), revealed[:1] + sorted(revealed[1:]))
+                    self.assertEqual(list(cells.opened), list(searched.opened))
+                    self.assertEqual(cells.counts.closed_safe, searched.counts.closed_safe)
+
+                cells.verify_counters()
+
+    def test_region_reveal_starts_with_opened_cell(self):
+        cells = BoardCells(5, 5)
+        cells.place_planes([0])
+
+        revealed = cells.reveal(12)
+
+        self.assertEqual(revealed[0], 12)
+        self.assertEqual(len(revealed), 24)
+        self.assertEqual(cells.reveal(12), [])
+
+    def test_empty_regions_are_labelled_with_bordering_cells(self):
+        cells = BoardCells(7, 3)
+        # column of planes splits the board into two empty areas
+        cells.place_planes([3, 10, 17])
+
+        regions = EmptyRegions(cells.types, cells.width, cells.height)
+
+        self.assertEqual(len(regions), 2)
+        self.assertEqual(regions.labels[0], regions.labels[14])
+        self.assertNotEqual(regions.labels[0], regions.labels[6])
+        self.assertEqual(regions.labels[2], 0)
+        self.assertEqual(sorted(regions.get_cells(regions.labels[0])),
+                         [0, 1, 2, 7, 8, 9, 14, 15, 16])
+
+    def test_3bv_counts_regions_and_numbers_outside_them(self):
+        cells = BoardCells(7, 3)
+        cells.place_planes([3, 10, 17])
+
+        self.assertEqual(cells.get_3bv(), 2)
+
+        cells = BoardCells(3, 1)
+        cells.place_planes([1])
+
+        # both numbers need a click of their own
+        self.assertEqual(cells.get_3bv(), 2)
+
+    def test_3bv_is_same_for_all_cell_storages(self):
+        for width, height, planes in [(9, 9, 10), (30, 16, 99), (40, 3, 6), (300, 40, 200)]:
+            for cells_type in (BitboardCells, ChunkedBoardCells):
+                cells, other = self._create_cells_pair(width, height, planes, cells_type)
+
+                self.assertEqual(other.get_3bv(), cells.get_3bv())
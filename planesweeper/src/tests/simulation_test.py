@@ -0,0 +1,70 @@
+import unittest
+import csv
+import os
+import tempfile
+from entities.board import Gameboard, BoardState
+from entities.bots import BotStrategy, BotMove, RandomBot, SolverBot
+from services.simulation_service import SimulationService, play_games, RESULT_FIELDS
+
+
+class TestSimulationService(unittest.TestCase):
+    def setUp(self):
+        handle, self._path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self._path)
+
+    def test_solver_bot_wins_first_level_games(self):
+        results = play_games(1, SolverBot(), list(range(20)))
+
+        self.assertEqual(len(results), 20)
+        self.assertGreater(sum(won for _, _, won, _, _ in results), 10)
+        self.assertTrue(all(clicks > 0 for _, _, _, clicks, _ in results))
+
+    def test_games_are_repeated_with_same_seeds(self):
+        for strategy in (RandomBot(), SolverBot()):
+            first = [result[:4] for result in play_games(3, strategy, [1, 2, 3])]
+            second = [result[:4] for result in play_games(3, strategy, [1, 2, 3])]
+
+            self.assertEqual(first, second)
+
+    def test_bot_giving_up_ends_game(self):
+        self.assertEqual(play_games(2, BotStrategy(), [5])[0][:4], (2, 5, False, 0))
+
+    def test_probabilities_bot_plays_games_to_the_end(self):
+        strategy = SolverBot(probabilities=True)
+
+        for level, seed, _, _, _ in play_games(2, strategy, [7, 8]):
+            game = Gameboard(level)
+            game.create(deferred=True, safe_area=True, seed=seed)
+            strategy.start(game, seed)
+
+            while game.get_current_board_state() == BoardState.RUNNING:
+                move = strategy.next_move(game)
+
+                self.assertIsNotNone(move)
+
+                if move[0] == BotMove.MARK:
+                    game.mark_piece(move[1])
+                else:
+                    game.open_piece(move[1])
+
+    def test_results_are_written_for_every_game(self):
+        service = SimulationService(SolverBot(), workers=2)
+        service_games = SimulationService.GAMES_PER_TASK + 5
+
+        summary = service.run([1, 2], service_games, self._path, seed=3)
+
+        with open(self._path, newline="", encoding="utf-8") as results_file:
+            rows = list(csv.DictReader(results_file))
+
+        self.assertEqual(tuple(rows[0].keys()), RESULT_FIELDS)
+        self.assertEqual(len(rows), 2 * service_games)
+        self.assertEqual(summary[1][0], service_games)
+        self.assertEqual(summary[2][1], sum(row["won"] == "True" for row in rows
+                                            if row["level"] == "2"))
+
+    def test_invalid_level_is_not_simulated(self):
+        self.assertRaises(ValueError, SimulationService(RandomBot(), workers=1).run,
+                          [7], 1, self._path)
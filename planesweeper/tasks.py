@@ -9,9 +9,11 @@ def reset(ctx):
     ctx.run("python3 src/game.py reset", pty=True)
 
 @task
-def configure(ctx, setlang='', apikey=''):
+def configure(ctx, setlang='', apikey='', noguess=''):
     if setlang:
         ctx.run(f"python3 src/game.py --setlang={setlang}", pty=True)
+    elif noguess:
+        ctx.run(f"python3 src/game.py --noguess={noguess}", pty=True)
     else:
         ctx.run("python3 src/game.py --?", pty=True)
 
@@ -19,6 +21,27 @@ def configure(ctx, setlang='', apikey=''):
 def test(ctx):
     ctx.run("pytest src", pty=True)
 
+@task
+def bench(ctx, baseline='', output='board_operations.json'):
+    compared = f" --baseline={baseline}" if baseline else ""
+    ctx.run(f"cd src && python3 -m benchmarks.board_operations --output={output}{compared}",
+            pty=True)
+    ctx.run("cd src && python3 -m benchmarks.board_create", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.board_scaling", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.chunked_reveal", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.board_pieces", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.bitboard", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.board_serialization", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.board_solver", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.board_probabilities", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.no_guess", pty=True)
+    ctx.run("cd src && python3 -m benchmarks.renderer", pty=True)
+
+@task
+def simulate(ctx, levels='3', games=1000, bot='solver', output='simulation.csv'):
+    ctx.run(f"cd src && python3 simulate.py --levels {levels.replace(',', ' ')} "
+            f"--games={games} --bot={bot} --output={output}", pty=True)
+
 @task
 def coverage(ctx):
     ctx.run("coverage run --branch -m pytest src", pty=True)